@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measures the time Airflow needs to import the DAGs converted from the examples and from large
+synthetic workflows, so that the changes of the templates can be evaluated for the cost of parsing
+the generated DAGs by the scheduler. Usage:
+
+    python -m benchmarks.dag_import_time [-e EXAMPLE ...] [-n ACTIONS ...] [-r RUNS] [-m]
+
+The configuration of the examples has to be prepared first with bin/run-all-configurations.
+Each conversion output is loaded with DagBag in a new Python process, as it is by the scheduler.
+The first load compiles the DAG files, the next ones use the cached bytecode. The report shows
+the number of the DAGs and the operators, and the number of the modules imported by the DAG files
+in addition to the modules imported by Airflow itself.
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import tempfile
+from typing import List
+
+from benchmarks.dagbag_load_time import convert, create_workflow_app, load_dag
+from o2a.converter.constants import HDFS_FOLDER
+from o2a.converter.mappers import ACTION_MAP, CONTROL_MAP
+from o2a.converter.oozie_converter import OozieConverter
+from o2a.definitions import EXAMPLES_PATH
+
+
+def get_examples() -> List[str]:
+    return sorted(
+        name
+        for name in os.listdir(EXAMPLES_PATH)
+        if os.path.isdir(os.path.join(EXAMPLES_PATH, name, HDFS_FOLDER))
+    )
+
+
+def convert_example(name: str, output_path: str):
+    converter = OozieConverter(
+        dag_name=name,
+        input_directory_path=os.path.join(EXAMPLES_PATH, name),
+        output_directory_path=output_path,
+        action_mapper=ACTION_MAP,
+        control_mapper=CONTROL_MAP,
+        user="benchmark",
+        start_days_ago=0,
+        format_output=False,
+    )
+    converter.recreate_output_directory()
+    converter.convert()
+
+
+def print_results(name: str, results: List[dict], show_modules: bool):
+    if results[0]["errors"]:
+        # The last line of the traceback is the error
+        print(f"{name:<16} failed: {results[0]['errors'][0].strip().splitlines()[-1]}")
+        return
+    durations = [result["duration"] for result in results]
+    rest = durations[1:] or durations
+    modules = results[0]["modules"]
+    print(
+        f"{name:<16} {results[0]['dags']:>5} {results[0]['tasks']:>9} {len(modules):>8} "
+        f"{durations[0]:9.3f}s {statistics.median(rest):9.3f}s"
+    )
+    if show_modules:
+        for module in modules:
+            print(f"    {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "-e", "--examples", nargs="*", help="Names of the examples to load [default: all the examples]"
+    )
+    parser.add_argument(
+        "-n",
+        "--actions",
+        type=int,
+        nargs="*",
+        default=[1000, 5000],
+        help="Numbers of the shell actions of the synthetic workflows [default: 1000 5000]",
+    )
+    parser.add_argument("-r", "--runs", type=int, default=3, help="Number of loads of each DAG")
+    parser.add_argument(
+        "-m", "--show-modules", action="store_true", help="Print the modules imported by the DAG files"
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    work_dir = tempfile.mkdtemp(prefix="o2a-dag-import-benchmark")
+    try:
+        print(f"{'':<16} {'DAGs':>5} {'operators':>9} {'modules':>8} {'first':>10} {'median':>10}")
+        for name in get_examples() if args.examples is None else args.examples:
+            output_path = os.path.join(work_dir, name)
+            convert_example(name, output_path)
+            print_results(name, [load_dag(output_path) for _ in range(args.runs)], args.show_modules)
+        for actions in args.actions:
+            app_path = os.path.join(work_dir, f"app_{actions}")
+            create_workflow_app(app_path, actions, branches=10)
+            dag_file = convert(app_path, os.path.join(work_dir, f"synthetic_{actions}"), shard_size=None)
+            results = [load_dag(dag_file) for _ in range(args.runs)]
+            print_results(f"{actions} actions", results, args.show_modules)
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    main()
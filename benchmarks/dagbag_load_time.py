@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares the time Airflow needs to load the DAG of a large synthetic workflow written to a single
+DAG file and split between the modules imported by the DAG file (--shard-size). Usage:
+
+    python -m benchmarks.dagbag_load_time [-n ACTIONS] [-b BRANCHES] [-s SHARD_SIZE] [-r RUNS]
+
+The workflow consists of BRANCHES parallel chains of shell actions between a fork and a join.
+Each load runs in a new Python process, as it does in the scheduler, so the modules imported
+by the DAG file are loaded again, but from the bytecode cached by the first load.
+The DAG files are not formatted, which does not change the time of loading them.
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import List, Optional
+from xml.etree import ElementTree as ET
+
+from o2a.converter.mappers import ACTION_MAP, CONTROL_MAP
+from o2a.converter.oozie_converter import OozieConverter
+
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The modules imported by Airflow itself are loaded before the measurement, so that only
+# the modules imported by the DAG files are reported
+LOAD_DAG_SCRIPT = """
+import json
+import sys
+import time
+
+from airflow.models import DagBag
+
+modules = set(sys.modules)
+start = time.perf_counter()
+dag_bag = DagBag(dag_folder=sys.argv[1], include_examples=False)
+duration = time.perf_counter() - start
+print(json.dumps(dict(
+    duration=duration,
+    dags=len(dag_bag.dags),
+    tasks=sum(len(dag.tasks) for dag in dag_bag.dags.values()),
+    modules=sorted(set(sys.modules) - modules),
+    errors=[str(error) for error in dag_bag.import_errors.values()],
+)))
+"""
+
+
+def create_workflow_app(app_path: str, actions: int, branches: int):
+    """
+    Writes the workflow.xml of the application with the actions split evenly between the branches.
+    """
+    app = ET.Element("workflow-app", xmlns="uri:oozie:workflow:1.0", name="benchmark-wf")
+    ET.SubElement(app, "start", to="fork")
+    fork = ET.SubElement(app, "fork", name="fork")
+    for branch in range(branches):
+        branch_actions = [f"action-{i}" for i in range(branch, actions, branches)]
+        ET.SubElement(fork, "path", start=branch_actions[0])
+        for name, next_name in zip(branch_actions, branch_actions[1:] + ["join"]):
+            action = ET.SubElement(app, "action", name=name)
+            shell = ET.SubElement(action, "shell", xmlns="uri:oozie:shell-action:1.0")
+            ET.SubElement(shell, "resource-manager").text = "${resourceManager}"
+            ET.SubElement(shell, "name-node").text = "${nameNode}"
+            ET.SubElement(shell, "exec").text = "echo"
+            ET.SubElement(shell, "argument").text = name
+            ET.SubElement(action, "ok", to=next_name)
+            ET.SubElement(action, "error", to="fail")
+    ET.SubElement(app, "join", name="join", to="end")
+    ET.SubElement(ET.SubElement(app, "kill", name="fail"), "message").text = "Action failed"
+    ET.SubElement(app, "end", name="end")
+    os.makedirs(os.path.join(app_path, "hdfs"))
+    ET.ElementTree(app).write(os.path.join(app_path, "hdfs", "workflow.xml"))
+    with open(os.path.join(app_path, "job.properties"), "w") as file:
+        file.write("nameNode=hdfs://\nresourceManager=localhost:8032\n")
+    with open(os.path.join(app_path, "configuration.properties"), "w") as file:
+        file.write("dataproc_cluster=benchmark\ngcp_region=local\n")
+
+
+def convert(app_path: str, output_path: str, shard_size: Optional[int]) -> str:
+    converter = OozieConverter(
+        dag_name="benchmark",
+        input_directory_path=app_path,
+        output_directory_path=output_path,
+        action_mapper=ACTION_MAP,
+        control_mapper=CONTROL_MAP,
+        user="benchmark",
+        start_days_ago=0,
+        format_output=False,
+        shard_size=shard_size,
+    )
+    converter.recreate_output_directory()
+    converter.convert()
+    return converter.output_dag_name
+
+
+def load_dag(dag_file: str) -> dict:
+    """
+    Loads the DAGs from the file, or from all the files in the directory, in a new Python process
+    and returns the time of the load, the number of the DAGs and the tasks, and the imported modules.
+    """
+    dag_folder = dag_file if os.path.isdir(dag_file) else os.path.dirname(dag_file)
+    env = dict(
+        os.environ,
+        AIRFLOW__CORE__DAGS_FOLDER=dag_folder,
+        AIRFLOW__CORE__LOAD_EXAMPLES="False",
+        PYTHONPATH=os.pathsep.join([PROJECT_PATH, os.environ.get("PYTHONPATH", "")]),
+    )
+    process = subprocess.run(
+        [sys.executable, "-c", LOAD_DAG_SCRIPT, dag_file],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    if process.returncode:
+        print(process.stderr.decode(errors="replace"), file=sys.stderr)
+        process.check_returncode()
+    return json.loads(process.stdout.decode().splitlines()[-1])
+
+
+def print_results(name: str, tasks: int, durations: List[float]):
+    # The first load compiles the modules, the next ones use the cached bytecode
+    first = durations[0]
+    rest = durations[1:] or durations
+    print(
+        f"{name:<12} tasks: {tasks:>6}  first: {first:8.3f}s  "
+        f"median: {statistics.median(rest):8.3f}s  min: {min(rest):8.3f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("-n", "--actions", type=int, default=5000, help="Number of shell actions")
+    parser.add_argument("-b", "--branches", type=int, default=10, help="Number of parallel branches")
+    parser.add_argument("-s", "--shard-size", type=int, default=500, help="Number of tasks in a module")
+    parser.add_argument("-r", "--runs", type=int, default=5, help="Number of loads of each DAG")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    work_dir = tempfile.mkdtemp(prefix="o2a-dagbag-benchmark")
+    try:
+        app_path = os.path.join(work_dir, "app")
+        create_workflow_app(app_path, args.actions, min(args.branches, args.actions))
+        for name, shard_size in (("single file", None), ("sharded", args.shard_size)):
+            dag_file = convert(app_path, os.path.join(work_dir, name.replace(" ", "_")), shard_size)
+            results = [load_dag(dag_file) for _ in range(args.runs)]
+            if results[0]["errors"]:
+                print(f"{name:<12} failed: {results[0]['errors'][0]}")
+                continue
+            print_results(name, results[0]["tasks"], [result["duration"] for result in results])
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Reports the memory used by the converter data model (ParsedNode, Task, Relation and Workflow)
+of a large synthetic workflow, in bytes per node. Usage:
+
+    python -m benchmarks.data_model_memory [-n NODES]
+
+The size is the sum of the sizes of all the objects reachable from the workflow, each object
+counted once, so the strings shared between the tasks and the relations are not double counted.
+The mappers are not included, as they are the same for any data model.
+"""
+
+import argparse
+import sys
+from typing import Any, Set
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.base_mapper import BaseMapper
+
+
+def build_workflow(nodes: int) -> Workflow:
+    """
+    Builds a workflow of the chain of actions, each converted to a prepare task and an action task.
+    The task ids are built separately for each reference, as they are by the parser and the mappers.
+    """
+    workflow = Workflow(input_directory_path="/input", output_directory_path="/output", dag_name="benchmark")
+    mapper = BaseMapper(oozie_node=None, name="benchmark")
+    for i in range(nodes):
+        p_node = ParsedNode(
+            mapper,
+            tasks=[
+                Task(
+                    task_id=f"action_{i}_prepare", template_name="prepare.tpl", trigger_rule=TriggerRule.DUMMY
+                ),
+                Task(task_id=f"action_{i}", template_name="shell.tpl", trigger_rule=TriggerRule.ALL_SUCCESS),
+            ],
+            relations=[Relation(from_task_id=f"action_{i}_prepare", to_task_id=f"action_{i}")],
+        )
+        p_node.add_downstream_node_name(f"action_{i + 1}")
+        p_node.set_error_node_name("fail")
+        p_node.set_is_ok(True)
+        workflow.nodes[f"action_{i}"] = p_node
+        workflow.relations.add(Relation(from_task_id=f"action_{i}", to_task_id=f"action_{i + 1}_prepare"))
+    return workflow
+
+
+def get_deep_size(root: Any) -> int:
+    """
+    Returns the total size of the objects reachable from the root, skipping the mappers.
+    """
+    seen: Set[int] = set()
+    size = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (BaseMapper, type)):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        if hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+        for cls in type(obj).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if hasattr(obj, slot):
+                    stack.append(getattr(obj, slot))
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("-n", "--nodes", type=int, default=100_000, help="Number of action nodes")
+    args = parser.parse_args()
+
+    workflow = build_workflow(args.nodes)
+    size = get_deep_size(workflow)
+    print(f"nodes: {args.nodes}  total: {size / 2 ** 20:.1f} MiB  per node: {size / args.nodes:.0f} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measures the time of a call of each basic EL function, which the generated DAGs call while
+rendering each task instance. Usage:
+
+    python -m benchmarks.el_functions [-n NUMBER]
+
+The replace_all function is measured also with the compiled patterns cache cleared before each call,
+which is the cost of translating and compiling the Java pattern.
+"""
+
+import argparse
+import inspect
+import timeit
+from typing import Callable, Dict, Tuple
+
+from o2a.o2a_libs import el_basic_functions
+
+ARGUMENTS: Dict[str, Tuple] = {
+    "first_not_null": ("", "value"),
+    "concat": ("/user/", "oozie"),
+    "translate_java_regex": (r"(?<year>\d{4})-\p{Digit}{2}\Q.\E",),
+    "translate_java_replacement": (r"${year}\$$1", 1),
+    "replace_all": ("2019-05-22.log", r"(?<year>\d{4})-\p{Digit}{2}\Q.\E", r"${year}\$"),
+    "append_all": ("/a/b/,/c/b/,/c/d/", "ADD", ","),
+    "trim": ("  value \t",),
+    "url_encode": ("a value?with=chars&",),
+    "timestamp": (),
+    "to_json_str": ({"key": ["value", 1, None]},),
+}
+
+
+def get_functions() -> Dict[str, Callable]:
+    return {
+        name: function
+        for name, function in inspect.getmembers(el_basic_functions, inspect.isfunction)
+        if function.__module__ == el_basic_functions.__name__ and not name.startswith("_")
+    }
+
+
+def measure(function: Callable, arguments: Tuple, number: int, setup: Callable = None) -> float:
+    """
+    Returns the median time of a call in microseconds.
+    """
+
+    def call():
+        if setup:
+            setup()
+        function(*arguments)
+
+    times = timeit.repeat(call, number=number, repeat=5)
+    return sorted(times)[len(times) // 2] / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("-n", "--number", type=int, default=10000, help="Number of calls of each function")
+    args = parser.parse_args()
+
+    functions = get_functions()
+    missing = sorted(set(functions) - set(ARGUMENTS))
+    if missing:
+        parser.error(f"No arguments for the functions: {', '.join(missing)}")
+    for name, function in functions.items():
+        print(f"{name:<32} {measure(function, ARGUMENTS[name], args.number):10.2f}us")
+    uncached = measure(
+        el_basic_functions.replace_all,
+        ARGUMENTS["replace_all"],
+        args.number,
+        setup=el_basic_functions._compile_java_regex.cache_clear,  # pylint: disable=protected-access
+    )
+    print(f"{'replace_all (not cached)':<32} {uncached:10.2f}us")
+
+
+if __name__ == "__main__":
+    main()
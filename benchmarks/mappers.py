@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measures the time each mapper needs to convert a node: creating the mapper, on_parse_node,
+to_tasks_and_relations and rendering the tasks. Usage:
+
+    python -m benchmarks.mappers [-m MAPPER ...] [-s SIZE] [-n NUMBER] [-t MAX_TIME]
+
+Each mapper converts a typical node and a worst-case node with SIZE of each of the repeated elements:
+arguments, files, archives, configuration properties, prepare steps, file system operations or cases.
+The sub-workflow mapper converts the childwf example, its configuration has to be prepared first
+with bin/run-all-configurations. The times are medians of the conversions of a node in microseconds.
+"""
+
+import argparse
+import logging
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, NamedTuple
+from xml.etree import ElementTree as ET
+
+from o2a.converter.mappers import ACTION_MAP, CONTROL_MAP
+from o2a.mappers.base_mapper import BaseMapper
+from o2a.mappers.decision_mapper import DecisionMapper
+from o2a.mappers.fs_mapper import FsMapper
+from o2a.mappers.git_mapper import GitMapper
+from o2a.mappers.mapreduce_mapper import MapReduceMapper
+from o2a.mappers.pig_mapper import PigMapper
+from o2a.mappers.shell_mapper import ShellMapper
+from o2a.mappers.spark_mapper import SparkMapper
+from o2a.mappers.ssh_mapper import SSHMapper
+from o2a.mappers.subworkflow_mapper import SubworkflowMapper
+
+TYPICAL_SIZE = 2
+
+PARAMS = {
+    "nameNode": "hdfs://",
+    "resourceManager": "localhost:8032",
+    "queueName": "default",
+    "examplesRoot": "examples",
+    "userName": "benchmark",
+    "user.name": "benchmark",
+    "dataproc_cluster": "benchmark",
+    "gcp_region": "europe-west1",
+}
+
+PHASES = ["create", "on_parse_node", "to_tasks_and_relations", "render"]
+
+
+def add_text_elements(parent: ET.Element, tag: str, texts: List[str]):
+    for text in texts:
+        ET.SubElement(parent, tag).text = text
+
+
+def add_prepare(parent: ET.Element, size: int):
+    prepare = ET.SubElement(parent, "prepare")
+    for i in range(size):
+        ET.SubElement(prepare, "delete", path=f"${{nameNode}}/examples/output-data/{i}")
+        ET.SubElement(prepare, "mkdir", path=f"${{nameNode}}/examples/input-data/{i}")
+
+
+def add_configuration(parent: ET.Element, size: int, properties: Dict[str, str] = None):
+    configuration = ET.SubElement(parent, "configuration")
+    all_properties = {f"mapred.property.{i}": "${queueName}" for i in range(size)}
+    all_properties.update(properties or {})
+    for name, value in all_properties.items():
+        configuration_property = ET.SubElement(configuration, "property")
+        ET.SubElement(configuration_property, "name").text = name
+        ET.SubElement(configuration_property, "value").text = value
+
+
+def add_files_and_archives(parent: ET.Element, size: int):
+    add_text_elements(
+        parent, "file", [f"/user/${{userName}}/files/file_{i}.txt#file_{i}" for i in range(size)]
+    )
+    add_text_elements(
+        parent, "archive", [f"/user/${{userName}}/archives/archive_{i}.zip#archive_{i}" for i in range(size)]
+    )
+
+
+def create_spark_node(size: int) -> ET.Element:
+    node = ET.Element("spark")
+    add_text_elements(node, "job-tracker", ["${resourceManager}"])
+    add_text_elements(node, "name-node", ["${nameNode}"])
+    add_prepare(node, size)
+    add_configuration(node, size)
+    add_text_elements(node, "master", ["yarn"])
+    add_text_elements(node, "name", ["Spark Example"])
+    add_text_elements(node, "class", ["org.apache.spark.examples.mllib.JavaALS"])
+    add_text_elements(node, "jar", ["/user/${userName}/${examplesRoot}/lib/oozie-examples.jar"])
+    add_text_elements(node, "spark-opts", ["--executor-memory 20G --num-executors 50"])
+    add_text_elements(node, "arg", [f"/user/${{userName}}/${{examplesRoot}}/input_{i}" for i in range(size)])
+    add_files_and_archives(node, size)
+    return node
+
+
+def create_pig_node(size: int) -> ET.Element:
+    node = ET.Element("pig")
+    add_text_elements(node, "resource-manager", ["${resourceManager}"])
+    add_text_elements(node, "name-node", ["${nameNode}"])
+    add_prepare(node, size)
+    add_configuration(node, size)
+    add_text_elements(node, "script", ["id.pig"])
+    add_text_elements(
+        node, "param", [f"INPUT_{i}=/user/${{wf:user()}}/${{examplesRoot}}/{i}" for i in range(size)]
+    )
+    add_files_and_archives(node, size)
+    return node
+
+
+def create_mapreduce_node(size: int) -> ET.Element:
+    node = ET.Element("map-reduce")
+    add_text_elements(node, "name-node", ["${nameNode}"])
+    add_prepare(node, size)
+    add_configuration(
+        node,
+        size,
+        {
+            "mapreduce.input.fileinputformat.inputdir": "/user/${userName}/${examplesRoot}/input",
+            "mapreduce.output.fileoutputformat.outputdir": "/user/${userName}/${examplesRoot}/output",
+        },
+    )
+    add_files_and_archives(node, size)
+    return node
+
+
+def create_shell_node(size: int) -> ET.Element:
+    node = ET.Element("shell")
+    add_text_elements(node, "resource-manager", ["${resourceManager}"])
+    add_text_elements(node, "name-node", ["${nameNode}"])
+    add_prepare(node, size)
+    add_configuration(node, size)
+    add_text_elements(node, "exec", ["echo"])
+    add_text_elements(node, "argument", [f"${{examplesRoot}}/argument_{i}" for i in range(size)])
+    return node
+
+
+def create_ssh_node(size: int) -> ET.Element:
+    node = ET.Element("ssh")
+    add_text_elements(node, "host", ["user@example.com"])
+    add_text_elements(node, "command", ["echo"])
+    add_text_elements(node, "args", [f"${{examplesRoot}}/argument_{i}" for i in range(size)])
+    ET.SubElement(node, "capture-output")
+    return node
+
+
+def create_fs_node(size: int) -> ET.Element:
+    node = ET.Element("fs")
+    for i in range(size):
+        path = f"${{nameNode}}/examples/fs/{i}"
+        ET.SubElement(node, "mkdir", path=path)
+        ET.SubElement(node, "touchz", path=f"{path}/file")
+        ET.SubElement(node, "move", source=f"{path}/file", target=f"{path}/moved")
+        ET.SubElement(ET.SubElement(node, "chmod", path=path, permissions="-rwxrw-rw-"), "recursive")
+        ET.SubElement(node, "chgrp", path=path, group="hadoop")
+        ET.SubElement(node, "delete", path=path)
+    return node
+
+
+def create_git_node(size: int) -> ET.Element:
+    node = ET.Element("git")
+    add_prepare(node, size)
+    add_text_elements(node, "git-uri", ["https://github.com/apache/oozie"])
+    add_text_elements(node, "branch", ["master"])
+    add_text_elements(node, "destination-uri", ["${nameNode}/user/${userName}/oozie"])
+    add_text_elements(node, "key-path", ["${nameNode}/user/${userName}/key"])
+    return node
+
+
+def create_decision_node(size: int) -> ET.Element:
+    node = ET.Element("decision")
+    switch = ET.SubElement(node, "switch")
+    for i in range(size):
+        ET.SubElement(switch, "case", to=f"node_{i}").text = f"${{fs:fileSize('/path/{i}') gt 10 * GB}}"
+    ET.SubElement(switch, "default", to="end")
+    return node
+
+
+def create_subworkflow_node(size: int) -> ET.Element:
+    node = ET.Element("sub-workflow")
+    add_text_elements(node, "app-path", ["${nameNode}/user/${userName}/${examplesRoot}/apps/childwf"])
+    ET.SubElement(node, "propagate-configuration")
+    add_configuration(node, size)
+    return node
+
+
+class MapperBenchmark(NamedTuple):
+    create_node: Callable[[int], ET.Element]
+    create_mapper: Callable[[ET.Element, str], BaseMapper]
+
+
+def create_action_mapper(mapper_class, output_path: str) -> Callable[[ET.Element, str], BaseMapper]:
+    """Returns a function creating the action mapper as the parser does"""
+
+    def create(node: ET.Element, name: str) -> BaseMapper:
+        return mapper_class(
+            oozie_node=node,
+            name=name,
+            params=PARAMS,
+            dag_name="benchmark",
+            action_mapper=ACTION_MAP,
+            control_mapper=CONTROL_MAP,
+            input_directory_path=output_path,
+            output_directory_path=output_path,
+        )
+
+    return create
+
+
+def get_benchmarks(output_path: str) -> Dict[str, MapperBenchmark]:
+    return {
+        "spark": MapperBenchmark(create_spark_node, create_action_mapper(SparkMapper, output_path)),
+        "pig": MapperBenchmark(create_pig_node, create_action_mapper(PigMapper, output_path)),
+        "map-reduce": MapperBenchmark(
+            create_mapreduce_node, create_action_mapper(MapReduceMapper, output_path)
+        ),
+        "shell": MapperBenchmark(create_shell_node, create_action_mapper(ShellMapper, output_path)),
+        "ssh": MapperBenchmark(create_ssh_node, create_action_mapper(SSHMapper, output_path)),
+        "fs": MapperBenchmark(create_fs_node, create_action_mapper(FsMapper, output_path)),
+        "git": MapperBenchmark(create_git_node, create_action_mapper(GitMapper, output_path)),
+        "decision": MapperBenchmark(
+            create_decision_node, lambda node, name: DecisionMapper(oozie_node=node, name=name, params=PARAMS)
+        ),
+        "sub-workflow": MapperBenchmark(
+            create_subworkflow_node, create_action_mapper(SubworkflowMapper, output_path)
+        ),
+    }
+
+
+def measure(benchmark: MapperBenchmark, size: int, number: int, max_time: float) -> Dict[str, float]:
+    """
+    Converts the node up to ``number`` times, but stops after ``max_time`` seconds,
+    and returns the median time of each phase in microseconds.
+    """
+    node = benchmark.create_node(size)
+    durations: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+    deadline = time.perf_counter() + max_time
+    for _ in range(number):
+        start = time.perf_counter()
+        mapper = benchmark.create_mapper(node, "benchmark_node")
+        created = time.perf_counter()
+        mapper.on_parse_node()
+        parsed = time.perf_counter()
+        tasks, _ = mapper.to_tasks_and_relations()
+        converted = time.perf_counter()
+        for task in tasks:
+            task.rendered_template  # pylint: disable=pointless-statement
+        rendered = time.perf_counter()
+        for phase, duration in zip(
+            PHASES, (created - start, parsed - created, converted - parsed, rendered - converted)
+        ):
+            durations[phase].append(duration)
+        if rendered > deadline:
+            break
+    return {phase: statistics.median(values) * 1e6 for phase, values in durations.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("-m", "--mappers", nargs="*", help="Names of the mappers [default: all the mappers]")
+    parser.add_argument(
+        "-s", "--size", type=int, default=200, help="Number of each repeated element of the worst-case nodes"
+    )
+    parser.add_argument("-n", "--number", type=int, default=1000, help="Maximum number of conversions")
+    parser.add_argument(
+        "-t",
+        "--max-time",
+        type=float,
+        default=1.0,
+        help="Maximum time of the conversions of a node in seconds",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    output_path = tempfile.mkdtemp(prefix="o2a-mappers-benchmark")
+    try:
+        benchmarks = get_benchmarks(output_path)
+        unknown = sorted(set(args.mappers or []) - set(benchmarks))
+        if unknown:
+            parser.error(f"Unknown mappers: {', '.join(unknown)}")
+        print(f"{'':<24}" + "".join(f"{phase:>24}" for phase in PHASES))
+        for name in args.mappers or benchmarks:
+            for variant, size in (("typical", TYPICAL_SIZE), (f"size {args.size}", args.size)):
+                results = measure(benchmarks[name], size, args.number, args.max_time)
+                print(
+                    f"{name + ' ' + variant:<24}" + "".join(f"{results[phase]:22.1f}us" for phase in PHASES)
+                )
+    finally:
+        shutil.rmtree(output_path)
+
+
+if __name__ == "__main__":
+    main()
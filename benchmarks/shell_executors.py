@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares the latency of a shell task run in a Pig job and run directly over SSH.
+
+The bash commands are taken from the tasks rendered by the shell mappers and are run against
+a local stand-in of gcloud (see stand_in/gcloud), which uses a local Pig installation and
+an SSH connection to localhost. Usage:
+
+    python -m benchmarks.shell_executors [-n RUNS] [-c COMMAND]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+from xml.etree import ElementTree as ET
+
+from o2a.mappers.shell_mapper import DirectShellMapper, ShellMapper
+
+BENCHMARKS_PATH = os.path.dirname(os.path.abspath(__file__))
+STAND_IN_PATH = os.path.join(BENCHMARKS_PATH, "stand_in")
+SCRIPTS_PATH = os.path.join(os.path.dirname(BENCHMARKS_PATH), "scripts")
+PARAMS = {"dataproc_cluster": "benchmark", "gcp_region": "local", "nameNode": "hdfs://"}
+
+
+def get_bash_command(mapper_class, command: str) -> str:
+    """
+    Returns the bash command run by the BashOperator generated by the mapper for the command.
+    """
+    shell_node = ET.Element("shell")
+    ET.SubElement(shell_node, "resource-manager").text = "localhost:8032"
+    ET.SubElement(shell_node, "name-node").text = "hdfs://"
+    executable, *arguments = command.split()
+    ET.SubElement(shell_node, "exec").text = executable
+    for argument in arguments:
+        ET.SubElement(shell_node, "argument").text = argument
+    mapper = mapper_class(oozie_node=shell_node, name="shell_node", params=PARAMS)
+    tasks, _ = mapper.to_tasks_and_relations()
+    operators: Dict[str, Dict[str, str]] = {}
+    namespace = {
+        "bash_operator": SimpleNamespace(BashOperator=lambda **kwargs: operators.update({"task": kwargs})),
+        "PARAMS": PARAMS,
+    }
+    exec(tasks[0].rendered_template, namespace)  # pylint: disable=exec-used
+    return operators["task"]["bash_command"]
+
+
+def check_executor(name: str, check_command: List[str]) -> bool:
+    try:
+        subprocess.run(check_command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        print(f"Skipping {name}: '{' '.join(check_command)}' failed.")
+        return False
+    return True
+
+
+def measure(bash_command: str, runs: int, env: Dict[str, str]) -> Optional[List[float]]:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = subprocess.run(
+            ["bash", "-c", bash_command], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        durations.append(time.perf_counter() - start)
+        if process.returncode:
+            print(process.stderr.decode(errors="replace"), file=sys.stderr)
+            return None
+    return durations
+
+
+def print_results(name: str, durations: List[float]):
+    # The first run of the direct executor also opens the shared SSH connection
+    first = durations[0]
+    durations = sorted(durations)
+    p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+    print(
+        f"{name:<8} runs: {len(durations):>3}  first: {first:8.3f}s  "
+        f"median: {statistics.median(durations):8.3f}s  mean: {statistics.mean(durations):8.3f}s  "
+        f"p95: {p95:8.3f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("-n", "--runs", type=int, default=10, help="Number of runs of each executor")
+    parser.add_argument("-c", "--command", default="echo o2a", help="Shell command run by the task")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="o2a-shell-benchmark")
+    try:
+        # The generated DAGs run the scripts from $DAGS_FOLDER/../data
+        os.symlink(SCRIPTS_PATH, os.path.join(work_dir, "data"))
+        os.makedirs(os.path.join(work_dir, "dags"))
+        env = dict(
+            os.environ,
+            PATH=f"{STAND_IN_PATH}:{os.environ['PATH']}",
+            DAGS_FOLDER=os.path.join(work_dir, "dags"),
+            O2A_CACHE_DIR=os.path.join(work_dir, "cache"),
+        )
+        executors = []
+        if check_executor("pig", [os.environ.get("O2A_BENCHMARK_PIG", "pig"), "-version"]):
+            executors.append(("pig", ShellMapper))
+        ssh_host = os.environ.get("O2A_BENCHMARK_SSH_HOST", "localhost")
+        if check_executor("ssh", ["ssh", "-o", "BatchMode=yes", ssh_host, "true"]):
+            executors.append(("ssh", DirectShellMapper))
+
+        for name, mapper_class in executors:
+            bash_command = get_bash_command(mapper_class, args.command)
+            durations = measure(bash_command, args.runs, env)
+            if durations is None:
+                print(f"{name:<8} failed: {bash_command}")
+            else:
+                print_results(name, durations)
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Entry point converting many workflow applications in a pipeline"""
+import argparse
+import logging
+import sys
+
+from o2a.converter.mappers import ACTION_MAP, CONTROL_MAP
+from o2a.converter.oozie_converter import OozieConverter
+from o2a.converter.pipeline import DEFAULT_IO_THREADS, DEFAULT_MAX_IN_FLIGHT, ConversionPipeline
+
+
+# pylint: disable=missing-docstring
+def main():
+    args = parse_args(sys.argv[1:])
+
+    def create_converter(input_directory_path: str, output_directory_path: str, dag_name: str):
+        return OozieConverter(
+            dag_name=dag_name,
+            input_directory_path=input_directory_path,
+            output_directory_path=output_directory_path,
+            action_mapper=ACTION_MAP,
+            control_mapper=CONTROL_MAP,
+            user=args.user,
+            start_days_ago=args.start_days_ago,
+            schedule_interval=args.schedule_interval,
+            simplify_graph=args.simplify_graph,
+            format_output=not args.skip_formatting,
+        )
+
+    pipeline = ConversionPipeline(
+        create_converter,
+        max_in_flight=args.max_in_flight,
+        io_threads=args.io_threads,
+        work_directory_path=args.work_directory_path,
+    )
+    results = pipeline.run(args.input_directory_paths, args.output_directory_path)
+    failed = [result.input_directory_path for result in results if result.error]
+    logging.info(f"Converted {len(results) - len(failed)} of {len(results)} applications.")
+    for path in failed:
+        print(f"Failed: {path}")
+    if failed:
+        sys.exit(1)
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(
+        description="Convert many Apache Oozie workflows to Apache Airflow workflows, reading the next "
+        "applications and writing the converted ones while an application is being converted."
+    )
+    parser.add_argument(
+        "-i", "--input-directory-paths", nargs="+", help="Paths to the application directories", required=True
+    )
+    parser.add_argument(
+        "-o",
+        "--output-directory-path",
+        help="Output directory, each application is converted to a subdirectory named after it",
+        required=True,
+    )
+    parser.add_argument(
+        "-u",
+        "--user",
+        help="The user to be used in place of all ${user.name} [defaults to user who ran the conversion]",
+    )
+    parser.add_argument("-s", "--start-days-ago", help="Desired DAG start as number of days ago", default=0)
+    parser.add_argument(
+        "-v", "--schedule-interval", help="Desired DAG schedule interval as number of days", default=0
+    )
+    parser.add_argument(
+        "--simplify-graph",
+        action="store_true",
+        help="Remove no-op control tasks (fork, join, end) and redundant relations from the DAG",
+    )
+    parser.add_argument(
+        "--skip-formatting",
+        action="store_true",
+        help="Do not format the generated DAG files with black, which keeps the whole file in memory",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help="Maximum number of the applications read, converted or written at a time "
+        f"[default: {DEFAULT_MAX_IN_FLIGHT}]",
+    )
+    parser.add_argument(
+        "--io-threads",
+        type=int,
+        default=DEFAULT_IO_THREADS,
+        help=f"Number of the threads reading and writing the files [default: {DEFAULT_IO_THREADS}]",
+    )
+    parser.add_argument(
+        "--work-directory-path",
+        help="Local directory where the files of the applications are staged "
+        "[default: a temporary directory]",
+    )
+    return parser.parse_args(args)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Sizes DAG concurrency and pools from the fan-out of the workflow and the capacity of the cluster"""
+import json
+import logging
+from collections import Counter, defaultdict
+from typing import Dict, NamedTuple, Optional
+
+from o2a.converter.exceptions import O2AException
+from o2a.converter.graph import build_task_graph
+from o2a.converter.task import Task
+from o2a.converter.task_prioritizer import get_action_type, get_pool_name
+from o2a.converter.workflow import Workflow
+
+
+class CapacityProfile(NamedTuple):
+    """Capacity of the cluster the DAG runs on"""
+
+    # Maximum number of the tasks of the DAG running at the same time
+    max_concurrency: int = 16
+    # Maximum number of the DAG runs at the same time
+    max_active_runs: int = 1
+    # Maximum number of the jobs of a single action type running at the same time
+    default_pool_slots: int = 4
+    # Overrides of default_pool_slots for the action types, e.g. {"spark": 2}
+    pool_slots: Optional[Dict[str, int]] = None
+
+
+class CapacityPlan(NamedTuple):
+    """DAG-level concurrency settings and sizes of the pools"""
+
+    concurrency: int
+    max_active_runs: int
+    pools: Dict[str, int]
+
+
+def load_capacity_profile(profile_file: str) -> CapacityProfile:
+    """
+    Loads the capacity profile from a JSON file. The keys of the JSON object are the fields
+    of ``CapacityProfile``, the missing ones are set to the defaults.
+    """
+    with open(profile_file, "r") as file:
+        profile = json.load(file)
+    if not isinstance(profile, dict):
+        raise O2AException(f"The capacity profile should contain a JSON object: {profile_file}")
+    unknown_keys = set(profile.keys()) - set(CapacityProfile._fields)
+    if unknown_keys:
+        raise O2AException(f"Unknown keys in the capacity profile {profile_file}: {sorted(unknown_keys)}")
+    return CapacityProfile(**profile)
+
+
+def plan_capacity(workflow: Workflow, profile: CapacityProfile) -> CapacityPlan:
+    """
+    Estimates how many tasks of the workflow can run in parallel and sizes the DAG concurrency
+    and the per-action-type pools accordingly, capped by the capacity of the cluster.
+
+    The tasks are grouped into levels by the longest path from the root tasks. The number of
+    tasks on the widest level - usually the branches of the widest fork - is used as the
+    parallelism of the DAG. It has to be called after the nodes are converted to tasks.
+    """
+    tasks: Dict[str, Task] = {task.task_id: task for node in workflow.nodes.values() for task in node.tasks}
+    graph = build_task_graph(workflow)
+
+    levels: Dict[str, int] = defaultdict(int)
+    for task_id in graph.topological_order():
+        for downstream_task_id in graph.downstream(task_id):
+            levels[downstream_task_id] = max(levels[downstream_task_id], levels[task_id] + 1)
+
+    width: Counter = Counter()
+    action_type_width: Counter = Counter()
+    for task_id, task in tasks.items():
+        width[levels[task_id]] += 1
+        action_type_width[(get_action_type(task), levels[task_id])] += 1
+
+    parallelism: Dict[str, int] = defaultdict(int)
+    for (action_type, _), count in action_type_width.items():
+        parallelism[action_type] = max(parallelism[action_type], count)
+
+    max_width = max(width.values(), default=1)
+    pool_slots = profile.pool_slots or {}
+    pools: Dict[str, int] = {}
+    for action_type, count in sorted(parallelism.items()):
+        pool_name = get_pool_name(action_type)
+        if pool_name:
+            slots = pool_slots.get(action_type, profile.default_pool_slots)
+            pools[pool_name] = min(count * profile.max_active_runs, slots)
+
+    plan = CapacityPlan(
+        concurrency=min(max_width * profile.max_active_runs, profile.max_concurrency),
+        max_active_runs=profile.max_active_runs,
+        pools=pools,
+    )
+    logging.info(
+        f"Estimated parallelism of the workflow: {max_width} tasks, concurrency: {plan.concurrency}, "
+        f"pools: {plan.pools}"
+    )
+    return plan
+
+
+def write_pools_file(plan: CapacityPlan, pools_file: str, dag_name: str):
+    """
+    Writes the pools in the format accepted by ``airflow pool --import``.
+    """
+    pools = {
+        name: {"description": f"Pool created for the {dag_name} DAG by o2a", "slots": slots}
+        for name, slots in plan.pools.items()
+    }
+    with open(pools_file, "w") as file:
+        logging.info(f"Saving pools to file: {pools_file}")
+        json.dump(pools, file, indent=4, sort_keys=True)
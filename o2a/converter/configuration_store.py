@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Configuration of the actions shared between the actions with identical configuration"""
+import os
+import threading
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple
+from xml.etree import ElementTree as ET
+from xml.etree.ElementTree import Element
+
+from o2a.converter.exceptions import ParseException
+from o2a.utils import el_utils, xml_utils
+
+
+# The properties of the job-xml files, before the EL variables are replaced, shared by
+# the conversions of all the workflows, also those running in other threads. They are stored
+# with the modification time and the size of the file, so a changed file is parsed again.
+JOB_XML_PROPERTIES: Dict[str, Tuple[Tuple[int, int], List[Tuple[str, str]]]] = {}
+JOB_XML_PROPERTIES_LOCK = threading.Lock()
+
+
+def _read_properties(config_node: Element) -> List[Tuple[str, str]]:
+    return [
+        (node.find("name").text, node.find("value").text)
+        for node in xml_utils.find_nodes_by_tag(config_node, "property")
+    ]
+
+
+def _replace_els(properties: List[Tuple[str, str]], params: Dict[str, str]) -> Dict[str, str]:
+    return {
+        name: el_utils.replace_el_with_var(value, params=params, quote=False) for name, value in properties
+    }
+
+
+def parse_configuration(config_node: Element, params: Dict[str, str]) -> Dict[str, str]:
+    """
+    Parses the properties of a <configuration> node replacing the EL variables with the params.
+    """
+    return _replace_els(_read_properties(config_node), params)
+
+
+def read_job_xml(path: str) -> List[Tuple[str, str]]:
+    """
+    Returns the properties of a job-xml file, which is parsed only the first time it is read
+    in the run, or when it changes.
+    """
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = JOB_XML_PROPERTIES.get(path)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        properties = _read_properties(ET.parse(path).getroot())
+    except (OSError, ET.ParseError) as error:
+        raise ParseException(f"Cannot parse the job-xml file {path}: {error}")
+    with JOB_XML_PROPERTIES_LOCK:
+        JOB_XML_PROPERTIES[path] = (version, properties)
+    return properties
+
+
+def parse_job_xml(path: str, params: Dict[str, str]) -> Dict[str, str]:
+    """
+    Parses the properties of a job-xml file, which has the format of a Hadoop configuration file.
+    """
+    return _replace_els(read_job_xml(path), params)
+
+
+class ConfigurationView(MutableMapping):
+    """
+    Configuration of a single action.
+
+    It is a read-only view of the shared configuration blocks, where the later blocks override
+    the earlier ones, until it is modified. The first modification copies the properties
+    to a dictionary owned by the action, so the shared blocks are never changed.
+    """
+
+    __slots__ = ("_blocks", "_own")
+
+    def __init__(self, *blocks: Mapping[str, str]):
+        self._blocks: Tuple[Mapping[str, str], ...] = tuple(block for block in blocks if block)
+        self._own: Optional[Dict[str, str]] = None
+
+    @property
+    def is_shared(self) -> bool:
+        """
+        True until the view is modified and gets its own copy of the properties.
+        """
+        return self._own is None
+
+    def _merge(self) -> Mapping[str, str]:
+        if self._own is not None:
+            return self._own
+        if len(self._blocks) == 1:
+            return self._blocks[0]
+        merged: Dict[str, str] = {}
+        for block in self._blocks:
+            merged.update(block)
+        return merged
+
+    def _copy_on_write(self) -> Dict[str, str]:
+        if self._own is None:
+            self._own = dict(self._merge())
+            self._blocks = ()
+        return self._own
+
+    def __getitem__(self, key: str) -> str:
+        if self._own is not None:
+            return self._own[key]
+        for block in reversed(self._blocks):
+            if key in block:
+                return block[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: str):
+        self._copy_on_write()[key] = value
+
+    def __delitem__(self, key: str):
+        del self._copy_on_write()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._merge())
+
+    def __len__(self) -> int:
+        return len(self._merge())
+
+    def __repr__(self) -> str:
+        # The configuration is rendered in the DAG files as a dictionary literal
+        return repr(dict(self._merge()))
+
+    # The read-only blocks cannot be pickled, so they are pickled as dictionaries, for example
+    # when the mappers are sent to the worker processes
+    def __getstate__(self):
+        return tuple(dict(block) for block in self._blocks), self._own
+
+    def __setstate__(self, state):
+        blocks, self._own = state
+        self._blocks = tuple(MappingProxyType(block) for block in blocks)
+
+
+class ConfigurationStore:
+    """
+    Stores a single read-only copy of each distinct configuration block of a workflow together
+    with the configuration of the <global> section, which applies to all the actions.
+
+    The job-xml files are parsed once per run, as many actions and workflows often reference
+    the same file, and the configuration block of each file is built once per workflow.
+    """
+
+    __slots__ = ("_blocks", "_job_xml_blocks", "global_configuration")
+
+    def __init__(self, global_configuration: Mapping[str, str] = None):
+        self._blocks: Dict[Tuple[Tuple[str, str], ...], Mapping[str, str]] = {}
+        self._job_xml_blocks: Dict[str, Mapping[str, str]] = {}
+        self.global_configuration: Mapping[str, str] = MappingProxyType({})
+        if global_configuration:
+            self.set_global_configuration(global_configuration)
+
+    def __getstate__(self):
+        return (
+            [dict(block) for block in self._blocks.values()],
+            {path: dict(block) for path, block in self._job_xml_blocks.items()},
+            dict(self.global_configuration),
+        )
+
+    def __setstate__(self, state):
+        blocks, job_xml_blocks, global_configuration = state
+        self._blocks = {}
+        for block in blocks:
+            self.intern(block)
+        self._job_xml_blocks = {path: self.intern(block) for path, block in job_xml_blocks.items()}
+        self.global_configuration = (
+            self.intern(global_configuration) if global_configuration else MappingProxyType({})
+        )
+
+    def set_global_configuration(self, properties: Mapping[str, str]):
+        self.global_configuration = self.intern(properties)
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def intern(self, properties: Mapping[str, str]) -> Mapping[str, str]:
+        """
+        Returns the shared read-only copy of the configuration block with the same properties.
+        """
+        key = tuple(properties.items())
+        block = self._blocks.get(key)
+        if block is None:
+            block = MappingProxyType(dict(properties))
+            self._blocks[key] = block
+        return block
+
+    def get_job_xml_configuration(self, path: str, params: Dict[str, str]) -> Mapping[str, str]:
+        """
+        Returns the shared read-only configuration block of the job-xml file, which is parsed
+        only the first time it is used.
+        """
+        path = os.path.abspath(path)
+        block = self._job_xml_blocks.get(path)
+        if block is None:
+            block = self.intern(parse_job_xml(path, params))
+            self._job_xml_blocks[path] = block
+        return block
+
+    def get_configuration(self, *blocks: Mapping[str, str]) -> ConfigurationView:
+        """
+        Returns the configuration of an action consisting of the global configuration
+        and the configuration blocks of the action, in the order of precedence.
+        """
+        return ConfigurationView(
+            self.global_configuration, *(self.intern(block) for block in blocks if block)
+        )
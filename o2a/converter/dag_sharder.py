@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Splits the tasks of a workflow between modules imported by the DAG file"""
+from typing import Dict, List, NamedTuple, Set
+
+from o2a.converter.exceptions import O2AException
+from o2a.converter.graph import Graph
+from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.relation import Relation
+from o2a.converter.workflow import Workflow
+
+
+class DagShard(NamedTuple):
+    """Part of the DAG defined in a separate module"""
+
+    module_name: str
+    nodes: List[ParsedNode]
+    # Relations between the tasks defined in the module
+    relations: List[Relation]
+    # Relations from the tasks defined in the previous modules
+    upstream_relations: List[Relation]
+    # Tasks used by the relations of the next modules
+    exported_task_ids: List[str]
+
+
+def get_node_layers(workflow: Workflow) -> List[List[str]]:
+    """
+    Returns the names of the nodes with tasks split into topological layers,
+    so that the upstream nodes of each node are in the previous layers.
+    """
+    node_names = {
+        task.task_id: name for name, node in workflow.nodes.items() if node.tasks for task in node.tasks
+    }
+    graph = Graph(name for name, node in workflow.nodes.items() if node.tasks)
+    for relation in workflow.relations:
+        from_name = node_names.get(relation.from_task_id)
+        to_name = node_names.get(relation.to_task_id)
+        if from_name and to_name and from_name != to_name:
+            graph.add_edge(from_name, to_name)
+    return graph.layers()
+
+
+def shard_workflow(workflow: Workflow, max_tasks: int) -> List[DagShard]:
+    """
+    Splits the converted nodes of the workflow into shards of at most ``max_tasks`` tasks, following
+    the topological layers of the workflow, so that the relations between the shards always lead
+    from an earlier shard to a later one. A node is never split, so a node with more tasks than
+    ``max_tasks`` gets a shard of its own.
+
+    :raises O2AException: if the workflow contains a cycle
+    """
+    if max_tasks < 1:
+        raise O2AException(f"The number of tasks in a shard should be positive: {max_tasks}")
+    shards: List[DagShard] = []
+    task_shards: Dict[str, int] = {}
+    shard_size = 0
+    for layer in get_node_layers(workflow):
+        for name in layer:
+            node = workflow.nodes[name]
+            if not shards or (shard_size and shard_size + len(node.tasks) > max_tasks):
+                shards.append(DagShard(f"part_{len(shards)}", [], [], [], []))
+                shard_size = 0
+            shards[-1].nodes.append(node)
+            shard_size += len(node.tasks)
+            for task in node.tasks:
+                task_shards[task.task_id] = len(shards) - 1
+    if not shards:
+        return shards
+
+    exported_task_ids: Set[str] = set()
+    for relation in workflow.relations:
+        from_index = task_shards.get(relation.from_task_id)
+        to_index = task_shards.get(relation.to_task_id)
+        # A relation is defined together with its downstream task, as the upstream one is already defined
+        if to_index is not None:
+            index = to_index
+        elif from_index is not None:
+            index = from_index
+        else:
+            index = len(shards) - 1
+        if from_index == index:
+            shards[index].relations.append(relation)
+            continue
+        shards[index].upstream_relations.append(relation)
+        if from_index is not None and relation.from_task_id not in exported_task_ids:
+            exported_task_ids.add(relation.from_task_id)
+            shards[from_index].exported_task_ids.append(relation.from_task_id)
+    return shards
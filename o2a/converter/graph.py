@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Directed graph of the nodes or the tasks of a workflow"""
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from o2a.converter.exceptions import O2AException
+from o2a.converter.workflow import Workflow
+
+
+class Graph:
+    """
+    Directed graph with named nodes.
+
+    The nodes are numbered in the order they are added and the edges are kept in forward
+    and backward adjacency lists of the node numbers, so the algorithms below run in time
+    linear in the size of the graph.
+    """
+
+    __slots__ = ("_names", "_ids", "_downstream", "_upstream", "_edges")
+
+    def __init__(self, names: Iterable[str] = (), edges: Iterable[Tuple[str, str]] = ()):
+        self._names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._downstream: List[List[int]] = []
+        self._upstream: List[List[int]] = []
+        self._edges: Set[Tuple[int, int]] = set()
+        for name in names:
+            self.add_node(name)
+        for from_name, to_name in edges:
+            self.add_edge(from_name, to_name)
+
+    def add_node(self, name: str) -> int:
+        """
+        Adds the node if it does not exist yet.
+
+        :return: number of the node
+        """
+        node_id = self._ids.get(name)
+        if node_id is None:
+            node_id = len(self._names)
+            self._ids[name] = node_id
+            self._names.append(name)
+            self._downstream.append([])
+            self._upstream.append([])
+        return node_id
+
+    def add_edge(self, from_name: str, to_name: str):
+        """
+        Adds the edge and its nodes if they do not exist yet.
+        """
+        from_id = self.add_node(from_name)
+        to_id = self.add_node(to_name)
+        if (from_id, to_id) not in self._edges:
+            self._edges.add((from_id, to_id))
+            self._downstream[from_id].append(to_id)
+            self._upstream[to_id].append(from_id)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name) -> bool:
+        return name in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __repr__(self) -> str:
+        return f"Graph(nodes={len(self._names)}, edges={len(self._edges)})"
+
+    def edges(self) -> Iterator[Tuple[str, str]]:
+        for from_id, downstream_ids in enumerate(self._downstream):
+            for to_id in downstream_ids:
+                yield self._names[from_id], self._names[to_id]
+
+    def downstream(self, name: str) -> List[str]:
+        return [self._names[node_id] for node_id in self._downstream[self._ids[name]]]
+
+    def upstream(self, name: str) -> List[str]:
+        return [self._names[node_id] for node_id in self._upstream[self._ids[name]]]
+
+    def in_degree(self, name: str) -> int:
+        return len(self._upstream[self._ids[name]])
+
+    def out_degree(self, name: str) -> int:
+        return len(self._downstream[self._ids[name]])
+
+    def roots(self) -> List[str]:
+        """
+        Returns the nodes without upstream nodes.
+        """
+        return [name for name, upstream_ids in zip(self._names, self._upstream) if not upstream_ids]
+
+    def leaves(self) -> List[str]:
+        """
+        Returns the nodes without downstream nodes.
+        """
+        return [name for name, downstream_ids in zip(self._names, self._downstream) if not downstream_ids]
+
+    def topological_order(self) -> List[str]:
+        """
+        Sorts the nodes so that each node is placed before all of its downstream nodes.
+
+        :raises O2AException: if the graph contains a cycle
+        """
+        in_degree = [len(upstream_ids) for upstream_ids in self._upstream]
+        ready = [node_id for node_id, degree in enumerate(in_degree) if not degree]
+        order: List[int] = []
+        while ready:
+            node_id = ready.pop()
+            order.append(node_id)
+            for downstream_id in self._downstream[node_id]:
+                in_degree[downstream_id] -= 1
+                if not in_degree[downstream_id]:
+                    ready.append(downstream_id)
+        if len(order) != len(self._names):
+            raise self._cycle_error()
+        return [self._names[node_id] for node_id in order]
+
+    def layers(self) -> List[List[str]]:
+        """
+        Splits the nodes into topological layers. The first layer contains the roots and each
+        following layer contains the nodes whose upstream nodes are all in the previous layers.
+
+        :raises O2AException: if the graph contains a cycle
+        """
+        in_degree = [len(upstream_ids) for upstream_ids in self._upstream]
+        layer = [node_id for node_id, degree in enumerate(in_degree) if not degree]
+        layers: List[List[int]] = []
+        while layer:
+            layers.append(layer)
+            next_layer = []
+            for node_id in layer:
+                for downstream_id in self._downstream[node_id]:
+                    in_degree[downstream_id] -= 1
+                    if not in_degree[downstream_id]:
+                        next_layer.append(downstream_id)
+            layer = next_layer
+        if sum(len(layer) for layer in layers) != len(self._names):
+            raise self._cycle_error()
+        return [[self._names[node_id] for node_id in layer] for layer in layers]
+
+    def _cycle_error(self) -> O2AException:
+        cycle = self.find_cycle() or []
+        return O2AException(f"The graph contains a cycle: {' -> '.join(cycle)}")
+
+    def find_cycle(self) -> Optional[List[str]]:
+        """
+        Returns the names of the nodes on a cycle, starting and ending with the same node,
+        or None if the graph is acyclic.
+        """
+        not_visited, in_progress, done = 0, 1, 2
+        state = [not_visited] * len(self._names)
+        for start_id in range(len(self._names)):
+            if state[start_id] != not_visited:
+                continue
+            # Depth-first search with an explicit stack of (node, index of the next downstream node)
+            path: List[int] = [start_id]
+            stack: List[Tuple[int, int]] = [(start_id, 0)]
+            state[start_id] = in_progress
+            while stack:
+                node_id, index = stack[-1]
+                if index == len(self._downstream[node_id]):
+                    stack.pop()
+                    path.pop()
+                    state[node_id] = done
+                    continue
+                stack[-1] = (node_id, index + 1)
+                downstream_id = self._downstream[node_id][index]
+                if state[downstream_id] == in_progress:
+                    cycle = path[path.index(downstream_id) :] + [downstream_id]
+                    return [self._names[cycle_id] for cycle_id in cycle]
+                if state[downstream_id] == not_visited:
+                    state[downstream_id] = in_progress
+                    path.append(downstream_id)
+                    stack.append((downstream_id, 0))
+        return None
+
+    def has_cycle(self) -> bool:
+        return self.find_cycle() is not None
+
+    def reachable(self, name: str) -> Set[str]:
+        """
+        Returns the names of all the nodes that can be reached from the node.
+        The node itself is included only if it is on a cycle.
+        """
+        visited = self._visit(self._ids[name])
+        return {self._names[node_id] for node_id, is_visited in enumerate(visited) if is_visited}
+
+    def has_path(self, from_name: str, to_name: str) -> bool:
+        to_id = self._ids[to_name]
+        return self._visit(self._ids[from_name], stop_id=to_id)[to_id]
+
+    def _visit(self, start_id: int, stop_id: int = None) -> List[bool]:
+        visited = [False] * len(self._names)
+        stack = list(self._downstream[start_id])
+        while stack:
+            node_id = stack.pop()
+            if visited[node_id]:
+                continue
+            visited[node_id] = True
+            if node_id == stop_id:
+                break
+            stack.extend(self._downstream[node_id])
+        return visited
+
+
+def build_task_graph(workflow: Workflow) -> Graph:
+    """
+    Returns the graph of the tasks of the converted workflow. Relations to tasks that are not
+    part of the workflow are skipped. It has to be called after the nodes are converted to tasks.
+    """
+    graph = Graph(task.task_id for node in workflow.nodes.values() for task in node.tasks)
+    for node in workflow.nodes.values():
+        for relation in node.relations:
+            if relation.from_task_id in graph and relation.to_task_id in graph:
+                graph.add_edge(relation.from_task_id, relation.to_task_id)
+    for relation in workflow.relations:
+        if relation.from_task_id in graph and relation.to_task_id in graph:
+            graph.add_edge(relation.from_task_id, relation.to_task_id)
+    return graph
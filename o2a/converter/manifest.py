@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Manifest of the output files and copying of the changed files to the DAGs folder"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+from typing import Dict, List, NamedTuple
+
+from o2a.converter.exceptions import O2AException
+
+EXCLUDED_DIRECTORIES = {"__pycache__"}
+
+CHUNK_SIZE = 2 ** 16
+
+
+class SyncReport(NamedTuple):
+    """Files copied, deleted and left unchanged by ``sync_files``"""
+
+    copied: List[str]
+    deleted: List[str]
+    unchanged: List[str]
+
+
+def get_file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def create_manifest(directory: str, excluded_files: List[str] = None) -> Dict[str, str]:
+    """
+    Returns the SHA-256 digests of the files in the directory by their paths relative to it.
+    The paths use forward slashes, so that they can be used as the names of objects in a bucket.
+    """
+    excluded = {os.path.abspath(path) for path in excluded_files or []}
+    manifest = {}
+    for root, directories, files in os.walk(directory):
+        directories[:] = sorted(name for name in directories if name not in EXCLUDED_DIRECTORIES)
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            if os.path.abspath(path) in excluded or name.endswith(".pyc"):
+                continue
+            manifest[os.path.relpath(path, directory).replace(os.sep, "/")] = get_file_digest(path)
+    return manifest
+
+
+def write_manifest(directory: str, manifest_file: str) -> Dict[str, str]:
+    """
+    Writes the manifest of the files in the directory, except the manifest itself, to a JSON file.
+    """
+    manifest = create_manifest(directory, excluded_files=[manifest_file])
+    with open(manifest_file, "w") as file:
+        logging.info(f"Saving manifest to file: {manifest_file}")
+        json.dump(manifest, file, indent=4, sort_keys=True)
+    return manifest
+
+
+def load_manifest(manifest_file: str) -> Dict[str, str]:
+    with open(manifest_file, "r") as file:
+        manifest = json.load(file)
+    if not isinstance(manifest, dict):
+        raise O2AException(f"The manifest should contain a JSON object: {manifest_file}")
+    return manifest
+
+
+def _copy_file(source_path: str, target_path: str):
+    # The file is replaced at once, so that Airflow never parses a partially copied DAG file
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    temporary_path = target_path + ".o2a-tmp"
+    shutil.copyfile(source_path, temporary_path)
+    os.replace(temporary_path, target_path)
+
+
+def sync_files(manifest_file: str, target_directory: str, delete: bool = True) -> SyncReport:
+    """
+    Copies the files listed in the manifest from the directory of the manifest to the target directory,
+    skipping the files with the same digests in the manifest copied there by the previous sync.
+    Files listed only in the previous manifest are deleted from the target directory, unless ``delete``
+    is False. The manifest is copied last, so an interrupted sync is completed by the next one.
+
+    Only the manifests are compared, the target directory - e.g. a mounted DAG bucket - is not read,
+    except for checking that the unchanged files still exist.
+    """
+    source_directory = os.path.dirname(os.path.abspath(manifest_file))
+    manifest = load_manifest(manifest_file)
+    target_manifest_file = os.path.join(target_directory, os.path.basename(manifest_file))
+    previous_manifest = load_manifest(target_manifest_file) if os.path.isfile(target_manifest_file) else {}
+
+    report = SyncReport([], [], [])
+    for path, digest in sorted(manifest.items()):
+        target_path = os.path.join(target_directory, *path.split("/"))
+        if previous_manifest.get(path) == digest and os.path.isfile(target_path):
+            report.unchanged.append(path)
+            continue
+        source_path = os.path.join(source_directory, *path.split("/"))
+        if get_file_digest(source_path) != digest:
+            raise O2AException(f"The file {source_path} changed after the manifest was written")
+        logging.info(f"Copying {path} to {target_directory}")
+        _copy_file(source_path, target_path)
+        report.copied.append(path)
+    if delete:
+        for path in sorted(set(previous_manifest) - set(manifest)):
+            target_path = os.path.join(target_directory, *path.split("/"))
+            if os.path.isfile(target_path):
+                logging.info(f"Deleting {path} from {target_directory}")
+                os.remove(target_path)
+            report.deleted.append(path)
+    _copy_file(manifest_file, target_manifest_file)
+    return report
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Report of the memory allocated in the phases of the conversion"""
+import gc
+import sys
+import tracemalloc
+import types
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple, Type
+
+from o2a.converter.workflow import Workflow
+from o2a.mappers.base_mapper import BaseMapper
+
+DEFAULT_TOP_SITES = 10
+
+# Objects shared by the whole program, which are not retained by the measured objects
+SHARED_TYPES: Tuple[Type, ...] = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    types.FrameType,
+)
+
+# Measured structures by their names
+MEASURED_TYPES: Dict[str, Type] = {"Workflow": Workflow, "mappers": BaseMapper, "XML elements": ET.Element}
+
+# Allocations of the tracing itself and of the imported modules are not reported
+TRACE_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+class RetainedSize(NamedTuple):
+    count: int
+    size: int
+
+
+class PhaseReport(NamedTuple):
+    phase: str
+    current: int
+    peak: int
+    top_sites: List[tracemalloc.Statistic]
+    retained: Dict[str, RetainedSize]
+
+
+def get_retained_size(roots: Iterable[object], stop: Set[int]) -> int:
+    """
+    Returns the total size of the objects reachable from the roots. The objects whose ids are
+    in ``stop`` - the roots of the other measured structures - and the objects shared by the whole
+    program, e.g. classes and modules, are neither counted nor followed.
+    """
+    seen: Set[int] = set()
+    objects = []
+    pending = list(roots)
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        objects.append(obj)
+        pending.extend(
+            referent
+            for referent in gc.get_referents(obj)
+            if id(referent) not in seen and id(referent) not in stop
+        )
+    # The sizes are summed after the traversal, as __sizeof__ may create new objects
+    return sum(sys.getsizeof(obj) for obj in objects)
+
+
+def measure_structures() -> Dict[str, RetainedSize]:
+    """
+    Returns the number of the live objects of the measured types and the total size of the objects
+    they retain. Each structure is measured up to the objects of the other structures, e.g. the size
+    of the Workflow does not include the mappers of its nodes.
+    """
+    roots: Dict[str, List[object]] = {name: [] for name in MEASURED_TYPES}
+    for obj in gc.get_objects():
+        for name, measured_type in MEASURED_TYPES.items():
+            if isinstance(obj, measured_type):
+                roots[name].append(obj)
+    all_roots = {id(obj) for objects in roots.values() for obj in objects}
+    result = {}
+    for name, objects in roots.items():
+        stop = all_roots - {id(obj) for obj in objects}
+        result[name] = RetainedSize(count=len(objects), size=get_retained_size(objects, stop))
+    return result
+
+
+def format_size(size: int) -> str:
+    if abs(size) < 1024:
+        return f"{size} B"
+    value = float(size)
+    for unit in ("KiB", "MiB"):
+        value /= 1024
+        if abs(value) < 1024:
+            return f"{value:.1f} {unit}"
+    return f"{value / 1024:.1f} GiB"
+
+
+class MemoryReport:
+    """
+    Traces the memory allocations during the conversion and takes a snapshot after each phase
+    with the top allocation sites and the size of the structures built by the converter.
+
+    Tracing slows the conversion down several times, so it is only enabled on request.
+    """
+
+    def __init__(self, top_sites: int = DEFAULT_TOP_SITES):
+        self.top_sites = top_sites
+        self.phases: List[PhaseReport] = []
+
+    def start(self):
+        tracemalloc.start()
+
+    def stop(self):
+        tracemalloc.stop()
+
+    def snapshot(self, phase: str):
+        if not tracemalloc.is_tracing():
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+        current, peak = tracemalloc.get_traced_memory()
+        self.phases.append(
+            PhaseReport(
+                phase=phase,
+                current=current,
+                peak=peak,
+                top_sites=snapshot.statistics("lineno")[: self.top_sites],
+                retained=measure_structures(),
+            )
+        )
+
+    def format(self) -> str:
+        lines = []
+        for report in self.phases:
+            lines.append(
+                f"After {report.phase}: current {format_size(report.current)}, "
+                f"peak {format_size(report.peak)}"
+            )
+            lines.append("  Retained size:")
+            for name, retained in report.retained.items():
+                lines.append(f"    {name:<14} {retained.count:>8} objects {format_size(retained.size):>12}")
+            lines.append("  Top allocation sites:")
+            for statistic in report.top_sites:
+                frame = statistic.traceback[0]
+                lines.append(
+                    f"    {format_size(statistic.size):>12} {statistic.count:>8} blocks  "
+                    f"{frame.filename}:{frame.lineno}"
+                )
+        return "\n".join(lines)
@@ -14,9 +14,12 @@
 # limitations under the License.
 """Converts Oozie application workflow into Airflow's DAG
 """
+import getpass
+import itertools
+import re
 import shutil
 from pathlib import Path
-from typing import Dict, Type, Union, List
+from typing import Any, Dict, Iterable, Type, Union, List, Optional, TextIO
 
 import os
 
@@ -25,15 +28,28 @@ import logging
 import black
 
 from o2a.converter import parser
+from o2a.converter.capacity_planner import (
+    CapacityPlan,
+    load_capacity_profile,
+    plan_capacity,
+    write_pools_file,
+)
 from o2a.converter.constants import HDFS_FOLDER
+from o2a.converter.dag_sharder import DagShard, shard_workflow
+from o2a.converter.manifest import write_manifest
+from o2a.converter.memory_report import MemoryReport
 from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.render_cache import CachedRenderingNode, RenderCache
+from o2a.converter.task_prioritizer import load_task_durations, prioritize_tasks
 from o2a.converter.workflow import Workflow
+from o2a.converter.worker_pool import PrerenderedNode, WorkerPool
+from o2a.converter.workflow_simplifier import simplify_workflow
 from o2a.mappers.action_mapper import ActionMapper
 from o2a.mappers.base_mapper import BaseMapper
 from o2a.utils import el_utils
 from o2a.utils.constants import CONFIGURATION_PROPERTIES, JOB_PROPERTIES
 from o2a.utils.el_utils import comma_separated_string_to_list
-from o2a.utils.template_utils import render_template
+from o2a.utils.template_utils import render_template, stream_template
 
 
 # pylint: disable=too-many-instance-attributes, too-many-arguments
@@ -53,6 +69,16 @@ class OozieConverter:
         start_days_ago: int = None,
         schedule_interval: str = None,
         output_dag_name: str = None,
+        simplify_graph: bool = False,
+        prioritize_critical_path: bool = False,
+        task_durations_file: str = None,
+        action_pools: bool = False,
+        capacity_profile_file: str = None,
+        format_output: bool = True,
+        shard_size: int = None,
+        render_cache: RenderCache = None,
+        memory_report: MemoryReport = None,
+        workers: int = None,
     ):
         """
         :param input_directory_path: Oozie workflow directory.
@@ -61,6 +87,22 @@ class OozieConverter:
         :param start_days_ago: Desired DAG start date, expressed as number of days ago from the present day
         :param schedule_interval: Desired DAG schedule interval, expressed as number of days
         :param dag_name: Desired output DAG name.
+        :param simplify_graph: Whether to remove no-op control tasks and redundant relations.
+        :param prioritize_critical_path: Whether to set priority weights of the tasks by the critical path.
+        :param task_durations_file: JSON file with historical durations of the tasks, implies prioritization.
+        :param action_pools: Whether to run the tasks in per-action-type pools, implies prioritization.
+        :param capacity_profile_file: JSON file with the capacity of the cluster used to size the DAG
+            concurrency and the pools, implies action pools.
+        :param format_output: Whether to format the generated DAG files with black. Black reads
+            the whole file into memory, which can be skipped for very large workflows.
+        :param shard_size: Maximum number of tasks defined in each of the modules of the package
+            imported by the DAG file. If not set, all the tasks are defined in the DAG file.
+        :param render_cache: Cache of the rendered text of the tasks, which can be shared
+            by the conversions of many workflows.
+        :param memory_report: Report to which the snapshots of the memory allocations are added
+            after each phase of the conversion.
+        :param workers: Number of the worker processes converting the nodes and rendering the tasks.
+            If not set, everything is done in the current process.
         """
         # Each OozieParser class corresponds to one workflow, where one can get
         # the workflow's required dependencies (imports), operator relations,
@@ -71,6 +113,20 @@ class OozieConverter:
         self.schedule_interval = schedule_interval
         self.dag_name = dag_name
         self.template_name = template_name
+        self.simplify_graph = simplify_graph
+        self.format_output = format_output
+        self.shard_size = shard_size
+        self.render_cache = render_cache
+        self.memory_report = memory_report
+        self.workers = workers
+        self.rendered_templates: Optional[Dict[str, List[str]]] = None
+        self.capacity_profile_file = capacity_profile_file
+        self.capacity_plan: Optional[CapacityPlan] = None
+        self.action_pools = action_pools or bool(capacity_profile_file)
+        self.task_durations_file = task_durations_file
+        self.prioritize_critical_path = (
+            prioritize_critical_path or bool(task_durations_file) or self.action_pools
+        )
         self.configuration_properties_file = os.path.join(input_directory_path, CONFIGURATION_PROPERTIES)
         self.job_properties_file = os.path.join(input_directory_path, JOB_PROPERTIES)
         self.output_dag_name = (
@@ -78,7 +134,12 @@ class OozieConverter:
             if output_dag_name
             else os.path.join(output_directory_path, self.dag_name) + ".py"
         )
-        params = {"user.name": user or os.environ["USER"]}
+        self.output_pools_file_name = os.path.splitext(self.output_dag_name)[0] + "_pools.json"
+        self.output_manifest_file_name = os.path.splitext(self.output_dag_name)[0] + "_manifest.json"
+        self.output_shards_package_name = (
+            re.sub(r"\W", "_", os.path.splitext(os.path.basename(self.output_dag_name))[0]) + "_tasks"
+        )
+        params = {"user.name": user or getpass.getuser()}
         params = self.add_properties_to_params(params)
         params = el_utils.parse_els(self.configuration_properties_file, params)
         self.params = params
@@ -97,26 +158,70 @@ class OozieConverter:
 
     def convert(self):
         self.parser.parse_workflow()
+        self.snapshot_memory("parse")
 
         workflow = self.parser.workflow
-        self.convert_nodes(workflow.nodes)
+        pool = WorkerPool(self.workers) if self.workers and self.workers > 1 else None
+        try:
+            self.convert_nodes(workflow.nodes, pool=pool)
+            self.snapshot_memory("node conversion")
+            if self.simplify_graph:
+                simplify_workflow(workflow)
+            if self.prioritize_critical_path:
+                durations = (
+                    load_task_durations(self.task_durations_file) if self.task_durations_file else None
+                )
+                prioritize_tasks(workflow, durations=durations, assign_pools=self.action_pools)
+            if self.capacity_profile_file:
+                self.capacity_plan = plan_capacity(
+                    workflow, load_capacity_profile(self.capacity_profile_file)
+                )
+                write_pools_file(self.capacity_plan, self.output_pools_file_name, self.dag_name)
+            if pool:
+                self.render_tasks(workflow, pool)
+        finally:
+            if pool:
+                pool.close()
         self.create_dag_file(workflow)
         self.copy_extra_assets(workflow.nodes)
 
     @staticmethod
-    def convert_nodes(nodes: Dict[str, ParsedNode]):
+    def convert_nodes(nodes: Dict[str, ParsedNode], pool: WorkerPool = None):
         """
         For each Oozie node, converts it into relations and internal relations.
 
         It uses the mapper, which is stored in ParsedNode. The result is saved in ParsedNode.tasks
-        and ParsedNode.relations
+        and ParsedNode.relations. If the pool is given, the nodes are converted in its worker processes.
         """
         logging.info("Converting nodes to tasks and inner relations")
-        for p_node in nodes.values():
-            tasks, relations = p_node.mapper.to_tasks_and_relations()
+        if pool:
+            results = iter(pool.convert_mappers([p_node.mapper for p_node in nodes.values()]))
+        else:
+            results = (p_node.mapper.to_tasks_and_relations() for p_node in nodes.values())
+        for p_node, (tasks, relations) in zip(nodes.values(), results):
             p_node.tasks = tasks
             p_node.relations = relations
 
+    def render_tasks(self, workflow: Workflow, pool: WorkerPool):
+        """
+        Renders the tasks of all the nodes in the worker processes of the pool before the DAG file
+        is written. The tasks found in the render cache are not rendered again.
+        """
+        logging.info("Rendering tasks")
+        tasks = [task for p_node in workflow.nodes.values() for task in p_node.tasks]
+        if self.render_cache:
+            rendered_templates = iter(self.render_cache.render_tasks(tasks, pool.render_tasks))
+        else:
+            rendered_templates = iter(pool.render_tasks(tasks))
+        self.rendered_templates = {
+            name: list(itertools.islice(rendered_templates, len(p_node.tasks)))
+            for name, p_node in workflow.nodes.items()
+        }
+
+    def snapshot_memory(self, phase: str):
+        if self.memory_report:
+            self.memory_report.snapshot(phase)
+
     def add_properties_to_params(self, params: Dict[str, str]):
         """
         Template method, can be overridden.
@@ -127,14 +232,69 @@ class OozieConverter:
         """
         Writes to a file the Apache Oozie parsed workflow in Airflow's DAG format.
         """
+        file_names = []
+        shards = None
+        if self.shard_size:
+            shards = shard_workflow(workflow, self.shard_size)
+            file_names.extend(self.create_shard_files(workflow, shards))
         file_name = self.output_dag_name
         with open(file_name, "w") as file:
             logging.info(f"Saving to file: {file_name}")
-            dag_content = self.render_workflow(workflow)
-            file.write(dag_content)
-        black.format_file_in_place(
-            Path(file_name), mode=black.FileMode(line_length=110), fast=False, write_back=black.WriteBack.YES
-        )
+            self.write_workflow(workflow, file, shards)
+        file_names.append(file_name)
+        self.snapshot_memory("render")
+        if self.format_output:
+            for name in file_names:
+                black.format_file_in_place(
+                    Path(name),
+                    mode=black.FileMode(line_length=110),
+                    fast=False,
+                    write_back=black.WriteBack.YES,
+                )
+            self.snapshot_memory("formatting")
+
+    def create_shard_files(self, workflow: Workflow, shards: List[DagShard]) -> List[str]:
+        """
+        Writes the modules defining the tasks of the DAG to a package next to the DAG file. The package
+        is ignored by Airflow when it looks for DAGs, but it is imported by the DAG file.
+
+        :return: names of the written modules
+        """
+        package_path = os.path.join(os.path.dirname(self.output_dag_name), self.output_shards_package_name)
+        shutil.rmtree(package_path, ignore_errors=True)
+        os.makedirs(package_path)
+        with open(os.path.join(package_path, "__init__.py"), "w") as file:
+            file.write(f'"""Tasks of the {self.dag_name} DAG"""\n')
+        with open(os.path.join(package_path, ".airflowignore"), "w") as file:
+            file.write(".*\n")
+        file_names = []
+        params = self._get_template_params(workflow)
+        global_dependencies = [dependency for dependency in params["dependencies"] if "*" in dependency]
+        dependencies = [dependency for dependency in params["dependencies"] if "*" not in dependency]
+        for shard in shards:
+            file_name = os.path.join(package_path, shard.module_name + ".py")
+            with open(file_name, "w") as file:
+                logging.info(f"Saving to file: {file_name}")
+                stream_template(
+                    template_name="dag_shard.tpl",
+                    params=params["params"],
+                    global_dependencies=global_dependencies,
+                    dependencies=dependencies,
+                    nodes=self._get_nodes_to_render(shard.nodes),
+                    relations=shard.relations,
+                    upstream_relations=shard.upstream_relations,
+                    exported_task_ids=shard.exported_task_ids,
+                ).dump(file)
+            file_names.append(file_name)
+        return file_names
+
+    def create_manifest_file(self) -> Dict[str, str]:
+        """
+        Writes the digests of all the files in the output directory next to the DAG file, so that only
+        the changed files have to be deployed. It has to be called after the whole workflow, including
+        its sub-workflows, is converted.
+        """
+        return write_manifest(self.output_directory_path, self.output_manifest_file_name)
 
     def copy_extra_assets(self, nodes: Dict[str, ParsedNode]):
         """
@@ -151,17 +311,54 @@ class OozieConverter:
         """
         Creates text representation of the workflow.
         """
+        dag_file = render_template(template_name=self.template_name, **self._get_template_params(workflow))
+        return dag_file
+
+    def write_workflow(self, workflow: Workflow, file: TextIO, shards: List[DagShard] = None):
+        """
+        Writes text representation of the workflow to the file while it is being rendered, so that
+        the memory used does not depend on the size of the workflow. If the shards are given,
+        the tasks are created by the modules of the shards instead.
+        """
+        params = self._get_template_params(workflow)
+        if shards is not None:
+            modules = ", ".join(shard.module_name for shard in shards)
+            params.update(
+                nodes=[],
+                relations=[],
+                dependencies=[
+                    *params["dependencies"],
+                    f"from {self.output_shards_package_name} import {modules}",
+                ],
+                shards=shards,
+            )
+        stream_template(template_name=self.template_name, **params).dump(file)
+
+    def _get_template_params(self, workflow: Workflow) -> Dict[str, Any]:
         converted_params: Dict[str, Union[List[str], str]] = {
             x: comma_separated_string_to_list(y) for x, y in self.params.items()
         }
-        dag_file = render_template(
-            template_name=self.template_name,
+        return dict(
             dag_name=self.dag_name,
             schedule_interval=self.schedule_interval,
             start_days_ago=self.start_days_ago,
             params=converted_params,
             relations=workflow.relations,
-            nodes=list(workflow.nodes.values()),
+            nodes=self._get_nodes_to_render(workflow.nodes.values()),
             dependencies=sorted(workflow.dependencies),
+            **self._get_dag_capacity_args(),
+        )
+
+    def _get_nodes_to_render(self, nodes: Iterable[ParsedNode]) -> List[Any]:
+        if self.rendered_templates is not None:
+            return [PrerenderedNode(node, self.rendered_templates[node.mapper.name]) for node in nodes]
+        if self.render_cache:
+            return [CachedRenderingNode(node, self.render_cache) for node in nodes]
+        return list(nodes)
+
+    def _get_dag_capacity_args(self) -> Dict[str, int]:
+        if not self.capacity_plan:
+            return {}
+        return dict(
+            concurrency=self.capacity_plan.concurrency, max_active_runs=self.capacity_plan.max_active_runs
         )
-        return dag_file
@@ -16,6 +16,7 @@
 # noinspection PyPackageRequirements
 from typing import List, Optional
 import logging
+import sys
 
 from airflow.utils.trigger_rule import TriggerRule
 
@@ -25,6 +26,8 @@ from o2a.mappers.base_mapper import BaseMapper
 class ParsedNode:
     """Class for parsed Oozie workflow node"""
 
+    __slots__ = ("mapper", "downstream_names", "is_error", "is_ok", "error_xml", "tasks", "relations")
+
     def __init__(self, mapper: BaseMapper, tasks=None, relations=None):
         from o2a.converter.task import Task
         from o2a.converter.relation import Relation
@@ -42,7 +45,7 @@ class ParsedNode:
         Adds a single downstream name string to the list `downstream_names`.
         :param node_name: The name to append to the list
         """
-        self.downstream_names.append(node_name)
+        self.downstream_names.append(sys.intern(node_name))
 
     def set_error_node_name(self, error_name: str):
         """
@@ -50,7 +53,7 @@ class ParsedNode:
         :param error_name: The downstream error node, Oozie nodes can only have
             one error downstream.
         """
-        self.error_xml = error_name
+        self.error_xml = sys.intern(error_name)
 
     def get_downstreams(self) -> List[str]:
         return self.downstream_names
@@ -19,15 +19,18 @@ import logging
 # noinspection PyPep8Naming
 import xml.etree.ElementTree as ET
 
-import uuid
+import hashlib
 
 # noinspection PyPackageRequirements
-from typing import Type, Dict
+from typing import Dict, List, Optional, Type
 
 from airflow.utils.trigger_rule import TriggerRule
 from o2a.utils import xml_utils
+from o2a.converter.configuration_store import ConfigurationStore, parse_configuration
 from o2a.converter.constants import HDFS_FOLDER
+from o2a.converter.exceptions import ParseException
 from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.graph import Graph
 from o2a.converter.workflow import Workflow
 from o2a.converter.relation import Relation
 from o2a.mappers.action_mapper import ActionMapper
@@ -50,16 +53,25 @@ class OozieParser:
         action_mapper: Dict[str, Type[ActionMapper]],
         control_mapper: Dict[str, Type[BaseMapper]],
         dag_name: str = None,
+        name_prefix: str = "",
     ):
+        """
+        :param name_prefix: Prefix added to the names of all nodes, used to namespace
+            the nodes of a sub-workflow merged into its parent.
+        """
         self.workflow = Workflow(
             dag_name=dag_name,
             input_directory_path=input_directory_path,
             output_directory_path=output_directory_path,
         )
         self.workflow_file = os.path.join(input_directory_path, HDFS_FOLDER, "workflow.xml")
+        self.configuration_store = ConfigurationStore()
         self.params = params
         self.action_map = action_mapper
         self.control_map = control_mapper
+        self.name_prefix = name_prefix
+        self._indexed_root: Optional[ET.Element] = None
+        self._nodes_by_name: Dict[str, List[ET.Element]] = {}
 
     def parse_kill_node(self, kill_node: ET.Element):
         """
@@ -117,7 +129,9 @@ class OozieParser:
             if "path" in node.tag:
                 # Parse all the downstream tasks that can run in parallel.
                 curr_name = node.attrib["start"]
-                paths.append(xml_utils.find_node_by_name(root, curr_name))
+                paths.append(
+                    xml_utils.find_node_by_name(root, curr_name, index=self._get_nodes_by_name(root))
+                )
 
         self.workflow.nodes[fork_name] = p_node
         self.workflow.dependencies.update(mapper.required_imports())
@@ -132,6 +146,14 @@ class OozieParser:
             self.parse_node(root, path)
             if path.attrib["name"] not in self.workflow.nodes:
                 root.remove(path)
+                self._nodes_by_name[path.attrib["name"]].remove(path)
+
+    def _get_nodes_by_name(self, root: ET.Element) -> Dict[str, List[ET.Element]]:
+        # The nodes are indexed once, as searching them for each path of a fork is quadratic
+        if self._indexed_root is not root:
+            self._nodes_by_name = xml_utils.index_nodes_by_attribute(root, "name")
+            self._indexed_root = root
+        return self._nodes_by_name
 
     def parse_join_node(self, join_node):
         """
@@ -214,6 +236,7 @@ class OozieParser:
             control_mapper=self.control_map,
             input_directory_path=self.workflow.input_directory_path,
             output_directory_path=self.workflow.output_directory_path,
+            configuration_store=self.configuration_store,
         )
 
         p_node = ParsedNode(mapper)
@@ -233,6 +256,16 @@ class OozieParser:
 
         self.workflow.nodes[mapper.name] = p_node
 
+    def parse_global_node(self, global_node: ET.Element):
+        """
+        The global section defines the configuration shared by all the actions of the workflow.
+        The configuration of an action overrides the global one.
+        """
+        config = global_node.find("configuration")
+        if config:
+            self.configuration_store.set_global_configuration(parse_configuration(config, self.params))
+            logging.info("Parsed the global configuration.")
+
     def parse_start_node(self, start_node):
         """
         The start node is the entry point for a workflow job, it indicates the
@@ -244,8 +277,10 @@ class OozieParser:
         A workflow definition must have one start node.
         """
         map_class = self.control_map["start"]
+        # The name depends only on the first node, so that each conversion generates the same DAG,
+        # while the start nodes of the sub-workflows merged into the DAG get different names.
         # Theoretically this could cause conflicts, but it is very unlikely
-        start_name = "start_node_" + str(uuid.uuid4())[:4]
+        start_name = "start_node_" + hashlib.sha1(start_node.attrib["to"].encode()).hexdigest()[:4]
         mapper = map_class(oozie_node=start_node, name=start_name)
 
         p_node = ParsedNode(mapper)
@@ -279,6 +314,8 @@ class OozieParser:
             self.parse_join_node(node)
         elif "decision" in node.tag:
             self.parse_decision_node(node)
+        elif "global" in node.tag:
+            self.parse_global_node(node)
 
     def parse_workflow(self):
         """Parses workflow replacing invalid characters in the names of the nodes"""
@@ -289,14 +326,9 @@ class OozieParser:
             node.tag = node.tag.split("}")[1][0:]
 
             # Change names to python syntax
-            if "name" in node.attrib:
-                node.attrib["name"] = node.attrib["name"].replace("-", "_")
-            if "to" in node.attrib:
-                node.attrib["to"] = node.attrib["to"].replace("-", "_")
-            if "error" in node.attrib:
-                node.attrib["error"] = node.attrib["error"].replace("-", "_")
-            if "start" in node.attrib:
-                node.attrib["start"] = node.attrib["start"].replace("-", "_")
+            for attrib in ("name", "to", "error", "start"):
+                if attrib in node.attrib:
+                    node.attrib[attrib] = self.name_prefix + node.attrib[attrib].replace("-", "_")
 
         logging.info("Stripped namespaces, and replaced invalid characters.")
 
@@ -312,39 +344,43 @@ class OozieParser:
 
     def create_relations(self) -> None:
         """
-        Given a dictionary of task_ids and ParsedNodes,
-        returns a set of logical connectives for each task in Airflow.
+        Builds the graphs of the ok and error transitions between the nodes of the workflow
+        and creates the relations between their tasks in one pass.
 
-        :return: Set with strings of task's downstream nodes.
+        :raises ParseException: if a transition refers to a node that does not exist.
         """
         logging.info("Parsing relations between operators.")
-        for p_node in self.workflow.nodes.values():
+        ok_transitions = self.workflow.ok_transitions = Graph(self.workflow.nodes.keys())
+        error_transitions = self.workflow.error_transitions = Graph(self.workflow.nodes.keys())
+        for name, p_node in self.workflow.nodes.items():
             for downstream in p_node.get_downstreams():
-                relation = Relation(
-                    from_task_id=p_node.last_task_id, to_task_id=self.workflow.nodes[downstream].first_task_id
-                )
-                self.workflow.relations.add(relation)
+                self._get_node(downstream, referenced_by=name)
+                ok_transitions.add_edge(name, downstream)
+                self._add_relation(p_node, downstream)
             error_downstream = p_node.get_error_downstream_name()
             if error_downstream:
-                relation = Relation(
-                    from_task_id=p_node.last_task_id,
-                    to_task_id=self.workflow.nodes[error_downstream].first_task_id,
-                )
-                self.workflow.relations.add(relation)
+                self._get_node(error_downstream, referenced_by=name)
+                error_transitions.add_edge(name, error_downstream)
+                self._add_relation(p_node, error_downstream)
+
+    def _get_node(self, name: str, referenced_by: str) -> ParsedNode:
+        p_node = self.workflow.nodes.get(name)
+        if p_node is None:
+            raise ParseException(f"The node {referenced_by} refers to a node that does not exist: {name}")
+        return p_node
+
+    def _add_relation(self, p_node: ParsedNode, downstream: str):
+        relation = Relation(
+            from_task_id=p_node.last_task_id, to_task_id=self.workflow.nodes[downstream].first_task_id
+        )
+        self.workflow.relations.add(relation)
 
     def update_trigger_rules(self) -> None:
         """
-        Updates the trigger rules of each node based on the downstream and
-        error nodes.
+        Updates the trigger rules of each node based on whether it is the ok or error downstream
+        of other nodes in the transition graphs built by `create_relations`.
         """
-        for node in self.workflow.nodes.values():
-            # If a task is referenced  by an "ok to=<task>", flip bit in parsed
-            # node class
-            for downstream in node.get_downstreams():
-                self.workflow.nodes[downstream].set_is_ok(True)
-            error_name = node.get_error_downstream_name()
-            if error_name:
-                # If a task is referenced  by an "error to=<task>", flip
-                # corresponding bit in the parsed node class
-                self.workflow.nodes[error_name].set_is_error(True)
+        for name, node in self.workflow.nodes.items():
+            node.set_is_ok(self.workflow.ok_transitions.in_degree(name) > 0)
+            node.set_is_error(self.workflow.error_transitions.in_degree(name) > 0)
             node.update_trigger_rule()
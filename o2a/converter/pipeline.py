@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pipelined conversion of many workflow applications stored on a slow file system"""
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+from o2a.converter.manifest import SyncReport, sync_files
+from o2a.converter.oozie_converter import OozieConverter
+
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_IO_THREADS = 16
+
+
+class AppConversionResult(NamedTuple):
+    input_directory_path: str
+    output_directory_path: str
+    sync_report: Optional[SyncReport]
+    error: Optional[Exception]
+
+
+def list_files(directory: str) -> List[str]:
+    """
+    Returns the paths of the files in the directory relative to it.
+    """
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(f"The application directory does not exist: {directory}")
+    paths = []
+    for root, _, files in os.walk(directory):
+        paths.extend(os.path.relpath(os.path.join(root, name), directory) for name in files)
+    return sorted(paths)
+
+
+def copy_file(source_path: str, target_path: str):
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    shutil.copyfile(source_path, target_path)
+
+
+class ConversionPipeline:
+    """
+    Converts many workflow applications, overlapping the slow reads and writes of the files with
+    the conversion. Each file access on a file system such as a mounted bucket takes a long time,
+    while the converter reads and writes the files one after another.
+
+    Each application goes through three stages:
+
+    * its files are copied to a local staging directory by many threads at once,
+    * it is converted from the staging directory, one application at a time, as the conversion
+      is bound by the CPU,
+    * the changed output files are copied to the output directory with ``sync_files``, which writes
+      each file at once and skips the files not changed since the previous conversion.
+
+    While an application is being converted, the files of the next ones are already being read
+    and the output of the previous ones is being written. At most ``max_in_flight`` applications
+    are between the stages at the same time, which limits the space used by the staged files.
+    """
+
+    def __init__(
+        self,
+        create_converter: Callable[[str, str, str], OozieConverter],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        io_threads: int = DEFAULT_IO_THREADS,
+        work_directory_path: str = None,
+    ):
+        """
+        :param create_converter: Creates the converter of an application from the paths of the input
+            and the output directories and the name of the DAG.
+        :param max_in_flight: Maximum number of the applications read, converted or written at a time.
+        :param io_threads: Number of the threads reading and writing the files.
+        :param work_directory_path: Local directory of the staged files, a temporary one by default.
+        """
+        self.create_converter = create_converter
+        self.max_in_flight = max_in_flight
+        self.io_threads = io_threads
+        self.work_directory_path = work_directory_path
+
+    def run(self, apps: Sequence[str], output_directory_path: str) -> List[AppConversionResult]:
+        """
+        Converts the applications to the subdirectories of the output directory named after them
+        and returns the results in the order of the applications.
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self.convert_apps(apps, output_directory_path))
+        finally:
+            loop.close()
+
+    async def convert_apps(
+        self, apps: Sequence[str], output_directory_path: str
+    ) -> List[AppConversionResult]:
+        if self.work_directory_path:
+            os.makedirs(self.work_directory_path, exist_ok=True)
+        work_directory_path = tempfile.mkdtemp(prefix="o2a-pipeline", dir=self.work_directory_path)
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+        try:
+            with ThreadPoolExecutor(self.io_threads) as io_executor, ThreadPoolExecutor(1) as cpu_executor:
+                return await asyncio.gather(
+                    *(
+                        self._convert_app(
+                            input_directory_path=app,
+                            output_directory_path=os.path.join(
+                                output_directory_path, os.path.basename(os.path.normpath(app))
+                            ),
+                            staging_directory_path=os.path.join(work_directory_path, str(index)),
+                            in_flight=in_flight,
+                            io_executor=io_executor,
+                            cpu_executor=cpu_executor,
+                        )
+                        for index, app in enumerate(apps)
+                    )
+                )
+        finally:
+            shutil.rmtree(work_directory_path, ignore_errors=True)
+
+    # pylint: disable=too-many-arguments
+    async def _convert_app(
+        self,
+        input_directory_path: str,
+        output_directory_path: str,
+        staging_directory_path: str,
+        in_flight: asyncio.Semaphore,
+        io_executor: ThreadPoolExecutor,
+        cpu_executor: ThreadPoolExecutor,
+    ) -> AppConversionResult:
+        loop = asyncio.get_event_loop()
+        name = os.path.basename(os.path.normpath(input_directory_path))
+        staged_input_path = os.path.join(staging_directory_path, "input", name)
+        staged_output_path = os.path.join(staging_directory_path, "output")
+        async with in_flight:
+            try:
+                files = await loop.run_in_executor(io_executor, list_files, input_directory_path)
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            io_executor,
+                            copy_file,
+                            os.path.join(input_directory_path, path),
+                            os.path.join(staged_input_path, path),
+                        )
+                        for path in files
+                    )
+                )
+                logging.info(f"Read {len(files)} files of {input_directory_path}")
+                converter = await loop.run_in_executor(
+                    cpu_executor, self._convert, staged_input_path, staged_output_path, name
+                )
+                sync_report = await loop.run_in_executor(
+                    io_executor, sync_files, converter.output_manifest_file_name, output_directory_path
+                )
+                logging.info(f"Wrote {len(sync_report.copied)} changed files to {output_directory_path}")
+                return AppConversionResult(input_directory_path, output_directory_path, sync_report, None)
+            except Exception as error:  # pylint: disable=broad-except
+                logging.exception(f"Failed to convert {input_directory_path}")
+                return AppConversionResult(input_directory_path, output_directory_path, None, error)
+            finally:
+                await loop.run_in_executor(io_executor, shutil.rmtree, staging_directory_path, True)
+
+    def _convert(
+        self, input_directory_path: str, output_directory_path: str, dag_name: str
+    ) -> OozieConverter:
+        converter = self.create_converter(input_directory_path, output_directory_path, dag_name)
+        converter.recreate_output_directory()
+        converter.convert()
+        converter.create_manifest_file()
+        return converter
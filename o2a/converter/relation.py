@@ -13,11 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Relation between tasks"""
+import sys
 from typing import NamedTuple
 
 
-class Relation(NamedTuple):
-    """Class for Airflow relation"""
-
+class _Relation(NamedTuple):
     from_task_id: str
     to_task_id: str
+
+
+class Relation(_Relation):
+    """
+    Class for Airflow relation
+
+    The task ids are interned, so that the relations share the ids with the tasks.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, from_task_id: str, to_task_id: str):
+        return super().__new__(cls, sys.intern(from_task_id), sys.intern(to_task_id))
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Set of relations indexed by their source and target tasks"""
+from typing import AbstractSet, Dict, Iterable, Iterator, List, MutableSet
+
+from o2a.converter.relation import Relation
+
+
+class RelationStore(MutableSet):
+    """
+    Set of relations, which keeps the order in which the relations were added and indexes them by
+    the source and the target task, so that the relations of a task are found and removed in time
+    proportional to the number of its relations.
+    """
+
+    __slots__ = ("_relations", "_by_source", "_by_target")
+
+    def __init__(self, relations: Iterable[Relation] = ()):
+        # Dictionaries with no values are used as ordered sets
+        self._relations: Dict[Relation, None] = {}
+        self._by_source: Dict[str, Dict[Relation, None]] = {}
+        self._by_target: Dict[str, Dict[Relation, None]] = {}
+        for relation in relations:
+            self.add(relation)
+
+    def add(self, value: Relation):
+        if value not in self._relations:
+            self._relations[value] = None
+            self._by_source.setdefault(value.from_task_id, {})[value] = None
+            self._by_target.setdefault(value.to_task_id, {})[value] = None
+
+    def discard(self, value: Relation):
+        if value in self._relations:
+            del self._relations[value]
+            self._remove_from_index(self._by_source, value.from_task_id, value)
+            self._remove_from_index(self._by_target, value.to_task_id, value)
+
+    @staticmethod
+    def _remove_from_index(index: Dict[str, Dict[Relation, None]], task_id: str, relation: Relation):
+        relations = index[task_id]
+        del relations[relation]
+        if not relations:
+            del index[task_id]
+
+    def __contains__(self, value) -> bool:
+        return value in self._relations
+
+    def __iter__(self) -> Iterator[Relation]:
+        return iter(self._relations)
+
+    def __len__(self) -> int:
+        return len(self._relations)
+
+    def __repr__(self) -> str:
+        return f"RelationStore({list(self._relations)})"
+
+    def from_task(self, task_id: str) -> List[Relation]:
+        """
+        Returns the relations going out of the task.
+        """
+        return list(self._by_source.get(task_id, ()))
+
+    def to_task(self, task_id: str) -> List[Relation]:
+        """
+        Returns the relations coming into the task.
+        """
+        return list(self._by_target.get(task_id, ()))
+
+    def remove_from_task(self, task_id: str, keep: AbstractSet[str] = frozenset()):
+        """
+        Removes the relations going out of the task, except the ones going to the tasks in ``keep``.
+        """
+        for relation in self.from_task(task_id):
+            if relation.to_task_id not in keep:
+                self.discard(relation)
+
+    def remove_to_task(self, task_id: str, keep: AbstractSet[str] = frozenset()):
+        """
+        Removes the relations coming into the task, except the ones coming from the tasks in ``keep``.
+        """
+        for relation in self.to_task(task_id):
+            if relation.from_task_id not in keep:
+                self.discard(relation)
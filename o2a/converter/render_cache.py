@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent cache of the rendered tasks shared between conversions"""
+import functools
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import time
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Set
+
+from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.definitions import TPL_PATH
+
+CACHE_FILE_NAME = "o2a-cache.sqlite"
+
+DEFAULT_MAX_SIZE = 256 * 2 ** 20
+
+# Number of the new entries written before they are committed
+COMMIT_INTERVAL = 1000
+
+# Stands for the task id in the cached texts, so that the same actions of differently named nodes,
+# also in other workflows, share the entries
+TASK_ID_PLACEHOLDER = "__o2a_task_id__"
+
+# The task ids replaced by the placeholder are made of the same characters, so that the templates
+# escape them in the same way
+REPLACEABLE_TASK_ID_MATCH = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+@functools.lru_cache(maxsize=None)
+def get_templates_digest() -> str:
+    """
+    Returns the digest of the templates, so that the texts rendered by a different version
+    of the templates are not used.
+    """
+    digest = hashlib.sha256()
+    for file_name in sorted(os.listdir(TPL_PATH)):
+        digest.update(file_name.encode())
+        with open(os.path.join(TPL_PATH, file_name), "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def get_task_key(task: Task) -> Optional[str]:
+    """
+    Returns the key of the rendered text of the task, or None if it cannot be cached
+    because a template parameter has no stable text representation.
+    """
+    content = repr(
+        (get_templates_digest(), task.template_name, task.task_id, task.trigger_rule, task.template_params)
+    )
+    if " object at 0x" in content:
+        return None
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _replace_text(value: Any, old: str, new: str) -> Any:
+    if isinstance(value, str):
+        return value.replace(old, new)
+    if isinstance(value, list):
+        return [_replace_text(item, old, new) for item in value]
+    if type(value) is tuple:  # pylint: disable=unidiomatic-typecheck
+        return tuple(_replace_text(item, old, new) for item in value)
+    if isinstance(value, dict):
+        return {_replace_text(key, old, new): _replace_text(item, old, new) for key, item in value.items()}
+    return value
+
+
+def get_generic_task(task: Task) -> Task:
+    """
+    Returns the task with its id replaced by the placeholder, also in the template parameters,
+    so that its rendered text does not depend on the name of the node. The task is returned
+    unchanged if the id cannot be replaced back in the rendered text reliably.
+    """
+    task_id = task.task_id
+    if not REPLACEABLE_TASK_ID_MATCH.fullmatch(task_id) or TASK_ID_PLACEHOLDER in repr(task.template_params):
+        return task
+    template_params = _replace_text(task.template_params, task_id, TASK_ID_PLACEHOLDER)
+    # The id is kept by the parameters which are neither texts nor containers
+    if task_id in repr(template_params):
+        return task
+    return Task(
+        task_id=TASK_ID_PLACEHOLDER,
+        template_name=task.template_name,
+        trigger_rule=task.trigger_rule,
+        template_params=template_params,
+    )
+
+
+class RenderCache:
+    """
+    Persistent cache of the rendered text of the tasks, shared by the conversions of many workflows,
+    so that the tasks of the actions converted before are not rendered again. The key of a task
+    is built from everything passed to its template, with the task id replaced by a placeholder,
+    which is substituted back after the lookup.
+
+    The cache is stored in an SQLite database. When it is closed, the least recently used entries
+    are removed to keep the total size of the entries under ``max_size`` bytes.
+    """
+
+    def __init__(self, path: str, max_size: int = DEFAULT_MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._used_keys: Set[str] = set()
+        self._uncommitted_entries = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=60)
+        # The space of the removed entries is given back, so that the size of the file is bounded too
+        self._connection.execute("PRAGMA auto_vacuum = FULL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._connection.commit()
+
+    def __enter__(self) -> "RenderCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used_keys.add(key)
+        return row[0]
+
+    def put(self, key: str, value: bytes):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+            (key, value, len(key) + len(value), time.time()),
+        )
+        self._uncommitted_entries += 1
+        # The other conversions cannot write to the database until the entries are committed
+        if self._uncommitted_entries >= COMMIT_INTERVAL:
+            self._connection.commit()
+            self._uncommitted_entries = 0
+
+    def render_task(self, task: Task) -> str:
+        """
+        Returns the rendered text of the task, from the cache if the same task was rendered before.
+        """
+        generic_task = get_generic_task(task)
+        key = get_task_key(generic_task)
+        if key is None:
+            return task.rendered_template
+        value = self.get(key)
+        if value is None:
+            value = generic_task.rendered_template.encode()
+            self.put(key, value)
+        return value.decode().replace(generic_task.task_id, task.task_id)
+
+    def render_tasks(self, tasks: Sequence[Task], render: Callable[[List[Task]], List[str]]) -> List[str]:
+        """
+        Returns the rendered texts of the tasks in their order. The tasks missing in the cache
+        are rendered all at once by ``render``, e.g. in a pool of worker processes.
+        """
+        generic_tasks = [get_generic_task(task) for task in tasks]
+        keys = [get_task_key(generic_task) for generic_task in generic_tasks]
+        values = [self.get(key) if key is not None else None for key in keys]
+        missing = [index for index, value in enumerate(values) if value is None]
+        rendered_templates = [value.decode() if value is not None else "" for value in values]
+        for index, rendered_template in zip(missing, render([generic_tasks[index] for index in missing])):
+            rendered_templates[index] = rendered_template
+            if keys[index] is not None:
+                self.put(keys[index], rendered_template.encode())
+        return [
+            rendered_template.replace(generic_task.task_id, task.task_id)
+            for rendered_template, generic_task, task in zip(rendered_templates, generic_tasks, tasks)
+        ]
+
+    def close(self):
+        """
+        Marks the used entries and removes the least recently used entries exceeding the size
+        of the cache.
+        """
+        now = time.time()
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE entries SET last_used = ? WHERE key = ?", ((now, key) for key in self._used_keys)
+            )
+            self._trim()
+        logging.info(f"Render cache {self.path}: {self.hits} hits, {self.misses} misses")
+        self._connection.close()
+
+    def _trim(self):
+        size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if size <= self.max_size:
+            return
+        removed_keys = []
+        for key, entry_size in self._connection.execute("SELECT key, size FROM entries ORDER BY last_used"):
+            if size <= self.max_size:
+                break
+            removed_keys.append((key,))
+            size -= entry_size
+        self._connection.executemany("DELETE FROM entries WHERE key = ?", removed_keys)
+
+
+class CachedRenderingNode:
+    """
+    Node of the workflow passed to the templates, which renders its tasks using the cache.
+    """
+
+    __slots__ = ("node", "cache")
+
+    def __init__(self, node: ParsedNode, cache: RenderCache):
+        self.node = node
+        self.cache = cache
+
+    @property
+    def tasks(self) -> Iterator["CachedRenderingTask"]:
+        return (CachedRenderingTask(task, self.cache) for task in self.node.tasks)
+
+    @property
+    def relations(self) -> List[Relation]:
+        return self.node.relations
+
+
+class CachedRenderingTask:
+    """
+    Task passed to the templates, which takes its rendered text from the cache.
+    """
+
+    __slots__ = ("task", "cache")
+
+    def __init__(self, task: Task, cache: RenderCache):
+        self.task = task
+        self.cache = cache
+
+    @property
+    def rendered_template(self) -> str:
+        return self.cache.render_task(self.task)
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Representation of Airflow tasks"""
+import sys
 from typing import Dict, Any
 
 from airflow.utils.trigger_rule import TriggerRule
@@ -22,14 +23,21 @@ from o2a.utils.template_utils import render_template
 
 # This is a container for data, so it does not contain public methods intentionally.
 class Task:  # pylint: disable=too-few-public-methods
-    """Class for Airflow Task"""
+    """
+    Class for Airflow Task
+
+    The task ids are interned, so that the relations and the tasks of large workflows share
+    a single copy of each id.
+    """
+
+    __slots__ = ("task_id", "template_name", "trigger_rule", "template_params")
 
     task_id: str
     template_name: str
     template_params: Dict[str, Any]
 
     def __init__(self, task_id, template_name, trigger_rule=TriggerRule.DUMMY, template_params=None):
-        self.task_id = task_id
+        self.task_id = sys.intern(task_id)
         self.template_name = template_name
         self.trigger_rule = trigger_rule
         self.template_params = template_params or {}
@@ -51,5 +59,5 @@ class Task:  # pylint: disable=too-few-public-methods
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
         return False
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Assigns priority weights and pools to the tasks based on the critical path of the workflow"""
+import json
+import logging
+import math
+from typing import Dict, List, Optional
+
+from o2a.converter.exceptions import O2AException
+from o2a.converter.graph import build_task_graph
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+
+# Estimated duration in seconds of the task generated from the template
+DEFAULT_TASK_COSTS: Dict[str, float] = {
+    "dummy": 0,
+    "decision": 1,
+    "kill": 1,
+    "prepare": 30,
+    "fs_op": 30,
+    "git": 60,
+    "ssh": 60,
+    "shell": 60,
+    "pig": 300,
+    "mapreduce": 600,
+    "spark": 600,
+    "subwf": 900,
+}
+UNKNOWN_TASK_COST = 60
+
+# Tasks generated from these templates do not run any job, so they are not put into pools
+CONTROL_ACTION_TYPES = {"dummy", "decision", "kill"}
+
+POOL_NAME_PREFIX = "o2a_"
+
+
+def get_action_type(task: Task) -> str:
+    """
+    Returns the type of the action the task was generated for, e.g. "spark" for "spark.tpl".
+    """
+    action_type, _, _ = task.template_name.rpartition(".tpl")
+    return action_type or task.template_name
+
+
+def get_pool_name(action_type: str) -> Optional[str]:
+    """
+    Returns the name of the pool for the tasks of the action type or None for control tasks.
+    """
+    if action_type in CONTROL_ACTION_TYPES:
+        return None
+    return POOL_NAME_PREFIX + action_type
+
+
+def load_task_durations(durations_file: str) -> Dict[str, float]:
+    """
+    Loads historical durations of the tasks from a JSON file. The file contains a single object,
+    which maps task ids to their duration in seconds, e.g. ``{"pig_node": 420.5}``.
+    """
+    with open(durations_file, "r") as file:
+        durations = json.load(file)
+    if not isinstance(durations, dict):
+        raise O2AException(f"The durations file should contain a JSON object: {durations_file}")
+    return {task_id: float(duration) for task_id, duration in durations.items()}
+
+
+def prioritize_tasks(
+    workflow: Workflow, durations: Dict[str, float] = None, assign_pools: bool = False
+) -> List[str]:
+    """
+    Sets ``priority_weight`` of each task to the estimated length of the longest path from the task
+    to the end of the workflow, so that the scheduler starts the tasks on the critical path first.
+    Optionally assigns each task to the pool of its action type.
+
+    The cost of a task is taken from ``durations`` if it is known, otherwise the static estimate
+    for the action type is used. It has to be called after the nodes are converted to tasks.
+
+    :return: ids of the tasks on the critical path.
+    """
+    durations = durations or {}
+    tasks: Dict[str, Task] = {task.task_id: task for node in workflow.nodes.values() for task in node.tasks}
+    graph = build_task_graph(workflow)
+
+    path_costs: Dict[str, float] = {}
+    next_on_path: Dict[str, Optional[str]] = {}
+    for task_id in reversed(graph.topological_order()):
+        cost = durations.get(
+            task_id, DEFAULT_TASK_COSTS.get(get_action_type(tasks[task_id]), UNKNOWN_TASK_COST)
+        )
+        next_task_id = max(graph.downstream(task_id), key=lambda t_id: (path_costs[t_id], t_id), default=None)
+        path_costs[task_id] = cost + (path_costs[next_task_id] if next_task_id else 0)
+        next_on_path[task_id] = next_task_id
+
+    for task_id, task in tasks.items():
+        # Airflow requires at least 1 and by default adds the weights of all downstream tasks,
+        # the "absolute" weight rule makes it use the weight of the path computed here.
+        task.template_params["priority_weight"] = max(int(math.ceil(path_costs[task_id])), 1)
+        task.template_params["weight_rule"] = "absolute"
+        if assign_pools:
+            task.template_params["pool"] = get_pool_name(get_action_type(task))
+
+    critical_path: List[str] = []
+    current_task_id = max(graph.roots(), key=lambda t_id: (path_costs[t_id], t_id), default=None)
+    while current_task_id:
+        critical_path.append(current_task_id)
+        current_task_id = next_on_path[current_task_id]
+    if critical_path:
+        logging.info(
+            f"Critical path ({path_costs[critical_path[0]]:.0f}s estimated): {' -> '.join(critical_path)}"
+        )
+    return critical_path
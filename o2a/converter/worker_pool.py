@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Conversion and rendering of the nodes in a pool of worker processes"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, List, Sequence, Set, Tuple, TypeVar
+
+from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.mappers.base_mapper import BaseMapper
+
+# Number of the chunks of the work sent to each worker, more chunks balance the load better
+# at the cost of more messages between the processes
+CHUNKS_PER_WORKER = 4
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def convert_mapper(mapper: BaseMapper) -> Tuple[List[Task], Set[Relation]]:
+    return mapper.to_tasks_and_relations()
+
+
+def render_task(task: Task) -> str:
+    return task.rendered_template
+
+
+class WorkerPool:
+    """
+    Pool of the worker processes converting the nodes and rendering the tasks. The mappers
+    and the tasks are sent to the workers, so they have to be picklable. The results are returned
+    in the order of the work items, so that the output does not depend on the number of the workers.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def map(self, function: Callable[[T], R], items: Sequence[T]) -> List[R]:
+        chunk_size = max(1, len(items) // (self.workers * CHUNKS_PER_WORKER))
+        return list(self._executor.map(function, items, chunksize=chunk_size))
+
+    def convert_mappers(self, mappers: Sequence[BaseMapper]) -> List[Tuple[List[Task], Set[Relation]]]:
+        return self.map(convert_mapper, mappers)
+
+    def render_tasks(self, tasks: Sequence[Task]) -> List[str]:
+        return self.map(render_task, tasks)
+
+    def close(self):
+        self._executor.shutdown()
+
+
+class PrerenderedNode:
+    """
+    Node of the workflow passed to the templates, whose tasks were rendered before.
+    """
+
+    __slots__ = ("node", "rendered_templates")
+
+    def __init__(self, node: ParsedNode, rendered_templates: List[str]):
+        self.node = node
+        self.rendered_templates = rendered_templates
+
+    @property
+    def tasks(self) -> Iterator["PrerenderedTask"]:
+        return (PrerenderedTask(text) for text in self.rendered_templates)
+
+    @property
+    def relations(self) -> List[Relation]:
+        return self.node.relations
+
+
+class PrerenderedTask:
+    """
+    Task passed to the templates with its rendered text.
+    """
+
+    __slots__ = ("rendered_template",)
+
+    def __init__(self, rendered_template: str):
+        self.rendered_template = rendered_template
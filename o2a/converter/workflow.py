@@ -14,20 +14,34 @@
 # limitations under the License.
 """Workflow"""
 from collections import OrderedDict
-from typing import Optional, Set, Dict
+from typing import Iterable, Optional, Set, Dict
 
 from o2a.converter.parsed_node import ParsedNode
 from o2a.converter.relation import Relation
+from o2a.converter.relation_store import RelationStore
 
 
 # This is a container for data, so it does not contain public methods intentionally.
 class Workflow:  # pylint: disable=too-few-public-methods
     """Class for Workflow"""
 
+    __slots__ = (
+        "dag_name",
+        "input_directory_path",
+        "output_directory_path",
+        "_relations",
+        "nodes",
+        "dependencies",
+        "ok_transitions",
+        "error_transitions",
+    )
+
+    # The transition graphs are derived from the nodes while parsing, so they are not compared.
+    _COMPARED_SLOTS = __slots__[:-2]
+
     dag_name: Optional[str]
     input_directory_path: str
     output_directory_path: str
-    relations: Set[Relation]
     nodes: Dict[str, ParsedNode]
     dependencies: Set[str]  # TODO: Check is set likely maintain insertion order (Python 3.6 ?)
 
@@ -40,10 +54,13 @@ class Workflow:  # pylint: disable=too-few-public-methods
         nodes=None,
         dependencies=None,
     ) -> None:
+        # Avoid circular dependencies
+        from o2a.converter.graph import Graph
+
         self.input_directory_path = input_directory_path
         self.output_directory_path = output_directory_path
         self.dag_name = dag_name
-        self.relations = relations or set()
+        self.relations = relations or ()
         # Dictionary is ordered purely for output being somewhat ordered the
         # same as how Oozie workflow was parsed.
         self.nodes = nodes or OrderedDict()
@@ -58,6 +75,20 @@ class Workflow:  # pylint: disable=too-few-public-methods
             "from o2a.o2a_libs.el_wf_functions import * ",
             "from airflow.utils import dates",
         }
+        # Graphs of the ok and error transitions between the nodes, built by the parser.
+        self.ok_transitions = Graph()
+        self.error_transitions = Graph()
+
+    @property
+    def relations(self) -> RelationStore:
+        """
+        Relations between the nodes of the workflow, indexed by the source and the target task.
+        """
+        return self._relations
+
+    @relations.setter
+    def relations(self, relations: Iterable[Relation]):
+        self._relations = relations if isinstance(relations, RelationStore) else RelationStore(relations)
 
     def __repr__(self) -> str:
         return (
@@ -68,5 +99,5 @@ class Workflow:  # pylint: disable=too-few-public-methods
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return all(getattr(self, name) == getattr(other, name) for name in self._COMPARED_SLOTS)
         return False
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Removes no-op control tasks and redundant relations from the converted workflow"""
+import logging
+from collections import defaultdict
+from typing import Dict, NamedTuple, Set
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.decision_mapper import DecisionMapper
+
+NOOP_TEMPLATE_NAME = "dummy.tpl"
+
+# Trigger rules of a task that still behaves the same when its only upstream - a no-op task
+# that always succeeds - is removed and the task becomes a root task of the DAG.
+ROOT_SAFE_TRIGGER_RULES = {
+    TriggerRule.ALL_SUCCESS,
+    TriggerRule.ONE_SUCCESS,
+    TriggerRule.ALL_DONE,
+    TriggerRule.DUMMY,
+}
+
+# Trigger rules of a task that are not affected by removing one of its upstream tasks
+# when that upstream task always succeeds.
+SUCCESS_NEUTRAL_TRIGGER_RULES = {
+    TriggerRule.ALL_SUCCESS,
+    TriggerRule.ALL_DONE,
+    TriggerRule.ONE_FAILED,
+    TriggerRule.DUMMY,
+}
+
+
+class SimplificationReport(NamedTuple):
+    """Size of the workflow before and after the simplification"""
+
+    tasks_before: int
+    tasks_after: int
+    relations_before: int
+    relations_after: int
+
+
+def simplify_workflow(workflow: Workflow) -> SimplificationReport:
+    """
+    Removes pass-through control tasks (fork, join, end and other dummy tasks) from the converted
+    workflow, rewires their relations and then removes relations that are implied by other paths.
+
+    It has to be called after the nodes are converted to tasks. Nodes are removed only when
+    the behaviour of the DAG does not change - their upstream and downstream tasks are wired
+    directly and trigger rules are adjusted where needed. Targets of decision nodes are never
+    removed, because the decision refers to them by name.
+    """
+    tasks_before = _count_tasks(workflow)
+    relations_before = _count_relations(workflow)
+
+    simplifier = _WorkflowSimplifier(workflow)
+    simplifier.remove_noop_nodes()
+    simplifier.reduce_relations()
+
+    report = SimplificationReport(
+        tasks_before=tasks_before,
+        tasks_after=_count_tasks(workflow),
+        relations_before=relations_before,
+        relations_after=_count_relations(workflow),
+    )
+    logging.info(
+        f"Simplified workflow: {report.tasks_before} -> {report.tasks_after} tasks, "
+        f"{report.relations_before} -> {report.relations_after} relations."
+    )
+    return report
+
+
+def _count_tasks(workflow: Workflow) -> int:
+    return sum(len(node.tasks) for node in workflow.nodes.values())
+
+
+def _count_relations(workflow: Workflow) -> int:
+    return len(workflow.relations) + sum(len(node.relations) for node in workflow.nodes.values())
+
+
+def _is_noop_node(node: ParsedNode) -> bool:
+    return len(node.tasks) == 1 and not node.relations and node.tasks[0].template_name == NOOP_TEMPLATE_NAME
+
+
+class _WorkflowSimplifier:
+    """Keeps the task graph of the workflow indexed while it is being modified"""
+
+    def __init__(self, workflow: Workflow):
+        self.workflow = workflow
+        self.tasks: Dict[str, Task] = {
+            task.task_id: task for node in workflow.nodes.values() for task in node.tasks
+        }
+        self.decision_task_ids: Set[str] = {
+            node.last_task_id for node in workflow.nodes.values() if isinstance(node.mapper, DecisionMapper)
+        }
+        self.upstream: Dict[str, Set[str]] = defaultdict(set)
+        self.downstream: Dict[str, Set[str]] = defaultdict(set)
+        for node in workflow.nodes.values():
+            for relation in node.relations:
+                self._index(relation)
+        for relation in workflow.relations:
+            self._index(relation)
+
+    def _index(self, relation: Relation):
+        self.downstream[relation.from_task_id].add(relation.to_task_id)
+        self.upstream[relation.to_task_id].add(relation.from_task_id)
+
+    def _add_relation(self, from_task_id: str, to_task_id: str):
+        relation = Relation(from_task_id=from_task_id, to_task_id=to_task_id)
+        self.workflow.relations.add(relation)
+        self._index(relation)
+
+    def _remove_relation(self, from_task_id: str, to_task_id: str):
+        self.workflow.relations.discard(Relation(from_task_id=from_task_id, to_task_id=to_task_id))
+        self.downstream[from_task_id].discard(to_task_id)
+        self.upstream[to_task_id].discard(from_task_id)
+
+    def _trigger_rule(self, task_id: str) -> str:
+        return self.tasks[task_id].trigger_rule
+
+    def remove_noop_nodes(self):
+        """
+        Removes no-op nodes until none of the remaining ones can be removed safely.
+        """
+        changed = True
+        while changed:
+            changed = False
+            for name, node in list(self.workflow.nodes.items()):
+                if _is_noop_node(node) and self._bypass_task(node.tasks[0]):
+                    logging.info(f"Removed no-op task: {node.tasks[0].task_id}")
+                    del self.workflow.nodes[name]
+                    changed = True
+
+    def _bypass_task(self, task: Task) -> bool:
+        """
+        Wires the upstream tasks of the no-op task directly to its downstream tasks.
+
+        :return: True if the task can be removed, False if it has to stay in the workflow.
+        """
+        task_id = task.task_id
+        # The relations are sorted, so that the relations added in their place are always the same
+        upstream = sorted(self.upstream[task_id])
+        downstream = sorted(self.downstream[task_id])
+
+        if self.decision_task_ids.intersection(upstream):
+            return False
+
+        if len(upstream) == 1 and task.trigger_rule == TriggerRule.ALL_SUCCESS:
+            # The task succeeds, fails or is skipped exactly when its only upstream does.
+            (upstream_task_id,) = upstream
+            for downstream_task_id in downstream:
+                self._add_relation(upstream_task_id, downstream_task_id)
+        elif len(downstream) == 1 and self._is_only_upstream(task_id, downstream[0]):
+            # The only downstream task inherits the trigger rule of the removed task.
+            (downstream_task_id,) = downstream
+            downstream_task = self.tasks[downstream_task_id]
+            if downstream_task.trigger_rule == TriggerRule.ALL_SUCCESS:
+                downstream_task.trigger_rule = task.trigger_rule
+            elif downstream_task.trigger_rule != TriggerRule.DUMMY:
+                return False
+            for upstream_task_id in upstream:
+                self._add_relation(upstream_task_id, downstream_task_id)
+        elif not upstream:
+            # A root no-op task always succeeds, so it can be dropped if none of its downstream
+            # tasks depends on that.
+            if not all(self._survives_root_removal(task_id, d_task_id) for d_task_id in downstream):
+                return False
+        else:
+            return False
+
+        for upstream_task_id in upstream:
+            self._remove_relation(upstream_task_id, task_id)
+        for downstream_task_id in downstream:
+            self._remove_relation(task_id, downstream_task_id)
+        return True
+
+    def _is_only_upstream(self, task_id: str, downstream_task_id: str) -> bool:
+        return self.upstream[downstream_task_id] == {task_id}
+
+    def _survives_root_removal(self, task_id: str, downstream_task_id: str) -> bool:
+        trigger_rule = self._trigger_rule(downstream_task_id)
+        if self._is_only_upstream(task_id, downstream_task_id):
+            return trigger_rule in ROOT_SAFE_TRIGGER_RULES
+        return trigger_rule in SUCCESS_NEUTRAL_TRIGGER_RULES
+
+    def reduce_relations(self):
+        """
+        Transitive reduction of the relations between nodes.
+
+        A relation A -> C is removed if there is another path A -> B -> ... -> C and every task
+        on that path, as well as C, uses the ALL_SUCCESS trigger rule. The success of such path
+        implies the success of A, so the direct relation does not change when C is triggered.
+        Relations of decision tasks are kept, as branching skips only the direct downstream tasks.
+        """
+        for relation in sorted(self.workflow.relations):
+            from_task_id, to_task_id = relation
+            if from_task_id in self.decision_task_ids:
+                continue
+            if self._trigger_rule(to_task_id) != TriggerRule.ALL_SUCCESS:
+                continue
+            if self._has_indirect_path(from_task_id, to_task_id):
+                self._remove_relation(from_task_id, to_task_id)
+
+    def _has_indirect_path(self, from_task_id: str, to_task_id: str) -> bool:
+        stack = [
+            task_id
+            for task_id in self.downstream[from_task_id]
+            if task_id != to_task_id and self._trigger_rule(task_id) == TriggerRule.ALL_SUCCESS
+        ]
+        visited = set(stack)
+        while stack:
+            current_task_id = stack.pop()
+            for task_id in self.downstream[current_task_id]:
+                if task_id == to_task_id:
+                    return True
+                if task_id not in visited and self._trigger_rule(task_id) == TriggerRule.ALL_SUCCESS:
+                    visited.add(task_id)
+                    stack.append(task_id)
+        return False
@@ -13,11 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Base class for all action nappers"""
-from typing import Dict
+import logging
+import os
+from typing import List, Mapping, Optional
+from urllib.parse import urlparse
+from xml.etree.ElementTree import Element
 
-from o2a.mappers.base_mapper import BaseMapper
+from airflow.utils.trigger_rule import TriggerRule
 
-from o2a.utils import xml_utils, el_utils
+from o2a.converter.configuration_store import ConfigurationStore, ConfigurationView, parse_configuration
+from o2a.converter.constants import HDFS_FOLDER
+from o2a.mappers.base_mapper import BaseMapper
+from o2a.utils import el_utils, xml_utils
 
 
 # pylint: disable=abstract-method
@@ -25,16 +32,72 @@ from o2a.utils import xml_utils, el_utils
 class ActionMapper(BaseMapper):
     """Base class for all action mappers"""
 
-    properties: Dict[str, str] = {}
+    properties: ConfigurationView
+
+    def __init__(
+        self,
+        oozie_node: Element,
+        name: str,
+        trigger_rule=TriggerRule.ALL_SUCCESS,
+        configuration_store: ConfigurationStore = None,
+        input_directory_path: str = None,
+        **kwargs,
+    ):
+        """
+        :param configuration_store: Configuration shared by the actions of the workflow, a new one
+            is created if the mapper is used on its own.
+        :param input_directory_path: Oozie workflow application directory, against which the relative
+            paths of the job-xml files are resolved.
+        """
+        BaseMapper.__init__(self, oozie_node=oozie_node, name=name, trigger_rule=trigger_rule, **kwargs)
+        self.configuration_store = configuration_store or ConfigurationStore()
+        self.input_directory_path = input_directory_path
+        self.properties = self.configuration_store.get_configuration()
 
     def _parse_config(self):
+        config_blocks = self._parse_job_xmls()
         config = self.oozie_node.find("configuration")
         if config:
-            property_nodes = xml_utils.find_nodes_by_tag(config, "property")
-            if property_nodes:
-                for node in property_nodes:
-                    name = node.find("name").text
-                    value = el_utils.replace_el_with_var(
-                        node.find("value").text, params=self.params, quote=False
-                    )
-                    self.properties[name] = value
+            config_blocks.append(parse_configuration(config, self.params))
+        if config_blocks:
+            self.properties = self.configuration_store.get_configuration(*config_blocks)
+
+    def _parse_job_xmls(self) -> List[Mapping[str, str]]:
+        """
+        Returns the configuration blocks of the job-xml files of the action in their order.
+        """
+        config_blocks = []
+        for node in xml_utils.find_nodes_by_tag(self.oozie_node, "job-xml"):
+            path = self._get_job_xml_path(node.text)
+            if path is None:
+                logging.warning(
+                    f"The job-xml file {node.text} of the action {self.name} is not found. Skipping."
+                )
+                continue
+            config_blocks.append(self.configuration_store.get_job_xml_configuration(path, self.params))
+        return config_blocks
+
+    def _get_job_xml_path(self, path: str) -> Optional[str]:
+        """
+        Returns the local path of the job-xml file or None if it does not exist.
+
+        The relative paths are resolved against the hdfs folder of the application. The absolute
+        paths and the HDFS URIs point to the HDFS, where the location of the application is not known,
+        so they are mapped to the longest of their suffixes, which exists in the hdfs folder.
+        """
+        path = el_utils.replace_el_with_var(path.strip(), params=self.params, quote=False)
+        url = urlparse(path)
+        if url.scheme:
+            path = url.path
+        if not self.input_directory_path:
+            return path if os.path.isfile(path) else None
+        hdfs_folder_path = os.path.join(self.input_directory_path, HDFS_FOLDER)
+        if not os.path.isabs(path):
+            path = os.path.join(hdfs_folder_path, path)
+            return path if os.path.isfile(path) else None
+        parts = path.strip("/").split("/")
+        for index in range(len(parts)):
+            local_path = os.path.join(hdfs_folder_path, *parts[index:])
+            if os.path.isfile(local_path):
+                return local_path
+        return None
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Base mapper - it is a base class for all mappers actions, and logic alike"""
+import sys
 from typing import Set, Tuple, List
 from xml.etree.ElementTree import Element
 
@@ -38,7 +39,7 @@ class BaseMapper:
             params = {}
         self.params = params
         self.oozie_node = oozie_node
-        self.name = name
+        self.name = sys.intern(name)
         self.trigger_rule = trigger_rule
 
     def to_tasks_and_relations(self) -> Tuple[List[Task], List[Relation]]:
@@ -19,10 +19,11 @@ from xml.etree.ElementTree import Element
 
 from airflow.utils.trigger_rule import TriggerRule
 
+from o2a.converter.exceptions import ParseException
 from o2a.converter.task import Task
 from o2a.converter.relation import Relation
 from o2a.mappers.base_mapper import BaseMapper
-from o2a.utils.el_utils import convert_el_to_jinja
+from o2a.utils.el_utils import NESTED_FN_MATCH, WF_EL_FUNCTIONS, convert_el_to_jinja
 
 
 # noinspection PyAbstractClass
@@ -79,11 +80,22 @@ class DecisionMapper(BaseMapper):
         self.case_dict = collections.OrderedDict()
         for case in switch_node:
             if "case" in case.tag:
+                self._check_no_wf_functions(case.text)
                 case_text = convert_el_to_jinja(case.text.strip(), quote=True)
                 self.case_dict[case_text] = case.attrib["to"]
             else:  # Default return value
                 self.case_dict["default"] = case.attrib["to"]
 
+    def _check_no_wf_functions(self, condition: str):
+        # The WF EL functions return templates rendered only in the templated fields of the
+        # operators, so in a condition they would always be true
+        wf_functions = [name for name in NESTED_FN_MATCH.findall(condition) if name in WF_EL_FUNCTIONS]
+        if wf_functions:
+            raise ParseException(
+                f"The WF EL functions are not supported in the conditions of the decision {self.name}: "
+                f"{', '.join(wf_functions)}"
+            )
+
     def to_tasks_and_relations(self):
         tasks = [
             Task(
@@ -23,15 +23,9 @@ class EndMapper(DummyMapper):
         decision_node_ids = {
             node.last_task_id for node in workflow.nodes.values() if isinstance(node.mapper, DecisionMapper)
         }
-        upstream_task_ids = {
-            relation.from_task_id for relation in workflow.relations if relation.to_task_id == self.name
-        }
+        upstream_task_ids = {relation.from_task_id for relation in workflow.relations.to_task(self.name)}
 
         if not decision_node_ids.intersection(upstream_task_ids):
             del workflow.nodes[self.name]
 
-        workflow.relations -= {
-            relation
-            for relation in workflow.relations
-            if relation.to_task_id == self.name and relation.from_task_id not in decision_node_ids
-        }
+        workflow.relations.remove_to_task(self.name, keep=decision_node_ids)
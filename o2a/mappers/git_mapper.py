@@ -21,7 +21,6 @@ from urllib.parse import urlparse
 
 from airflow.utils.trigger_rule import TriggerRule
 
-from o2a.converter.relation import Relation
 from o2a.converter.task import Task
 from o2a.mappers.action_mapper import ActionMapper
 from o2a.mappers.prepare_mixin import PrepareMixin
@@ -87,30 +86,14 @@ class GitMapper(ActionMapper, PrepareMixin):
         )
 
     def to_tasks_and_relations(self):
-        tasks = [
-            Task(
-                task_id=self.name,
-                template_name="git.tpl",
-                template_params=dict(bash_command=self.bash_command),
-            )
-        ]
-        relations = []
-        if self.has_prepare(self.oozie_node):
-            prepare_command = self.get_prepare_command(self.oozie_node, self.params)
-            tasks.insert(
-                0,
-                Task(
-                    task_id=self.name + "_prepare",
-                    template_name="prepare.tpl",
-                    template_params=dict(prepare_command=prepare_command),
-                ),
-            )
-            relations = [Relation(from_task_id=self.name + "_prepare", to_task_id=self.name)]
-        return tasks, relations
+        action_task = Task(
+            task_id=self.name, template_name="git.tpl", template_params=dict(bash_command=self.bash_command)
+        )
+        return self.prepend_prepare_task(action_task, self.oozie_node, self.params)
 
     def required_imports(self) -> Set[str]:
         return {"from airflow.utils import dates", "from airflow.contrib.operators import dataproc_operator"}
 
     @property
     def first_task_id(self):
-        return "{task_id}_prepare".format(task_id=self.name)
+        return self.get_first_task_id(self.name, self.oozie_node, self.params)
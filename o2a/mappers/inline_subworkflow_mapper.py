@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Maps subworkflow of Oozie to tasks inlined into the parent DAG"""
+import collections
+import logging
+import os
+from typing import Dict, List, Set
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.constants import HDFS_FOLDER
+from o2a.converter.parser import OozieParser
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.mappers.decision_mapper import DecisionMapper
+from o2a.mappers.kill_mapper import KillMapper
+from o2a.mappers.subworkflow_mapper import SubworkflowMapper
+from o2a.utils import el_utils
+from o2a.utils.constants import CONFIGURATION_PROPERTIES, JOB_PROPERTIES
+
+
+class InlineSubworkflowMapper(SubworkflowMapper):
+    """
+    Converts a Sub-workflow Oozie node to the tasks of the child workflow, which are merged
+    into the parent DAG instead of being run by a SubDagOperator.
+
+    The child task ids are prefixed with the name of the sub-workflow node. The child tasks are
+    surrounded by two no-op tasks, so that the sub-workflow has a single entry and a single exit.
+    Only the last tasks of the ok paths lead to the exit, the error handlers are skipped when
+    the child workflow succeeds and the kill tasks fail it.
+    """
+
+    def _parse_oozie_node(self):
+        self.app_path = self._get_app_path()
+        logging.info(f"Inlining subworkflow from {self.app_path}")
+        self._parse_config()
+
+        child_params = {"user.name": self.params.get("user.name")}
+        child_params = el_utils.parse_els(os.path.join(self.app_path, JOB_PROPERTIES), child_params)
+        child_params = el_utils.parse_els(os.path.join(self.app_path, CONFIGURATION_PROPERTIES), child_params)
+        child_params.update(self.get_config_properties())
+
+        self.child_parser = OozieParser(
+            input_directory_path=self.app_path,
+            output_directory_path=self.output_directory_path,
+            params=child_params,
+            dag_name=self.dag_name,
+            action_mapper=self.action_mapper,
+            control_mapper=self.control_mapper,
+            name_prefix=f"{self.name}__",
+        )
+        self.child_parser.parse_workflow()
+
+        # Child tasks read the configuration (e.g. cluster name) from the PARAMS of the generated DAG,
+        # so the values missing in the parent workflow are added there.
+        conflicting_keys = []
+        for key, value in child_params.items():
+            if self.params.setdefault(key, value) != value:
+                conflicting_keys.append(key)
+        if conflicting_keys:
+            logging.warning(
+                f"The sub-workflow {self.name} uses the values of the parent workflow instead of its own "
+                f"for the parameters: {', '.join(sorted(conflicting_keys))}"
+            )
+
+    def to_tasks_and_relations(self):
+        child_tasks: List[Task] = []
+        child_relations: List[Relation] = []
+        for p_node in self.child_parser.workflow.nodes.values():
+            tasks, relations = p_node.mapper.to_tasks_and_relations()
+            child_tasks.extend(tasks)
+            child_relations.extend(relations)
+        child_relations.extend(self.child_parser.workflow.relations)
+
+        downstream_task_ids = {relation.to_task_id for relation in child_relations}
+        entry_task_ids = [task.task_id for task in child_tasks if task.task_id not in downstream_task_ids]
+        entry_relations = [
+            Relation(from_task_id=self.first_task_id, to_task_id=task_id) for task_id in entry_task_ids
+        ]
+        exit_relations = [
+            Relation(from_task_id=task_id, to_task_id=self.last_task_id)
+            for task_id in self._get_ok_path_leaves(entry_task_ids, child_relations)
+        ]
+        if not child_tasks:
+            entry_relations = [Relation(from_task_id=self.first_task_id, to_task_id=self.last_task_id)]
+
+        tasks = [
+            Task(task_id=self.first_task_id, template_name="dummy.tpl", trigger_rule=self.trigger_rule),
+            *child_tasks,
+            Task(
+                task_id=self.last_task_id,
+                template_name="dummy.tpl",
+                trigger_rule=self._get_exit_trigger_rule(),
+            ),
+        ]
+        relations = [*entry_relations, *child_relations, *exit_relations]
+        return tasks, relations
+
+    def _get_exit_trigger_rule(self) -> str:
+        """
+        The branches of a decision, which were not taken, are skipped, so the exit of a child workflow
+        with decisions runs when one of its last tasks succeeds. The branches of the forks meet
+        in the joins, so only the branches of the decisions end in different last tasks.
+        """
+        if any(
+            isinstance(p_node.mapper, DecisionMapper) for p_node in self.child_parser.workflow.nodes.values()
+        ):
+            return TriggerRule.ONE_SUCCESS
+        return TriggerRule.ALL_SUCCESS
+
+    def _get_ok_path_leaves(self, entry_task_ids: List[str], child_relations: List[Relation]) -> List[str]:
+        """
+        Returns the ids of the last child tasks reached from the entry tasks without an error
+        transition, except the kill tasks. The error handlers are skipped when the child workflow
+        succeeds and the kill tasks fail the child workflow, so the exit task must not depend on them.
+        """
+        nodes = self.child_parser.workflow.nodes
+        kill_task_ids = {
+            p_node.last_task_id for p_node in nodes.values() if isinstance(p_node.mapper, KillMapper)
+        }
+        ok_transitions = {
+            (p_node.last_task_id, nodes[name].first_task_id)
+            for p_node in nodes.values()
+            for name in p_node.get_downstreams()
+            if name in nodes
+        }
+        error_transitions = {
+            (p_node.last_task_id, nodes[p_node.get_error_downstream_name()].first_task_id)
+            for p_node in nodes.values()
+            if p_node.get_error_downstream_name() in nodes
+        }
+        ok_downstream_task_ids: Dict[str, List[str]] = {}
+        for relation in child_relations:
+            if relation in error_transitions and relation not in ok_transitions:
+                continue
+            ok_downstream_task_ids.setdefault(relation.from_task_id, []).append(relation.to_task_id)
+
+        leaves = []
+        visited = set(entry_task_ids)
+        queue = collections.deque(entry_task_ids)
+        while queue:
+            task_id = queue.popleft()
+            if task_id not in ok_downstream_task_ids and task_id not in kill_task_ids:
+                leaves.append(task_id)
+            for downstream_task_id in ok_downstream_task_ids.get(task_id, []):
+                if downstream_task_id not in visited:
+                    visited.add(downstream_task_id)
+                    queue.append(downstream_task_id)
+        return sorted(leaves)
+
+    def required_imports(self) -> Set[str]:
+        return {"from airflow.operators import dummy_operator", *self.child_parser.workflow.dependencies}
+
+    def copy_extra_assets(self, input_directory_path: str, output_directory_path: str):
+        for p_node in self.child_parser.workflow.nodes.values():
+            p_node.mapper.copy_extra_assets(
+                input_directory_path=os.path.join(self.app_path, HDFS_FOLDER),
+                output_directory_path=output_directory_path,
+            )
+
+    @property
+    def last_task_id(self):
+        return f"{self.name}_end"
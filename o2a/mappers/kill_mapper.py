@@ -36,8 +36,7 @@ class KillMapper(BaseMapper):
 
     def on_parse_finish(self, workflow: Workflow):
         super().on_parse_finish(workflow)
-        if workflow.nodes[self.name].is_error:
+        error_transitions = workflow.error_transitions
+        if self.name in error_transitions and error_transitions.in_degree(self.name):
             del workflow.nodes[self.name]
-            workflow.relations -= {
-                relation for relation in workflow.relations if relation.to_task_id == self.name
-            }
+            workflow.relations.remove_to_task(self.name)
@@ -19,7 +19,6 @@ from xml.etree.ElementTree import Element
 from airflow.utils.trigger_rule import TriggerRule
 
 from o2a.converter.task import Task
-from o2a.converter.relation import Relation
 from o2a.mappers.action_mapper import ActionMapper
 from o2a.mappers.prepare_mixin import PrepareMixin
 from o2a.utils import el_utils, xml_utils
@@ -32,7 +31,6 @@ class MapReduceMapper(ActionMapper, PrepareMixin):
     Converts a MapReduce Oozie node to an Airflow task.
     """
 
-    properties: Dict[str, str]
     params_dict: Dict[str, str]
 
     def __init__(
@@ -48,7 +46,6 @@ class MapReduceMapper(ActionMapper, PrepareMixin):
             params = dict()
         self.params = params
         self.trigger_rule = trigger_rule
-        self.properties = {}
         self.params_dict = {}
         self.file_extractor = FileExtractor(oozie_node=oozie_node, params=params)
         self.archive_extractor = ArchiveExtractor(oozie_node=oozie_node, params=params)
@@ -74,33 +71,18 @@ class MapReduceMapper(ActionMapper, PrepareMixin):
                 self.params_dict[key] = value
 
     def to_tasks_and_relations(self):
-        tasks = [
-            Task(
-                task_id=self.name,
-                template_name="mapreduce.tpl",
-                trigger_rule=self.trigger_rule,
-                template_params=dict(
-                    properties=self.properties,
-                    params_dict=self.params_dict,
-                    hdfs_files=self.hdfs_files,
-                    hdfs_archives=self.hdfs_archives,
-                ),
-            )
-        ]
-        relations = []
-        if self.has_prepare(self.oozie_node):
-            prepare_command = self.get_prepare_command(self.oozie_node, self.params)
-            tasks.insert(
-                0,
-                Task(
-                    task_id=self.name + "_prepare",
-                    template_name="prepare.tpl",
-                    trigger_rule=self.trigger_rule,
-                    template_params=dict(prepare_command=prepare_command),
-                ),
-            )
-            relations = [Relation(from_task_id=self.name + "_prepare", to_task_id=self.name)]
-        return tasks, relations
+        action_task = Task(
+            task_id=self.name,
+            template_name="mapreduce.tpl",
+            trigger_rule=self.trigger_rule,
+            template_params=dict(
+                properties=self.properties,
+                params_dict=self.params_dict,
+                hdfs_files=self.hdfs_files,
+                hdfs_archives=self.hdfs_archives,
+            ),
+        )
+        return self.prepend_prepare_task(action_task, self.oozie_node, self.params)
 
     @staticmethod
     def _validate_paths(input_directory_path, output_directory_path):
@@ -111,3 +93,7 @@ class MapReduceMapper(ActionMapper, PrepareMixin):
 
     def required_imports(self) -> Set[str]:
         return {"from airflow.utils import dates", "from airflow.contrib.operators import dataproc_operator"}
+
+    @property
+    def first_task_id(self):
+        return self.get_first_task_id(self.name, self.oozie_node, self.params)
@@ -20,7 +20,6 @@ from xml.etree.ElementTree import Element
 from airflow.utils.trigger_rule import TriggerRule
 
 from o2a.converter.task import Task
-from o2a.converter.relation import Relation
 from o2a.mappers.action_mapper import ActionMapper
 from o2a.mappers.prepare_mixin import PrepareMixin
 from o2a.utils import el_utils, xml_utils
@@ -33,7 +32,6 @@ class PigMapper(ActionMapper, PrepareMixin):
     Converts a Pig Oozie node to an Airflow task.
     """
 
-    properties: Dict[str, str]
     params_dict: Dict[str, str]
 
     def __init__(
@@ -49,7 +47,6 @@ class PigMapper(ActionMapper, PrepareMixin):
             params = dict()
         self.params = params
         self.trigger_rule = trigger_rule
-        self.properties = {}
         self.params_dict = {}
         self.file_extractor = FileExtractor(oozie_node=oozie_node, params=params)
         self.archive_extractor = ArchiveExtractor(oozie_node=oozie_node, params=params)
@@ -77,27 +74,17 @@ class PigMapper(ActionMapper, PrepareMixin):
                 self.params_dict[key] = value
 
     def to_tasks_and_relations(self):
-        prepare_command = self.get_prepare_command(self.oozie_node, self.params)
-        tasks = [
-            Task(
-                task_id=self.name + "_prepare",
-                template_name="prepare.tpl",
-                trigger_rule=self.trigger_rule,
-                template_params=dict(prepare_command=prepare_command),
+        action_task = Task(
+            task_id=self.name,
+            template_name="pig.tpl",
+            trigger_rule=self.trigger_rule,
+            template_params=dict(
+                properties=self.properties,
+                params_dict=self.params_dict,
+                script_file_name=self.script_file_name,
             ),
-            Task(
-                task_id=self.name,
-                template_name="pig.tpl",
-                trigger_rule=self.trigger_rule,
-                template_params=dict(
-                    properties=self.properties,
-                    params_dict=self.params_dict,
-                    script_file_name=self.script_file_name,
-                ),
-            ),
-        ]
-        relations = [Relation(from_task_id=self.name + "_prepare", to_task_id=self.name)]
-        return tasks, relations
+        )
+        return self.prepend_prepare_task(action_task, self.oozie_node, self.params)
 
     def _add_symlinks(self, destination_pig_file):
         destination_pig_file.write("set mapred.create.symlink yes;\n")
@@ -133,4 +120,4 @@ class PigMapper(ActionMapper, PrepareMixin):
 
     @property
     def first_task_id(self):
-        return "{task_id}_prepare".format(task_id=self.name)
+        return self.get_first_task_id(self.name, self.oozie_node, self.params)
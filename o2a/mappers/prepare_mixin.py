@@ -16,9 +16,15 @@
 from typing import Dict, List, Tuple
 import xml.etree.ElementTree as ET
 
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
 from o2a.utils import xml_utils
 from o2a.utils.el_utils import normalize_path
 
+PREPARE_TASK_SUFFIX = "_prepare"
+
 
 class PrepareMixin:
     """Mixin used to add Prepare node capability to a node"""
@@ -27,6 +33,42 @@ class PrepareMixin:
     def has_prepare(oozie_node):
         return bool(xml_utils.find_nodes_by_tag(oozie_node, "prepare"))
 
+    def has_prepare_work(self, oozie_node: ET.Element, params: Dict[str, str]) -> bool:
+        delete_paths, mkdir_paths = self.parse_prepare_node(oozie_node, params)
+        return bool(delete_paths or mkdir_paths)
+
+    def get_first_task_id(self, action_task_id: str, oozie_node: ET.Element, params: Dict[str, str]) -> str:
+        """
+        Returns the id of the prepare task if it is emitted, otherwise the id of the action task.
+        """
+        if self.has_prepare_work(oozie_node, params):
+            return action_task_id + PREPARE_TASK_SUFFIX
+        return action_task_id
+
+    def prepend_prepare_task(
+        self, action_task: Task, oozie_node: ET.Element, params: Dict[str, str]
+    ) -> Tuple[List[Task], List[Relation]]:
+        """
+        Returns the tasks and relations of the action. The prepare task is added before the action task
+        only if the prepare node contains paths to delete or create. It takes over the trigger rule
+        of the action, as it is the one that is run first, and the action task is then run only
+        if the prepare task succeeds.
+        """
+        prepare_command = self.get_prepare_command(oozie_node, params)
+        if not prepare_command:
+            return [action_task], []
+        prepare_task = Task(
+            task_id=action_task.task_id + PREPARE_TASK_SUFFIX,
+            template_name="prepare.tpl",
+            trigger_rule=action_task.trigger_rule,
+            template_params=dict(prepare_command=prepare_command),
+        )
+        action_task.trigger_rule = TriggerRule.ALL_SUCCESS
+        return (
+            [prepare_task, action_task],
+            [Relation(from_task_id=prepare_task.task_id, to_task_id=action_task.task_id)],
+        )
+
     def get_prepare_command(self, oozie_node: ET.Element, params: Dict[str, str]):
         # In BashOperator in Composer we can't read from $DAGS_FOLDER (~/dags) - permission denied.
         # However we can read from ~/data -> /home/airflow/gcs/data.
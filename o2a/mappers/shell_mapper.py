@@ -21,7 +21,6 @@ import xml.etree.ElementTree as ET
 from airflow.utils.trigger_rule import TriggerRule
 
 from o2a.converter.task import Task
-from o2a.converter.relation import Relation
 from o2a.mappers.action_mapper import ActionMapper
 from o2a.mappers.prepare_mixin import PrepareMixin
 from o2a.utils import el_utils
@@ -60,25 +59,27 @@ class ShellMapper(ActionMapper, PrepareMixin):
         self.pig_command = f"sh {shlex.quote(self.bash_command)}"
 
     def to_tasks_and_relations(self):
-        prepare_command = self.get_prepare_command(self.oozie_node, self.params)
-        tasks = [
-            Task(
-                task_id=self.name + "_prepare",
-                template_name="prepare.tpl",
-                template_params=dict(prepare_command=prepare_command),
-            ),
-            Task(
-                task_id=self.name,
-                template_name="shell.tpl",
-                template_params=dict(pig_command=self.pig_command),
-            ),
-        ]
-        relations = [Relation(from_task_id=self.name + "_prepare", to_task_id=self.name)]
-        return tasks, relations
+        action_task = Task(
+            task_id=self.name, template_name="shell.tpl", template_params=self._get_template_params()
+        )
+        return self.prepend_prepare_task(action_task, self.oozie_node, self.params)
+
+    def _get_template_params(self) -> Dict[str, str]:
+        return dict(pig_command=self.pig_command)
 
     def required_imports(self) -> Set[str]:
         return {"from airflow.utils import dates", "from airflow.contrib.operators import dataproc_operator"}
 
     @property
     def first_task_id(self):
-        return "{task_id}_prepare".format(task_id=self.name)
+        return self.get_first_task_id(self.name, self.oozie_node, self.params)
+
+
+class DirectShellMapper(ShellMapper):
+    """
+    Converts a Shell Oozie action to an Airflow task, which runs the command directly on the master
+    node of the cluster over SSH instead of starting a Pig job for it.
+    """
+
+    def _get_template_params(self) -> Dict[str, str]:
+        return dict(shell_command=shlex.quote(self.bash_command))
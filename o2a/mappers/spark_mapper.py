@@ -20,7 +20,6 @@ from airflow.utils.trigger_rule import TriggerRule
 
 from o2a.converter.exceptions import ParseException
 from o2a.converter.task import Task
-from o2a.converter.relation import Relation
 from o2a.mappers.action_mapper import ActionMapper
 from o2a.mappers.prepare_mixin import PrepareMixin
 from o2a.utils import xml_utils, el_utils
@@ -33,7 +32,6 @@ SPARK_TAG_NAME = "name"
 SPARK_TAG_ARGS = "arg"
 SPARK_TAG_OPTS = "spark-opts"
 SPARK_TAG_CONFIGURATION = "configuration"
-SPARK_TAG_JOB_XML = "job-xml"
 SPARK_TAG_JOB_NAME = "name"
 SPARK_TAG_CLASS = "class"
 SPARK_TAG_JAR = "jar"
@@ -64,20 +62,14 @@ class SparkMapper(ActionMapper, PrepareMixin):
         self.java_jar = ""
         self.job_name = None
         self.jars = []
-        self.properties = {}
         self.application_args = []
         self.file_extractor = FileExtractor(oozie_node=oozie_node, params=self.params)
         self.archive_extractor = ArchiveExtractor(oozie_node=oozie_node, params=self.params)
-        self.prepare_command = None
         self.hdfs_files = []
         self.hdfs_archives = []
         self.dataproc_jars = []
 
     def on_parse_node(self):
-
-        if self.has_prepare:
-            self.prepare_command = self.get_prepare_command(oozie_node=self.oozie_node, params=self.params)
-
         _, self.hdfs_files = self.file_extractor.parse_node()
         _, self.hdfs_archives = self.archive_extractor.parse_node()
 
@@ -88,15 +80,12 @@ class SparkMapper(ActionMapper, PrepareMixin):
             self.java_jar = None
         self.job_name = self._get_or_default(self.oozie_node, SPARK_TAG_JOB_NAME, None, params=self.params)
 
-        job_xml_nodes = xml_utils.find_nodes_by_tag(self.oozie_node, SPARK_TAG_JOB_XML)
-
-        for xml_file in job_xml_nodes:
-            tree = ET.parse(xml_file.text)
-            self.properties.update(self._parse_config_node(tree.getroot()))
+        config_blocks = self._parse_job_xmls()
 
         config_nodes = xml_utils.find_nodes_by_tag(self.oozie_node, SPARK_TAG_CONFIGURATION)
         if config_nodes:
-            self.properties.update(self._parse_config_node(config_nodes[0]))
+            config_blocks.append(self._parse_config_node(config_nodes[0]))
+        self.properties = self.configuration_store.get_configuration(*config_blocks)
 
         spark_opts = xml_utils.find_nodes_by_tag(self.oozie_node, SPARK_TAG_OPTS)
         if spark_opts:
@@ -163,12 +152,7 @@ class SparkMapper(ActionMapper, PrepareMixin):
 
         return conf
 
-    def _get_tasks(self):
-        """
-        Returns the list of Airflow tasks that are the result of mapping
-
-        :return: list of Airflow tasks
-        """
+    def to_tasks_and_relations(self):
         action_task = Task(
             task_id=self.name,
             template_name="spark.tpl",
@@ -180,37 +164,11 @@ class SparkMapper(ActionMapper, PrepareMixin):
                 archives=self.hdfs_archives,
                 files=self.hdfs_files,
                 job_name=self.job_name,
-                dataproc_spark_properties=self.properties,
+                dataproc_spark_properties=dict(self.properties),
                 dataproc_spark_jars=self.dataproc_jars,
             ),
         )
-
-        if not self.has_prepare(self.oozie_node):
-            return [action_task]
-
-        prepare_task = Task(
-            task_id=self.name + "_prepare",
-            template_name="prepare.tpl",
-            template_params=dict(prepare_command=self.prepare_command),
-        )
-        return [prepare_task, action_task]
-
-    def _get_relations(self):
-        """
-        Returns the list of Airflow relations that are the result of mapping
-
-        :return: list of relations
-        """
-        return (
-            [Relation(from_task_id=self.name + "_prepare", to_task_id=self.name)]
-            if self.has_prepare(self.oozie_node)
-            else []
-        )
-
-    def to_tasks_and_relations(self):
-        tasks = self._get_tasks()
-        relations = self._get_relations()
-        return tasks, relations
+        return self.prepend_prepare_task(action_task, self.oozie_node, self.params)
 
     def required_imports(self) -> Set[str]:
         # Bash are for the potential prepare statement
@@ -222,4 +180,4 @@ class SparkMapper(ActionMapper, PrepareMixin):
 
     @property
     def first_task_id(self):
-        return self._get_tasks()[0].task_id
+        return self.get_first_task_id(self.name, self.oozie_node, self.params)
@@ -28,6 +28,4 @@ class StartMapper(BaseMapper):
     def on_parse_finish(self, workflow):
         super().on_parse_finish(self)
         del workflow.nodes[self.name]
-        workflow.relations -= {
-            relation for relation in workflow.relations if relation.from_task_id == self.name
-        }
+        workflow.relations.remove_from_task(self.name)
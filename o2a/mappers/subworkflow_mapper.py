@@ -22,10 +22,9 @@ from airflow.utils.trigger_rule import TriggerRule
 
 from o2a.converter.oozie_converter import OozieConverter
 from o2a.converter.task import Task
-from o2a.definitions import EXAMPLES_PATH
 from o2a.mappers.action_mapper import ActionMapper
 from o2a.mappers.base_mapper import BaseMapper
-from o2a.utils import el_utils, xml_utils
+from o2a.utils import el_utils
 
 
 # pylint: disable=too-many-instance-attributes
@@ -34,8 +33,6 @@ class SubworkflowMapper(ActionMapper):
     Converts a Sub-workflow Oozie node to an Airflow task.
     """
 
-    properties: Dict[str, str]
-
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -56,7 +53,6 @@ class SubworkflowMapper(ActionMapper):
         self.params = params
         self.task_id = name
         self.trigger_rule = trigger_rule
-        self.properties = {}
         self.input_directory_path = input_directory_path
         self.output_directory_path = output_directory_path
         self.dag_name = dag_name
@@ -64,13 +60,20 @@ class SubworkflowMapper(ActionMapper):
         self.control_mapper = control_mapper
         self._parse_oozie_node()
 
-    def _parse_oozie_node(self):
+    def _get_app_path(self) -> str:
+        """
+        Returns the local path of the sub-workflow application and sets its name. The application
+        is looked up next to the application of the parent workflow, in the directory named as
+        the last part of its app-path.
+        """
         app_path = self.oozie_node.find("app-path").text
         app_path = el_utils.replace_el_with_var(app_path, params=self.params, quote=False)
         _, _, self.app_name = app_path.rpartition("/")
-        # TODO: hacky: we should calculate it deriving from input_directory_path and comparing app-path
-        # TODO: but for now we assume app is in "examples"
-        app_path = os.path.join(EXAMPLES_PATH, self.app_name)
+        parent_apps_path = os.path.dirname(os.path.abspath(self.input_directory_path))
+        return os.path.join(parent_apps_path, self.app_name)
+
+    def _parse_oozie_node(self):
+        app_path = self._get_app_path()
         logging.info(f"Converting subworkflow from {app_path}")
         self._parse_config()
         converter = OozieConverter(
@@ -82,6 +85,7 @@ class SubworkflowMapper(ActionMapper):
             control_mapper=self.control_mapper,
             dag_name=f"{self.dag_name}.{self.task_id}",
             output_dag_name=f"subdag_{self.app_name}.py",
+            user=self.params.get("user.name"),
         )
         converter.convert()
 
@@ -92,18 +96,6 @@ class SubworkflowMapper(ActionMapper):
         # and `propagate_configuration` is an empty node so __bool__() will always return False.
         return self.properties if propagate_configuration is not None else {}
 
-    def _parse_config(self):
-        config = self.oozie_node.find("configuration")
-        if config:
-            property_nodes = xml_utils.find_nodes_by_tag(config, "property")
-            if property_nodes:
-                for node in property_nodes:
-                    name = node.find("name").text
-                    value = el_utils.replace_el_with_var(
-                        node.find("value").text, params=self.params, quote=False
-                    )
-                    self.properties[name] = value
-
     def to_tasks_and_relations(self):
         tasks = [
             Task(
@@ -21,8 +21,12 @@ import subprocess
 from subprocess import CalledProcessError
 
 from o2a.converter.mappers import ACTION_MAP, CONTROL_MAP
+from o2a.converter.memory_report import MemoryReport
 from o2a.converter.oozie_converter import OozieConverter
+from o2a.converter.render_cache import CACHE_FILE_NAME, RenderCache
 from o2a.converter.constants import HDFS_FOLDER
+from o2a.mappers.inline_subworkflow_mapper import InlineSubworkflowMapper
+from o2a.mappers.shell_mapper import DirectShellMapper
 from o2a.utils.constants import CONFIGURATION_PROPERTIES, WORKFLOW_XML
 
 INDENT = 4
@@ -73,18 +77,53 @@ Otherwise please provide it.
         logging.info(f"Skipping workflow validation as the {validate_workflows_script} is missing")
     os.makedirs(output_directory_path, exist_ok=True)
 
+    action_mapper = ACTION_MAP
+    if args.inline_subworkflows:
+        action_mapper = {**action_mapper, "sub-workflow": InlineSubworkflowMapper}
+    if args.direct_shell:
+        action_mapper = {**action_mapper, "shell": DirectShellMapper}
+
+    render_cache = None
+    if args.cache_dir:
+        render_cache = RenderCache(
+            os.path.join(args.cache_dir, CACHE_FILE_NAME), max_size=args.cache_size * 2 ** 20
+        )
+
+    memory_report = None
+    if args.memory_report:
+        memory_report = MemoryReport()
+        memory_report.start()
+
     converter = OozieConverter(
         dag_name=dag_name,
         input_directory_path=input_directory_path,
         output_directory_path=output_directory_path,
-        action_mapper=ACTION_MAP,
+        action_mapper=action_mapper,
         control_mapper=CONTROL_MAP,
         user=args.user,
         start_days_ago=start_days_ago,
         schedule_interval=schedule_interval,
+        simplify_graph=args.simplify_graph,
+        prioritize_critical_path=args.prioritize_critical_path,
+        task_durations_file=args.task_durations_file,
+        action_pools=args.action_pools,
+        capacity_profile_file=args.capacity_profile,
+        format_output=not args.skip_formatting,
+        shard_size=args.shard_size,
+        render_cache=render_cache,
+        memory_report=memory_report,
+        workers=args.workers,
     )
     converter.recreate_output_directory()
-    converter.convert()
+    try:
+        converter.convert()
+        converter.create_manifest_file()
+    finally:
+        if render_cache:
+            render_cache.close()
+        if memory_report:
+            memory_report.stop()
+            print(memory_report.format())
 
 
 def parse_args(args):
@@ -103,4 +142,70 @@ def parse_args(args):
     parser.add_argument(
         "-v", "--schedule-interval", help="Desired DAG schedule interval as number of days", default=0
     )
+    parser.add_argument(
+        "--simplify-graph",
+        action="store_true",
+        help="Remove no-op control tasks (fork, join, end) and redundant relations from the DAG",
+    )
+    parser.add_argument(
+        "--inline-subworkflows",
+        action="store_true",
+        help="Merge the tasks of sub-workflows into the parent DAG instead of using SubDagOperator",
+    )
+    parser.add_argument(
+        "--direct-shell",
+        action="store_true",
+        help="Run shell actions directly on the master node of the cluster over SSH instead of in Pig jobs",
+    )
+    parser.add_argument(
+        "--prioritize-critical-path",
+        action="store_true",
+        help="Set priority weights of the tasks based on the estimated critical path of the DAG",
+    )
+    parser.add_argument(
+        "--task-durations-file",
+        help="JSON file mapping task ids to their historical durations in seconds, used instead of the "
+        "estimates when prioritizing the critical path",
+    )
+    parser.add_argument(
+        "--action-pools",
+        action="store_true",
+        help="Run the tasks in per-action-type pools, e.g. o2a_spark (the pools must exist in Airflow)",
+    )
+    parser.add_argument(
+        "--capacity-profile",
+        help="JSON file with the capacity of the cluster, used to set the DAG concurrency and to generate "
+        "the definitions of the pools next to the DAG file",
+    )
+    parser.add_argument(
+        "--skip-formatting",
+        action="store_true",
+        help="Do not format the generated DAG files with black, which keeps the whole file in memory",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        help="Define the tasks in modules of at most SHARD_SIZE tasks each, imported by the DAG file, "
+        "so that Airflow parses large DAGs faster",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory of the cache of the rendered tasks, so that the tasks rendered before, "
+        "also in other workflows, are not rendered again",
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=256, help="Maximum size of the cache in megabytes [default: 256]"
+    )
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="Trace the memory allocations and print the top allocation sites and the size of the workflow, "
+        "the mappers and the XML elements after each phase of the conversion (slows the conversion down)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Convert the nodes and render the tasks in WORKERS parallel processes, which pays off for large "
+        "workflows on machines with many cores",
+    )
     return parser.parse_args(args)
@@ -13,7 +13,41 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Basic EL functions of the Oozie workflow"""
+import datetime
+import json
 import re
+import urllib.parse
+from functools import lru_cache
+
+# Number of regular expressions and replacements kept compiled by replace_all
+REGEX_CACHE_SIZE = 256
+
+# Character classes of java.util.regex.Pattern, which have no equivalent in Python, as the contents
+# of a bracket expression
+JAVA_POSIX_CLASSES = {
+    "Lower": "a-z",
+    "Upper": "A-Z",
+    "ASCII": r"\x00-\x7F",
+    "Alpha": "a-zA-Z",
+    "Digit": "0-9",
+    "Alnum": "a-zA-Z0-9",
+    "Punct": r"!-/:-@\[-`{-~",
+    "Graph": "!-~",
+    "Print": " -~",
+    "Blank": r" \t",
+    "Cntrl": r"\x00-\x1F\x7F",
+    "XDigit": "0-9a-fA-F",
+    "Space": r" \t\n\x0B\f\r",
+}
+
+# Escape sequences of Java regular expressions, which mean something else or nothing in Python
+JAVA_ESCAPES = {
+    "e": r"\x1B",
+    "z": r"\Z",
+    "Z": r"(?=\n?\Z)",
+    "h": r"[ \t\xA0\u1680\u180E\u2000-\u200A\u202F\u205F\u3000]",
+    "R": r"(?:\r\n|[\n\x0B\f\r\x85\u2028\u2029])",
+}
 
 
 def first_not_null(str_one, str_two):
@@ -41,18 +75,139 @@ def concat(str_one, str_two):
     return str_one + str_two
 
 
+def translate_java_regex(regex):
+    """
+    Translates a regular expression in the syntax of java.util.regex.Pattern, used by Oozie,
+    to the syntax of the re module: named groups and their back references, quotations
+    (\\Q...\\E), POSIX character classes (\\p{Alpha}) and the escapes missing in Python.
+    Other constructs are passed unchanged.
+    """
+    result = []
+    in_class = False
+    index = 0
+    while index < len(regex):
+        char = regex[index]
+        next_chars = regex[index + 1 : index + 3]
+        if char == "\\" and regex.startswith("Q", index + 1):
+            end = regex.find("\\E", index + 2)
+            end = len(regex) if end == -1 else end
+            result.append(re.escape(regex[index + 2 : end]))
+            index = end + 2
+            continue
+        if char == "\\" and next_chars[:1] in ("p", "P") and next_chars[1:] == "{":
+            end = regex.find("}", index)
+            name = regex[index + 3 : end] if end != -1 else ""
+            chars = JAVA_POSIX_CLASSES.get(name[2:] if name.startswith("Is") else name)
+            if chars and in_class and next_chars[0] == "p":
+                result.append(chars)
+                index = end + 1
+                continue
+            if chars and not in_class:
+                result.append(f"[{'^' if next_chars[0] == 'P' else ''}{chars}]")
+                index = end + 1
+                continue
+        if char == "\\" and next_chars == "k<" and not in_class:
+            end = regex.find(">", index)
+            if end != -1:
+                result.append(f"(?P={regex[index + 3 : end]})")
+                index = end + 1
+                continue
+        if char == "\\" and next_chars[:1] in JAVA_ESCAPES and (not in_class or next_chars[0] == "e"):
+            result.append(JAVA_ESCAPES[next_chars[0]])
+            index += 2
+            continue
+        if char == "\\":
+            result.append(regex[index : index + 2])
+            index += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A closing bracket right after the opening one is a literal character
+            end = index + (2 if regex.startswith("^", index + 1) else 1)
+            if regex.startswith("]", end):
+                end += 1
+            result.append(regex[index:end])
+            index = end
+            continue
+        elif char == "(" and next_chars[:1] == "?" and regex.startswith("<", index + 2):
+            if regex[index + 3 : index + 4] not in ("=", "!"):
+                result.append("(?P<")
+                index += 3
+                continue
+        result.append(char)
+        index += 1
+    return "".join(result)
+
+
+def translate_java_replacement(replacement, groups):
+    """
+    Translates a replacement string of java.util.regex.Matcher to a template of the re module.
+    In Java, $n and ${name} refer to the groups and backslash escapes the next character.
+    Like in Java, the digits after $ are a part of the group number only if such group exists.
+    """
+    result = []
+    index = 0
+    while index < len(replacement):
+        char = replacement[index]
+        if char == "\\":
+            if index + 1 == len(replacement):
+                raise ValueError(f"Character to be escaped is missing in the replacement: {replacement}")
+            escaped = replacement[index + 1]
+            result.append("\\\\" if escaped == "\\" else escaped)
+            index += 2
+        elif char == "$" and replacement.startswith("{", index + 1):
+            end = replacement.find("}", index)
+            if end == -1:
+                raise ValueError(f"Named group reference is missing a closing brace: {replacement}")
+            result.append(f"\\g<{replacement[index + 2 : end]}>")
+            index = end + 1
+        elif char == "$":
+            if not replacement[index + 1 : index + 2].isdigit():
+                raise ValueError(f"Illegal group reference in the replacement: {replacement}")
+            group = int(replacement[index + 1])
+            index += 2
+            while index < len(replacement) and replacement[index].isdigit():
+                next_group = group * 10 + int(replacement[index])
+                if next_group > groups:
+                    break
+                group = next_group
+                index += 1
+            result.append(f"\\g<{group}>")
+        else:
+            result.append(char)
+            index += 1
+    return "".join(result)
+
+
+@lru_cache(maxsize=REGEX_CACHE_SIZE)
+def _compile_java_regex(regex):
+    return re.compile(translate_java_regex(regex))
+
+
+@lru_cache(maxsize=REGEX_CACHE_SIZE)
+def _get_replacement_template(replacement, groups):
+    return translate_java_replacement(replacement, groups)
+
+
 def replace_all(src_string, regex, replacement):
     """
     Replace each occurrence of regular expression match in
     the first string with the replacement string and return the
     replaced string. A 'regex' string with null value is considered as
     no change. A 'replacement' string with null value is consider as an empty string.
+
+    The regular expression and the replacement use the Java syntax, as in Oozie. They are
+    translated and compiled once and kept in a bounded cache, as the function is called
+    while rendering each task instance.
     """
     if not regex:
         return src_string
     if not replacement:
         replacement = ""
-    return re.sub(regex, replacement, src_string)
+    pattern = _compile_java_regex(regex)
+    return pattern.sub(_get_replacement_template(replacement, pattern.groups), src_string)
 
 
 def append_all(src_str, append, delimiter):
@@ -95,8 +250,6 @@ def url_encode(src_str):
     """
     if not src_str:
         return ""
-    import urllib.parse
-
     return urllib.parse.quote(src_str, encoding="UTF-8")
 
 
@@ -106,13 +259,8 @@ def timestamp():
     in W3C format down to the second (YYYY-MM-DDThh:mm:ss.sZ).
     i.e.: 1997-07-16T19:20:30.45Z
     """
-    import datetime
-    import pytz
-
-    return datetime.datetime.now(pytz.utc).isoformat()
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
 
 
 def to_json_str(py_map):
-    import json
-
     return json.dumps(py_map)
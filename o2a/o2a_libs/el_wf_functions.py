@@ -14,6 +14,50 @@
 # limitations under the License.
 """All WF EL functions"""
 # pylint: disable=unused-argument
+import json
+import weakref
+from datetime import datetime
+from typing import Any, Dict, NamedTuple, Optional
+
+from airflow.models import TaskInstance, XCom
+from airflow.utils.db import provide_session
+from airflow.utils.state import State
+from sqlalchemy import and_
+
+# The generated DAGs import everything from this module
+__all__ = [
+    "wf_id",
+    "wf_name",
+    "wf_app_path",
+    "wf_conf",
+    "wf_user",
+    "wf_group",
+    "wf_callback",
+    "wf_transition",
+    "wf_last_error_node",
+    "wf_error_code",
+    "wf_error_message",
+    "wf_run",
+    "wf_action_data",
+    "wf_action_external_id",
+    "wf_action_tracker_uri",
+    "wf_action_external_status",
+    "WF_MACROS",
+]
+
+# XComs, which the tasks can push to describe their errors
+ERROR_CODE_KEY = "error_code"
+ERROR_MESSAGE_KEY = "error_message"
+# XCom with the output of a task, e.g. the last line written by a BashOperator
+RETURN_VALUE_KEY = "return_value"
+WF_XCOM_KEYS = (ERROR_CODE_KEY, ERROR_MESSAGE_KEY, RETURN_VALUE_KEY)
+
+# States of the tasks, which were not run because of the transitions taken by their upstream tasks
+NOT_RUN_STATES = {State.SKIPPED, State.UPSTREAM_FAILED, State.REMOVED, State.NONE}
+
+# Airflow 2 identifies the DAG runs of the task instances and XComs by run_id, Airflow 1.10 by
+# the execution date
+RUN_KEY = "run_id" if hasattr(TaskInstance, "run_id") else "execution_date"
 
 
 def wf_id():
@@ -47,14 +91,18 @@ def wf_app_path():
     """
 
 
-def wf_conf():
+def wf_conf(name):
     """
     It returns the value of the workflow job configuration property for the
     current workflow job, or an empty string if undefined.
 
+    The configuration of the workflow job is the configuration of the DAG run.
+    The value is known only when the template is rendered, so the function cannot be used
+    in the conditions of the decisions.
     This has the effect that some parameters cannot be templated, and thus
     this will fail.
     """
+    return "{{ wf.conf(dag_run, %s) }}" % json.dumps(name)
 
 
 def wf_user():
@@ -95,7 +143,10 @@ def wf_transition(node):
     It returns the transition taken by the specified workflow action node, or
     an empty string if the action has not being executed or it has not completed
     yet.
+
+    The transition is the id of the first downstream task, which was not skipped.
     """
+    return "{{ wf.transition(ti, %s) }}" % json.dumps(_get_task_id(node))
 
 
 def wf_last_error_node():
@@ -104,6 +155,7 @@ def wf_last_error_node():
     exit state, or an empty string if no action has exited with ERROR state in the
     current workflow job.
     """
+    return "{{ wf.last_error_node(ti) }}"
 
 
 def wf_error_code(node):
@@ -112,23 +164,30 @@ def wf_error_code(node):
     the action node has not exited with ERROR state.
 
     Each type of action node must define its complete error code list.
+    In Airflow it is the error_code XCom pushed by the failed task.
     """
+    return "{{ wf.error_code(ti, %s) }}" % json.dumps(_get_task_id(node))
 
 
-def wf_error_message(message):
+def wf_error_message(node):
     """
     It returns the error message for the specified action node, or an empty string
     if no action node has not exited with ERROR state.
 
     The error message can be useful for debugging and notification purposes.
+    In Airflow it is the error_message XCom pushed by the failed task.
     """
+    return "{{ wf.error_message(ti, %s) }}" % json.dumps(_get_task_id(node))
 
 
 def wf_run():
     """
     It returns the run number for the current workflow job, normally 0 unless the
     workflow job is re-run, in which case indicates the current run.
+
+    In Airflow it is the number of the previous tries of the task instance.
     """
+    return "{{ wf.run(ti) }}"
 
 
 def wf_action_data(node):
@@ -137,8 +196,9 @@ def wf_action_data(node):
     completion.
 
     The output data is in a Java Properties format and via this EL function it
-    is available as a Map.
+    is available as a Map. In Airflow it is the return_value XCom of the task.
     """
+    return "{{ wf.action_data(ti, %s) }}" % json.dumps(_get_task_id(node))
 
 
 def wf_action_external_id(node):
@@ -160,3 +220,142 @@ def wf_action_external_status(node):
     It returns the external status for an action node, or an empty string if the
     action has not being executed or it has not completed yet.
     """
+
+
+def _get_task_id(node):
+    # The converter replaces the characters of the node names, which are invalid in Python
+    return node.replace("-", "_")
+
+
+def parse_properties(text: str) -> Dict[str, str]:
+    """
+    Parses the lines of the Java Properties format written by the actions capturing their output.
+    """
+    properties = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in "#!":
+            continue
+        separator = min((line.find(char) for char in "=:" if char in line), default=len(line))
+        properties[line[:separator].strip()] = line[separator + 1 :].strip()
+    return properties
+
+
+class WorkflowState(NamedTuple):
+    """States and selected XComs of all the task instances of a DAG run"""
+
+    states: Dict[str, Optional[str]]
+    end_dates: Dict[str, Optional[datetime]]
+    # The values of WF_XCOM_KEYS by task id
+    xcoms: Dict[str, Dict[str, Any]]
+
+
+@provide_session
+def fetch_workflow_state(ti: TaskInstance, session=None) -> WorkflowState:
+    """
+    Fetches the states and XComs of the task instances of the DAG run of the task instance
+    in a single query.
+    """
+    xcom_conditions = [
+        XCom.dag_id == TaskInstance.dag_id,
+        XCom.task_id == TaskInstance.task_id,
+        getattr(XCom, RUN_KEY) == getattr(TaskInstance, RUN_KEY),
+        XCom.key.in_(WF_XCOM_KEYS),
+    ]
+    if hasattr(XCom, "map_index"):
+        xcom_conditions.append(XCom.map_index == TaskInstance.map_index)
+    rows = (
+        session.query(TaskInstance, XCom)
+        .outerjoin(XCom, and_(*xcom_conditions))
+        .filter(TaskInstance.dag_id == ti.dag_id, getattr(TaskInstance, RUN_KEY) == getattr(ti, RUN_KEY))
+        .all()
+    )
+    state = WorkflowState({}, {}, {})
+    for task_instance, xcom in rows:
+        state.states[task_instance.task_id] = task_instance.state
+        state.end_dates[task_instance.task_id] = task_instance.end_date
+        if xcom is not None:
+            # Airflow 1.10 deserializes the values when loading them
+            value = XCom.deserialize_value(xcom) if isinstance(xcom.value, bytes) else xcom.value
+            state.xcoms.setdefault(task_instance.task_id, {})[xcom.key] = value
+    return state
+
+
+_WORKFLOW_STATES: "weakref.WeakKeyDictionary[TaskInstance, WorkflowState]" = weakref.WeakKeyDictionary()
+
+
+def get_workflow_state(ti: TaskInstance) -> WorkflowState:
+    """
+    Returns the state of the DAG run of the task instance. It is fetched once for each task instance,
+    so all the EL functions in the templates of a task share a single query.
+    """
+    state = _WORKFLOW_STATES.get(ti)
+    if state is None:
+        state = _WORKFLOW_STATES[ti] = fetch_workflow_state(ti)
+    return state
+
+
+class WorkflowMacros:
+    """
+    Functions called by the templates returned by the WF EL functions, when Airflow renders
+    the templated fields of a task instance.
+    """
+
+    @staticmethod
+    def conf(dag_run, name: str) -> Any:
+        if dag_run is None or not dag_run.conf:
+            return ""
+        return dag_run.conf.get(name, "")
+
+    @staticmethod
+    def run(ti: TaskInstance) -> int:
+        return max(ti.try_number - 1, 0)
+
+    @staticmethod
+    def last_error_node(ti: TaskInstance) -> str:
+        state = get_workflow_state(ti)
+        failed_task_ids = [
+            task_id for task_id, task_state in state.states.items() if task_state == State.FAILED
+        ]
+        if not failed_task_ids:
+            return ""
+        return max(failed_task_ids, key=lambda task_id: (state.end_dates[task_id] or datetime.min, task_id))
+
+    @staticmethod
+    def _get_error_xcom(ti: TaskInstance, task_id: str, key: str) -> str:
+        state = get_workflow_state(ti)
+        if state.states.get(task_id) != State.FAILED:
+            return ""
+        return state.xcoms.get(task_id, {}).get(key, "")
+
+    def error_code(self, ti: TaskInstance, task_id: str) -> str:
+        return self._get_error_xcom(ti, task_id, ERROR_CODE_KEY)
+
+    def error_message(self, ti: TaskInstance, task_id: str) -> str:
+        return self._get_error_xcom(ti, task_id, ERROR_MESSAGE_KEY)
+
+    @staticmethod
+    def transition(ti: TaskInstance, task_id: str) -> str:
+        state = get_workflow_state(ti)
+        if state.states.get(task_id) not in (State.SUCCESS, State.FAILED):
+            return ""
+        downstream_task_ids = sorted(ti.task.dag.get_task(task_id).downstream_task_ids)
+        taken = [
+            downstream_task_id
+            for downstream_task_id in downstream_task_ids
+            if state.states.get(downstream_task_id) not in NOT_RUN_STATES
+        ]
+        return taken[0] if taken else ""
+
+    @staticmethod
+    def action_data(ti: TaskInstance, task_id: str) -> Dict[str, Any]:
+        value = get_workflow_state(ti).xcoms.get(task_id, {}).get(RETURN_VALUE_KEY)
+        if isinstance(value, dict):
+            return value
+        if isinstance(value, str):
+            return parse_properties(value)
+        return {}
+
+
+# Passed as user_defined_macros to the generated DAGs
+WF_MACROS = {"wf": WorkflowMacros()}
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Entry point copying the changed output files of the converter to the DAGs folder"""
+import argparse
+import logging
+import os
+import sys
+
+from o2a.converter.manifest import sync_files
+
+
+# pylint: disable=missing-docstring
+def main():
+    args = parse_args(sys.argv[1:])
+    report = sync_files(args.manifest_file, args.target_directory_path, delete=not args.keep_removed)
+    logging.info(
+        f"Copied {len(report.copied)}, deleted {len(report.deleted)} "
+        f"and skipped {len(report.unchanged)} unchanged files."
+    )
+    for path in report.copied:
+        print(os.path.join(args.target_directory_path, path))
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(
+        description="Copy the files of a converted workflow changed since the previous copy "
+        "to the DAGs folder."
+    )
+    parser.add_argument(
+        "-m", "--manifest-file", help="Manifest written next to the DAG file by the converter", required=True
+    )
+    parser.add_argument("-t", "--target-directory-path", help="DAGs folder", required=True)
+    parser.add_argument(
+        "--keep-removed",
+        action="store_true",
+        help="Do not delete the files copied before, which are no longer in the output of the converter",
+    )
+    return parser.parse_args(args)
@@ -13,15 +13,23 @@
   See the License for the specific language governing permissions and
   limitations under the License.
  #}
+{#
+  The indentation is applied to each node and relation separately, so that the DAG can be rendered
+  as a stream without keeping the whole body in memory.
+#}
 {%- for node in nodes %}
+{% filter indent(indent_width, True) %}
 {%- for task in node.tasks %}
     {{ task.rendered_template }}
 {% endfor %}
 {%- for relation in node.relations %}
 {{ relation.from_task_id }}.set_downstream({{ relation.to_task_id }})
 {% endfor %}
+{% endfilter %}
 {% endfor %}
 
 {%- for relation in relations %}
+{% filter indent(indent_width, True) %}
 {{ relation.from_task_id }}.set_downstream({{ relation.to_task_id }})
+{% endfilter %}
 {% endfor %}
@@ -0,0 +1,54 @@
+{#
+  Copyright 2019 Google LLC
+
+  Licensed under the Apache License, Version 2.0 (the "License");
+  you may not use this file except in compliance with the License.
+  You may obtain a copy of the License at
+
+  http://www.apache.org/licenses/LICENSE-2.0
+
+  Unless required by applicable law or agreed to in writing, software
+  distributed under the License is distributed on an "AS IS" BASIS,
+  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+  See the License for the specific language governing permissions and
+  limitations under the License.
+ #}
+
+{#
+  Only the wildcard imports are placed at the module level, as they are not allowed in a function.
+  The other ones are placed in the function, so that a task can be assigned to a variable named
+  the same as a module used to create it, as it can at the module level of a DAG file.
+#}
+{%- for dependency in global_dependencies %}
+{{ dependency }}
+{% endfor %}
+
+PARAMS = {{ params | tojson }}
+
+
+def create_tasks(dag, tasks):
+    """
+    Creates the tasks of this part of the DAG. The tasks of the previous parts used here are taken
+    from the tasks dictionary, where the tasks used by the next parts are added.
+    """
+{%- for dependency in dependencies %}
+    {{ dependency }}
+{% endfor %}
+
+    with dag:
+
+{% with indent_width = 8 %}
+{% include "dag_body.tpl" %}
+{% endwith %}
+
+{%- for relation in upstream_relations %}
+{% filter indent(8, True) %}
+tasks[{{ relation.from_task_id | tojson }}].set_downstream({{ relation.to_task_id }})
+{% endfilter %}
+{% endfor %}
+
+{%- for task_id in exported_task_ids %}
+{% filter indent(8, True) %}
+tasks[{{ task_id | tojson }}] = {{ task_id }}
+{% endfilter %}
+{% endfor %}
@@ -34,5 +34,6 @@ def {{ task_id }}_decision():
 {{ task_id }} = python_operator.BranchPythonOperator(
     task_id={{ task_id | tojson }},
     trigger_rule={{ trigger_rule | tojson }},
+    {%- include "task_scheduling.tpl" %}
     python_callable={{ task_id }}_decision,
 )
@@ -16,5 +16,6 @@
 
 {{ task_id }} = dummy_operator.DummyOperator(
     task_id={{ task_id | tojson }},
-    trigger_rule={{ trigger_rule | tojson }}
+    trigger_rule={{ trigger_rule | tojson }},
+    {%- include "task_scheduling.tpl" %}
 )
@@ -16,6 +16,7 @@
 {{ task_id }} = bash_operator.BashOperator(
     task_id={{ task_id | tojson }},
     trigger_rule={{ trigger_rule | tojson }},
+    {%- include "task_scheduling.tpl" %}
     bash_command="gcloud dataproc jobs submit pig --cluster={dataproc_cluster} --region={gcp_region} --execute {pig_command}".format(
         dataproc_cluster=PARAMS['dataproc_cluster'],
         gcp_region=PARAMS['gcp_region'],
@@ -17,6 +17,7 @@
 {{ task_id }} = bash_operator.BashOperator(
     task_id={{ task_id | tojson }},
     trigger_rule={{ trigger_rule | tojson }},
+    {%- include "task_scheduling.tpl" %}
     bash_command={{ bash_command | tojson }}.format(
         dataproc_cluster=PARAMS['dataproc_cluster'],
         gcp_region=PARAMS['gcp_region']
@@ -17,6 +17,7 @@
 {{ task_id }} = dataproc_operator.DataProcHadoopOperator(
     task_id={{ task_id | tojson }},
     trigger_rule={{ trigger_rule | tojson }},
+    {%- include "task_scheduling.tpl" %}
     main_class=PARAMS['hadoop_main_class'],
     arguments=[
         {{ properties['mapreduce.input.fileinputformat.inputdir'] | tojson }},
@@ -17,6 +17,7 @@
 {{ task_id }} = dataproc_operator.DataProcPigOperator(
     task_id={{ task_id | tojson }},
     trigger_rule={{ trigger_rule | tojson }},
+    {%- include "task_scheduling.tpl" %}
     query_uri='{}/{}'.format(PARAMS['gcp_uri_prefix'], {{ script_file_name | tojson }}),
     variables={{ params_dict }},
     dataproc_pig_properties={{ properties }},
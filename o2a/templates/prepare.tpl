@@ -17,5 +17,6 @@
 {{ task_id }} = bash_operator.BashOperator(
     task_id={{ task_id | tojson }},
     trigger_rule={{ trigger_rule | tojson }},
+    {%- include "task_scheduling.tpl" %}
     bash_command={{ prepare_command | tojson }},
 )
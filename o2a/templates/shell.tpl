@@ -16,9 +16,18 @@
 {{ task_id }} = bash_operator.BashOperator(
     task_id={{ task_id | tojson }},
     trigger_rule={{ trigger_rule | tojson }},
+    {%- include "task_scheduling.tpl" %}
+{%- if shell_command is defined %}
+    bash_command="$DAGS_FOLDER/../data/shell.sh --cluster={dataproc_cluster} --region={gcp_region} --command {shell_command}".format(
+        dataproc_cluster=PARAMS['dataproc_cluster'],
+        gcp_region=PARAMS['gcp_region'],
+        shell_command={{ shell_command | tojson }}
+    )
+{%- else %}
     bash_command="gcloud dataproc jobs submit pig --cluster={dataproc_cluster} --region={gcp_region} --execute {pig_command}".format(
         dataproc_cluster=PARAMS['dataproc_cluster'],
         gcp_region=PARAMS['gcp_region'],
         pig_command={{ pig_command | tojson }}
     )
+{%- endif %}
 )
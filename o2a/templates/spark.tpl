@@ -18,6 +18,7 @@
 {{ task_id }} = dataproc_operator.DataProcSparkOperator(
     task_id={{ task_id | tojson }},
     trigger_rule={{ trigger_rule | tojson }},
+    {%- include "task_scheduling.tpl" %}
     {% if main_jar %}main_jar={{ main_jar | tojson }},{% endif %}
     {% if main_class %}main_class={{ main_class | tojson }},{% endif %}
     arguments={{ arguments | tojson }},
@@ -23,6 +23,7 @@
 {{ task_id }} = ssh_operator.SSHOperator(
     task_id={{ task_id | tojson }},
     trigger_rule={{ trigger_rule | tojson }},
+    {%- include "task_scheduling.tpl" %}
     ssh_hook={{ task_id }}_hook,
     params=PARAMS,
     command={{ command | tojson }},
@@ -17,5 +17,6 @@
 {{ task_id }} = SubDagOperator(
     task_id={{ task_id | tojson }},
     trigger_rule={{ trigger_rule | tojson }},
+    {%- include "task_scheduling.tpl" %}
     subdag=subdag_{{ app_name }}.sub_dag(dag.dag_id, {{ task_id | tojson }}, dag.start_date, dag.schedule_interval),
 )
@@ -24,11 +24,12 @@ def sub_dag(parent_dag_name, child_dag_name, start_date, schedule_interval):
     with models.DAG(
         '{0}.{1}'.format(parent_dag_name, child_dag_name),
         schedule_interval=schedule_interval,  # Change to suit your needs
-        start_date=start_date  # Change to suit your needs
+        start_date=start_date,  # Change to suit your needs
+        user_defined_macros=WF_MACROS,
     ) as dag:
 
-    {% filter indent(8, True) %}
+    {% with indent_width = 8 %}
     {% include "dag_body.tpl" %}
-    {% endfilter %}
+    {% endwith %}
 
     return dag
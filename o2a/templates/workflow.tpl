@@ -23,9 +23,23 @@ PARAMS = {{ params | tojson }}
 with models.DAG(
     {{ dag_name | tojson }},
     schedule_interval={% if schedule_interval %}datetime.timedelta(days={{ schedule_interval }}){% else %}None{% endif %},  # Change to suit your needs
-    start_date=dates.days_ago({{ start_days_ago }})  # Change to suit your needs
+    start_date=dates.days_ago({{ start_days_ago }}),  # Change to suit your needs
+    user_defined_macros=WF_MACROS,
+{%- if concurrency is defined %}
+    concurrency={{ concurrency }},
+{%- endif %}
+{%- if max_active_runs is defined %}
+    max_active_runs={{ max_active_runs }},
+{%- endif %}
 ) as dag:
 
-{% filter indent(4, True) %}
+{%- if shards is defined %}
+    tasks = {}
+{%- for shard in shards %}
+    {{ shard.module_name }}.create_tasks(dag, tasks)
+{%- endfor %}
+{% else %}
+{% with indent_width = 4 %}
 {% include "dag_body.tpl" %}
-{% endfilter %}
+{% endwith %}
+{% endif %}
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Utilities used by EL functions"""
+import ast
 import logging
 import os
 import re
@@ -20,9 +21,11 @@ from typing import Dict, List, Optional, Union
 from urllib.parse import urlparse, ParseResult
 
 from o2a.converter.exceptions import ParseException
-from o2a.o2a_libs import el_basic_functions
+from o2a.o2a_libs import el_basic_functions, el_wf_functions
 
-FN_MATCH = re.compile(r"\${\s?(\w+)\(([\w\s,\'\"\-]*)\)\s?\}")
+# The arguments of the function can contain calls of other functions, e.g. ${wf:errorCode(wf:lastErrorNode())}
+FN_MATCH = re.compile(r"\${\s?(\w+(?::\w+)?)\(((?:[^(){}]|\([^(){}]*\))*)\)\s?\}")
+NESTED_FN_MATCH = re.compile(r"(\w+(?::\w+)?)\(")
 VAR_MATCH = re.compile(r"\${([\w.]+)}")
 
 EL_CONSTANTS = {"KB": 1024 ** 1, "MB": 1024 ** 2, "GB": 1024 ** 3, "TB": 1024 ** 4, "PB": 1024 ** 5}
@@ -40,19 +43,24 @@ EL_FUNCTIONS = {
     "toConfigurationStr": None,
 }
 
+# Functions, whose value depends on the time they are called, so they cannot be evaluated by the converter
+RUNTIME_EL_FUNCTIONS = {"timestamp"}
+
+# The WF EL functions return templates rendered by Airflow with the macros of el_wf_functions.WF_MACROS
 WF_EL_FUNCTIONS = {
-    "wf:id": None,
-    "wf:name": None,
+    "wf:id": el_wf_functions.wf_id,
+    "wf:name": el_wf_functions.wf_name,
     "wf:appPath": None,
-    "wf:conf": None,
-    "wf:user": None,
+    "wf:conf": el_wf_functions.wf_conf,
+    "wf:user": el_wf_functions.wf_user,
     "wf:group": None,
     "wf:callback": None,
-    "wf:transition": None,
-    "wf:lastErrorNode": None,
-    "wf:errorCode": None,
-    "wf:errorMessage": None,
-    "wf:run": None,
+    "wf:transition": el_wf_functions.wf_transition,
+    "wf:lastErrorNode": el_wf_functions.wf_last_error_node,
+    "wf:errorCode": el_wf_functions.wf_error_code,
+    "wf:errorMessage": el_wf_functions.wf_error_message,
+    "wf:run": el_wf_functions.wf_run,
+    "wf:actionData": el_wf_functions.wf_action_data,
 }
 
 
@@ -85,50 +93,100 @@ def replace_el_with_var(el_function, params, quote=True):
 
 def parse_el_func(el_function, el_func_map=None):
     # Finds things like ${ function(arg1, arg2 } and returns
-    # a list like ['function', 'arg1, arg2']
+    # a string like 'mapped_function(arg1, arg2)'
     if el_func_map is None:
-        el_func_map = EL_FUNCTIONS
-    fn_match = FN_MATCH.findall(el_function)
+        el_func_map = {**EL_FUNCTIONS, **WF_EL_FUNCTIONS}
+    fn_match = FN_MATCH.search(el_function)
 
     if not fn_match:
         return None
 
-    # fn_match is of the form [('concat', "'ls', '-l'")]
-    # for an el function like ${concat('ls', '-l')}
-    if fn_match[0][0] not in el_func_map:
-        raise KeyError("{} EL function not supported.".format(fn_match[0][0]))
+    return _convert_el_func(fn_match, el_func_map)
+
+
+def _convert_el_func(fn_match, el_func_map):
+    """
+    Converts the EL function matched by FN_MATCH and the functions called in its arguments
+    to the calls of the mapped Python functions. Raises KeyError if any of them is not supported.
+    """
+    # For an el function like ${concat('ls', '-l')} the groups are ('concat', "'ls', '-l'")
+    func_name, args = fn_match.groups()
+    args = NESTED_FN_MATCH.sub(lambda match: _get_mapped_func_name(match.group(1), el_func_map) + "(", args)
+    return "{}({})".format(_get_mapped_func_name(func_name, el_func_map), args)
+
+
+def _get_mapped_func_name(func_name, el_func_map):
+    mapped_func = el_func_map.get(func_name)
+    if mapped_func is None:
+        raise KeyError("{} EL function not supported.".format(func_name))
+    return mapped_func.__name__
+
+
+def _convert_el_func_or_keep(fn_match):
+    """
+    Converts the matched EL function, the unsupported ones are left unchanged.
+    """
+    try:
+        return _convert_el_func(fn_match, {**EL_FUNCTIONS, **WF_EL_FUNCTIONS})
+    except KeyError as error:
+        logging.warning(f"{error.args[0]} Leaving it unchanged: {fn_match.group(0)}")
+        return fn_match.group(0)
 
-    mapped_func = el_func_map[fn_match[0][0]]
 
-    func_name = mapped_func.__name__
-    return "{}({})".format(func_name, fn_match[0][1])
+def _convert_el_func_in_text(fn_match):
+    """
+    Converts the matched EL function, which is a part of a text, to its value. The WF functions
+    return the templates rendered by Airflow and the basic functions are evaluated by the converter.
+    The unsupported functions and the functions with arguments other than constants are left unchanged.
+    """
+    func_name, args = fn_match.groups()
+    mapped_func = {**EL_FUNCTIONS, **WF_EL_FUNCTIONS}.get(func_name)
+    if mapped_func is None or func_name in RUNTIME_EL_FUNCTIONS:
+        logging.warning(
+            f"{func_name} EL function not supported in a text. Leaving it unchanged: {fn_match.group(0)}"
+        )
+        return fn_match.group(0)
+    try:
+        arg_values = ast.literal_eval(f"({args},)") if args.strip() else ()
+    except (ValueError, SyntaxError):
+        logging.warning(
+            f"The arguments of {func_name} are not constants. Leaving it unchanged: {fn_match.group(0)}"
+        )
+        return fn_match.group(0)
+    try:
+        return str(mapped_func(*arg_values))
+    except (ValueError, TypeError, re.error) as error:
+        logging.warning(f"Cannot evaluate {fn_match.group(0)}: {error}. Leaving it unchanged.")
+        return fn_match.group(0)
 
 
 def convert_el_to_jinja(oozie_el, quote=True):
     """
-    Converts an EL with either a function or a variable to the form:
+    Converts the ELs with functions and variables to the form:
     Variable:
         ${variable} -> {{ params.variable }}
         ${func()} -> mapped_func()
+    Function in a text:
+        id: ${wf:id()} -> id: {{ run_id }}
+        ${concat('a', 'b')}c -> abc
 
-    Only supports a single variable or a single EL function.
+    Only the ELs are replaced, the text around them is kept. The unsupported functions
+    are left unchanged.
 
     If quote is true, returns the string surround in single quotes, unless it
-    is a function, then no quotes are added.
+    is a single function, then no quotes are added.
     """
     # Matches oozie EL functions e.g. ${concat()}
-    fn_match = FN_MATCH.findall(oozie_el)
-    # Matches oozie EL variables e.g. ${hostname}
-    var_match = VAR_MATCH.findall(oozie_el)
-
-    jinjafied_el = oozie_el
-
+    fn_match = FN_MATCH.fullmatch(oozie_el)
     if fn_match:
-        jinjafied_el = parse_el_func(oozie_el)
-        return jinjafied_el
-    if var_match:
-        for var in var_match:
-            jinjafied_el = jinjafied_el.replace("${" + var + "}", "{{ params." + var + " }}")
+        jinjafied_el = _convert_el_func_or_keep(fn_match)
+        if jinjafied_el != oozie_el:
+            return jinjafied_el
+    else:
+        jinjafied_el = FN_MATCH.sub(_convert_el_func_in_text, oozie_el)
+
+    # Matches oozie EL variables e.g. ${hostname}
+    jinjafied_el = VAR_MATCH.sub(lambda match: "{{ params." + match.group(1) + " }}", jinjafied_el)
 
     return "'" + jinjafied_el + "'" if quote else jinjafied_el
 
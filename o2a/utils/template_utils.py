@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Template utilities"""
+import threading
 from typing import Dict, Any
 
 import jinja2
@@ -21,13 +22,33 @@ from o2a.definitions import TPL_PATH
 
 TEMPLATE_LOADER = jinja2.FileSystemLoader(searchpath=TPL_PATH)
 TEMPLATE_ENV = jinja2.Environment(loader=TEMPLATE_LOADER, undefined=jinja2.StrictUndefined)
+# The compiled templates are immutable, so they are shared by all the conversions, also those
+# running in other threads. Only filling the cache has to be synchronized.
 TEMPLATE_CACHES: Dict[str, Any] = {}
+TEMPLATE_CACHES_LOCK = threading.Lock()
+
+
+def get_template(template_name: str) -> jinja2.Template:
+    """Returns the compiled Jinja template"""
+    template = TEMPLATE_CACHES.get(template_name)
+    if template is None:
+        with TEMPLATE_CACHES_LOCK:
+            template = TEMPLATE_CACHES.get(template_name)
+            if template is None:
+                template = TEMPLATE_ENV.get_template(template_name)
+                TEMPLATE_CACHES[template_name] = template
+    return template
 
 
 def render_template(template_name: str, *args, **kwargs) -> str:
     """Render Jinja template"""
-    if template_name not in TEMPLATE_CACHES:
-        template = TEMPLATE_ENV.get_template(template_name)
-        TEMPLATE_CACHES[template_name] = template
-    content: str = TEMPLATE_CACHES[template_name].render(*args, **kwargs)
+    content: str = get_template(template_name).render(*args, **kwargs)
     return content
+
+
+def stream_template(template_name: str, *args, **kwargs) -> jinja2.environment.TemplateStream:
+    """
+    Render Jinja template piece by piece. The content is generated while it is being written,
+    so it is never kept in memory as a whole.
+    """
+    return get_template(template_name).stream(*args, **kwargs)
@@ -26,7 +26,7 @@ class MultipleNodeFoundException(Exception):
     pass
 
 
-def find_node_by_name(root, name) -> ET.Element:
+def find_node_by_name(root, name, index: Dict[str, List[ET.Element]] = None) -> ET.Element:
     """
     Find a node with an attribute 'name' the same as the passed in parameter
     name. Since we are refining by name there should only be one (1) node with
@@ -35,9 +35,14 @@ def find_node_by_name(root, name) -> ET.Element:
     :param root: The node of which to look under for the node name. Only looks
         at direct descendants -- not all descendants.
     :param name: Name of node to look for.
+    :param index: Optional, the direct descendants of the root by their names as returned by
+        `index_nodes_by_attribute`, used instead of searching all of them.
     :return: The XML node that was found, or raises an exception if not found.
     """
-    node = find_nodes_by_attribute(root, "name", name)
+    if index is not None:
+        node = index.get(name, [])
+    else:
+        node = find_nodes_by_attribute(root, "name", name)
 
     if not node:
         raise NoNodeFoundException("Node with name {} not found.".format(name))
@@ -86,6 +91,18 @@ def find_nodes_by_attribute(root, attr, val, tag=None) -> List[ET.Element]:
     return matching_nodes
 
 
+def index_nodes_by_attribute(root, attr) -> Dict[str, List[ET.Element]]:
+    """
+    Returns the direct descendants of the root by the values of the attribute `attr`,
+    so that many nodes can be found in a single pass over the descendants.
+    """
+    index: Dict[str, List[ET.Element]] = {}
+    for node in root:
+        if attr in node.attrib:
+            index.setdefault(node.attrib[attr], []).append(node)
+    return index
+
+
 def get_tag_el_text(root: ET.Element, tag: str, params: Dict[str, str], default: str = None):
     """
     If a node exists in the oozie_node with the tag specified in tag, it
@@ -0,0 +1,197 @@
+#!/usr/bin/env bash
+
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+set -uo pipefail
+
+#######################################
+# Show usage help
+# Globals:
+#   CMDNAME
+# Arguments:
+#   None
+# Returns:
+#   None
+#######################################
+usage() {
+      echo """
+Usage: ${CMDNAME} [FLAGS]
+
+Run a shell command directly on the master node of a dataproc cluster.
+
+The SSH connection to the master node is kept open for a while after the command finishes,
+so the following commands run by the same worker reuse it.
+
+Flags:
+
+-h, --help
+        Shows this help message.
+
+-e, --command <COMMAND>
+        Command to be executed.
+
+-c, --cluster <CLUSTER>
+        Cluster used to run the command on.
+
+-r, --region <REGION>
+        GCP Region where the cluster is located.
+
+-i, --internal-ip
+        Connect to the internal IP of the master node.
+"""
+}
+
+#######################################
+# Find the master node and the zone of the cluster. The result is cached, so that only
+# the first command run by the worker queries dataproc.
+# Globals:
+#   O2A_CACHE_DIR
+#   DATAPROC_CLUSTER_NAME
+#   GCP_REGION
+#   MASTER_NODE
+#   ZONE
+# Arguments:
+#   None
+# Returns:
+#   None
+#######################################
+function find_master_node {
+    local cache_file="${O2A_CACHE_DIR}/dataproc-${GCP_REGION}-${DATAPROC_CLUSTER_NAME}"
+    if [[ ! -s "${cache_file}" ]]; then
+        gcloud dataproc clusters describe "${DATAPROC_CLUSTER_NAME}" \
+            --region="${GCP_REGION}" \
+            --format="value(config.masterConfig.instanceNames[0],config.gceClusterConfig.zoneUri.basename())" \
+            > "${cache_file}.$$" && mv "${cache_file}.$$" "${cache_file}"
+        rm -f "${cache_file}.$$"
+    fi
+    MASTER_NODE=""
+    ZONE=""
+    if [[ -s "${cache_file}" ]]; then
+        read -r MASTER_NODE ZONE < "${cache_file}"
+    fi
+    if [[ -z "${MASTER_NODE}" ]]; then
+        MASTER_NODE="${DATAPROC_CLUSTER_NAME}-m"
+    fi
+}
+
+#######################################
+# Run the command on the master node
+# Globals:
+#   O2A_CACHE_DIR
+#   MASTER_NODE
+#   ZONE
+#   INTERNAL_IP
+#   COMMAND
+# Arguments:
+#   None
+# Returns:
+#   Exit code of the command
+#######################################
+function run_command {
+    local flags=()
+    if [[ -n "${ZONE}" ]]; then
+        flags+=("--zone=${ZONE}")
+    fi
+    if [[ "${INTERNAL_IP}" == "true" ]]; then
+        flags+=("--internal-ip")
+    fi
+    echo "Executing command on ${MASTER_NODE}: ${COMMAND}"
+    gcloud compute ssh "${MASTER_NODE}" \
+        ${flags[@]+"${flags[@]}"} \
+        --ssh-flag="-o ControlMaster=auto" \
+        --ssh-flag="-o ControlPath=${O2A_CACHE_DIR}/ssh-%C" \
+        --ssh-flag="-o ControlPersist=${O2A_SSH_CONTROL_PERSIST:-600}" \
+        --command="${COMMAND}"
+}
+
+function main() {
+    CMDNAME="$(basename -- "$0")"
+
+    COMMAND=""
+    DATAPROC_CLUSTER_NAME=""
+    GCP_REGION=""
+    INTERNAL_IP="false"
+    O2A_CACHE_DIR="${O2A_CACHE_DIR:-${TMPDIR:-/tmp}/o2a}"
+
+    local _SHORT_OPTIONS="h e: c: r: i"
+    local _LONG_OPTIONS="help command: cluster: region: internal-ip"
+
+    local PARAMS
+    PARAMS=$(getopt \
+        -o "${_SHORT_OPTIONS}" \
+        -l "${_LONG_OPTIONS}" \
+        --name "$CMDNAME" -- "$@")
+
+    # shellcheck disable=SC2181
+    if [[ $? -ne 0 ]]
+    then
+        usage
+    fi
+
+    eval set -- "${PARAMS}"
+    unset PARAMS
+
+    while true
+    do
+      case "${1}" in
+        -h|--help)
+          usage;
+          exit 0 ;;
+        -e|--command)
+          export COMMAND="${2}";
+          shift 2 ;;
+        -c|--cluster)
+          export DATAPROC_CLUSTER_NAME="${2}";
+          shift 2 ;;
+        -r|--region)
+          export GCP_REGION="${2}";
+          shift 2 ;;
+        -i|--internal-ip)
+          export INTERNAL_IP="true";
+          shift ;;
+        --)
+          shift ;
+          break ;;
+        *)
+          echo
+          echo "ERROR: Unknown argument ${1}"
+          echo
+          exit 1
+          ;;
+      esac
+    done
+
+    if [[ -z "${COMMAND}" ]]; then
+        echo "You should provide a command."
+        exit 1
+    fi
+
+    if [[ -z "${GCP_REGION}" ]]; then
+        echo "You should provide GCP region."
+        exit 1
+    fi
+
+    if [[ -z "${DATAPROC_CLUSTER_NAME}" ]]; then
+        echo "You should provide cluster."
+        exit 1
+    fi
+
+    mkdir -p "${O2A_CACHE_DIR}"
+
+    find_master_node
+    run_command
+}
+
+main "${@}"
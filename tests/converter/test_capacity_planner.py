@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests capacity planner"""
+import json
+import tempfile
+import unittest
+from xml.etree import ElementTree as ET
+
+from o2a.converter.capacity_planner import (
+    CapacityPlan,
+    CapacityProfile,
+    load_capacity_profile,
+    plan_capacity,
+    write_pools_file,
+)
+from o2a.converter.exceptions import O2AException
+from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.dummy_mapper import DummyMapper
+
+
+def _node(name, template_name):
+    return ParsedNode(
+        DummyMapper(ET.Element("dummy"), name=name), tasks=[Task(task_id=name, template_name=template_name)]
+    )
+
+
+class TestCapacityPlanner(unittest.TestCase):
+    def setUp(self):
+        nodes = [
+            _node("fork", "dummy.tpl"),
+            _node("spark_1", "spark.tpl"),
+            _node("spark_2", "spark.tpl"),
+            _node("spark_3", "spark.tpl"),
+            _node("pig", "pig.tpl"),
+            _node("join", "dummy.tpl"),
+        ]
+        relations = [
+            ("fork", "spark_1"),
+            ("fork", "spark_2"),
+            ("fork", "spark_3"),
+            ("fork", "pig"),
+            ("spark_1", "join"),
+            ("spark_2", "join"),
+            ("spark_3", "join"),
+            ("pig", "join"),
+        ]
+        self.workflow = Workflow(
+            input_directory_path="in_dir",
+            output_directory_path="out_dir",
+            dag_name="test_dag",
+            nodes={node.tasks[0].task_id: node for node in nodes},
+            relations={Relation(from_task_id=a, to_task_id=b) for a, b in relations},
+        )
+
+    def test_plan_capacity(self):
+        plan = plan_capacity(self.workflow, CapacityProfile())
+
+        self.assertEqual(
+            CapacityPlan(concurrency=4, max_active_runs=1, pools={"o2a_pig": 1, "o2a_spark": 3}), plan
+        )
+
+    def test_plan_capacity_capped_by_profile(self):
+        profile = CapacityProfile(max_concurrency=6, max_active_runs=2, pool_slots={"spark": 2})
+
+        plan = plan_capacity(self.workflow, profile)
+
+        self.assertEqual(
+            CapacityPlan(concurrency=6, max_active_runs=2, pools={"o2a_pig": 2, "o2a_spark": 2}), plan
+        )
+
+    def test_plan_capacity_of_branches_with_different_length(self):
+        self.workflow.relations.remove(Relation(from_task_id="fork", to_task_id="spark_3"))
+        self.workflow.relations.add(Relation(from_task_id="pig", to_task_id="spark_3"))
+
+        plan = plan_capacity(self.workflow, CapacityProfile())
+
+        self.assertEqual(3, plan.concurrency)
+        self.assertEqual(2, plan.pools["o2a_spark"])
+
+    def test_load_capacity_profile(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as file:
+            json.dump({"max_concurrency": 8, "pool_slots": {"spark": 2}}, file)
+            file.flush()
+
+            self.assertEqual(
+                CapacityProfile(max_concurrency=8, pool_slots={"spark": 2}), load_capacity_profile(file.name)
+            )
+
+    def test_load_capacity_profile_unknown_key(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as file:
+            json.dump({"concurrency": 8}, file)
+            file.flush()
+
+            with self.assertRaises(O2AException):
+                load_capacity_profile(file.name)
+
+    def test_write_pools_file(self):
+        plan = CapacityPlan(concurrency=4, max_active_runs=1, pools={"o2a_spark": 3})
+        with tempfile.NamedTemporaryFile("r", suffix=".json") as file:
+            write_pools_file(plan, file.name, "test_dag")
+
+            self.assertEqual(
+                {"o2a_spark": {"description": "Pool created for the test_dag DAG by o2a", "slots": 3}},
+                json.load(file),
+            )
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the configuration store"""
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+from xml.etree import ElementTree as ET
+
+from o2a.converter.configuration_store import (
+    ConfigurationStore,
+    ConfigurationView,
+    parse_configuration,
+    parse_job_xml,
+    read_job_xml,
+)
+from o2a.converter.exceptions import ParseException
+
+# language=XML
+JOB_XML = """
+<configuration>
+    <property>
+        <name>mapred.job.queue.name</name>
+        <value>${queueName}</value>
+    </property>
+    <property>
+        <name>mapred.output.dir</name>
+        <value>/user/${userName}/output</value>
+    </property>
+</configuration>
+"""
+
+
+class ParseConfigurationTestCase(unittest.TestCase):
+    def test_parse_configuration(self):
+        # language=XML
+        config_node_str = """
+<configuration>
+    <property>
+        <name>mapred.job.queue.name</name>
+        <value>${queueName}</value>
+    </property>
+    <property>
+        <name>mapred.map.output.compress</name>
+        <value>false</value>
+    </property>
+</configuration>
+"""
+        config_node = ET.fromstring(config_node_str)
+
+        properties = parse_configuration(config_node, params={"queueName": "myQueue"})
+
+        self.assertEqual(
+            {"mapred.job.queue.name": "myQueue", "mapred.map.output.compress": "false"}, properties
+        )
+
+
+class ParseJobXmlTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "job.xml")
+        with open(self.path, "w") as file:
+            file.write(JOB_XML)
+
+    def test_parse_job_xml(self):
+        self.assertEqual(
+            {"mapred.job.queue.name": "myQueue", "mapred.output.dir": "/user/test/output"},
+            parse_job_xml(self.path, params={"queueName": "myQueue", "userName": "test"}),
+        )
+
+    def test_parse_job_xml_missing_file(self):
+        with self.assertRaisesRegex(ParseException, "missing.xml"):
+            parse_job_xml(os.path.join(self.directory.name, "missing.xml"), params={})
+
+    def test_parse_job_xml_invalid_file(self):
+        with open(self.path, "w") as file:
+            file.write("<configuration>")
+        with self.assertRaisesRegex(ParseException, "job.xml"):
+            parse_job_xml(self.path, params={})
+
+    def test_job_xml_parsed_once(self):
+        store = ConfigurationStore()
+
+        with mock.patch(
+            "o2a.converter.configuration_store.parse_job_xml", wraps=parse_job_xml
+        ) as parse_job_xml_mock:
+            block_a = store.get_job_xml_configuration(self.path, params={})
+            block_b = store.get_job_xml_configuration(
+                os.path.join(self.directory.name, ".", "job.xml"), params={}
+            )
+            unpickled_block = pickle.loads(pickle.dumps(store)).get_job_xml_configuration(self.path, {})
+
+        parse_job_xml_mock.assert_called_once_with(self.path, {})
+        self.assertIs(block_a, block_b)
+        self.assertEqual(block_a, unpickled_block)
+
+
+    def test_job_xml_read_once_per_run(self):
+        with mock.patch("o2a.converter.configuration_store.ET.parse", wraps=ET.parse) as parse_mock:
+            block_a = ConfigurationStore().get_job_xml_configuration(self.path, params={"userName": "a"})
+            block_b = ConfigurationStore().get_job_xml_configuration(self.path, params={"userName": "b"})
+
+        parse_mock.assert_called_once_with(self.path)
+        self.assertEqual("/user/a/output", block_a["mapred.output.dir"])
+        self.assertEqual("/user/b/output", block_b["mapred.output.dir"])
+
+    def test_changed_job_xml_read_again(self):
+        read_job_xml(self.path)
+        with open(self.path, "w") as file:
+            file.write(JOB_XML.replace("/output", "/results"))
+
+        self.assertIn(("mapred.output.dir", "/user/${userName}/results"), read_job_xml(self.path))
+
+
+class ConfigurationViewTestCase(unittest.TestCase):
+    def setUp(self):
+        self.global_block = {"queue": "default", "compress": "false"}
+        self.action_block = {"queue": "myQueue"}
+        self.view = ConfigurationView(self.global_block, self.action_block)
+
+    def test_later_blocks_override(self):
+        self.assertEqual({"queue": "myQueue", "compress": "false"}, self.view)
+        self.assertEqual("myQueue", self.view["queue"])
+        self.assertEqual(2, len(self.view))
+        self.assertEqual(["queue", "compress"], list(self.view))
+        self.assertNotIn("unknown", self.view)
+        self.assertTrue(self.view.is_shared)
+
+    def test_copy_on_write(self):
+        self.view["compress"] = "true"
+        del self.view["queue"]
+
+        self.assertFalse(self.view.is_shared)
+        self.assertEqual({"compress": "true"}, self.view)
+        self.assertEqual({"queue": "default", "compress": "false"}, self.global_block)
+        self.assertEqual({"queue": "myQueue"}, self.action_block)
+
+    def test_repr(self):
+        self.assertEqual("{'queue': 'myQueue', 'compress': 'false'}", repr(self.view))
+        self.assertEqual("{}", repr(ConfigurationView()))
+
+    def test_pickle(self):
+        view = pickle.loads(pickle.dumps(ConfigurationStore().get_configuration({"queue": "myQueue"})))
+
+        self.assertEqual({"queue": "myQueue"}, view)
+        self.assertTrue(view.is_shared)
+        view["queue"] = "changed"
+        self.assertEqual({"queue": "changed"}, view)
+
+
+class ConfigurationStoreTestCase(unittest.TestCase):
+    def test_identical_blocks_are_shared(self):
+        store = ConfigurationStore()
+
+        view_a = store.get_configuration({"queue": "myQueue"})
+        view_b = store.get_configuration({"queue": "myQueue"})
+        view_c = store.get_configuration({"queue": "other"})
+        store.get_configuration()
+
+        self.assertEqual(2, len(store))
+        self.assertIs(store.intern({"queue": "myQueue"}), store.intern(dict(view_a)))
+        self.assertEqual(view_a, view_b)
+        self.assertNotEqual(view_a, view_c)
+
+    def test_shared_blocks_are_read_only(self):
+        store = ConfigurationStore()
+        view_a = store.get_configuration({"queue": "myQueue"})
+        view_b = store.get_configuration({"queue": "myQueue"})
+
+        view_a["queue"] = "changed"
+
+        self.assertEqual({"queue": "myQueue"}, view_b)
+        with self.assertRaises(TypeError):
+            store.intern({"queue": "myQueue"})["queue"] = "changed"  # type: ignore
+
+    def test_global_configuration(self):
+        store = ConfigurationStore(global_configuration={"queue": "default", "compress": "false"})
+
+        self.assertEqual({"queue": "default", "compress": "false"}, store.get_configuration())
+        self.assertEqual(
+            {"queue": "myQueue", "compress": "false"}, store.get_configuration({"queue": "myQueue"})
+        )
+
+    def test_pickle(self):
+        store = ConfigurationStore(global_configuration={"queue": "default"})
+        store.get_configuration({"compress": "false"})
+
+        unpickled_store = pickle.loads(pickle.dumps(store))
+
+        self.assertEqual(2, len(unpickled_store))
+        self.assertEqual(
+            {"queue": "default", "compress": "false"},
+            unpickled_store.get_configuration({"compress": "false"}),
+        )
+        self.assertEqual(2, len(unpickled_store))
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the splitting of the tasks between the modules"""
+import unittest
+from xml.etree import ElementTree as ET
+
+from o2a.converter.dag_sharder import get_node_layers, shard_workflow
+from o2a.converter.exceptions import O2AException
+from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.dummy_mapper import DummyMapper
+
+
+def create_node(name: str, task_count: int = 1) -> ParsedNode:
+    tasks = [Task(task_id=f"{name}_{i}" if i else name, template_name="dummy.tpl") for i in range(task_count)]
+    relations = [Relation(from_task_id=a.task_id, to_task_id=b.task_id) for a, b in zip(tasks, tasks[1:])]
+    return ParsedNode(DummyMapper(ET.Element("dummy"), name=name), tasks=tasks, relations=relations)
+
+
+class ShardWorkflowTestCase(unittest.TestCase):
+    def setUp(self):
+        # start -> A -> C -> end, start -> B -> end
+        self.workflow = Workflow(input_directory_path="", output_directory_path="", dag_name="DAG_NAME")
+        for node in [create_node("start"), create_node("A", 2), create_node("B"), create_node("C")]:
+            self.workflow.nodes[node.mapper.name] = node
+        self.workflow.nodes["end"] = ParsedNode(DummyMapper(ET.Element("dummy"), name="end"))
+        self.workflow.relations = [
+            Relation(from_task_id="start", to_task_id="A"),
+            Relation(from_task_id="start", to_task_id="B"),
+            Relation(from_task_id="A_1", to_task_id="C"),
+            Relation(from_task_id="B", to_task_id="C"),
+        ]
+
+    def test_get_node_layers(self):
+        self.assertEqual([["start"], ["A", "B"], ["C"]], get_node_layers(self.workflow))
+
+    def test_shard_workflow(self):
+        shards = shard_workflow(self.workflow, max_tasks=3)
+
+        self.assertEqual(["part_0", "part_1"], [shard.module_name for shard in shards])
+        self.assertEqual(
+            [["start", "A"], ["B", "C"]], [[node.mapper.name for node in shard.nodes] for shard in shards]
+        )
+        self.assertEqual([Relation(from_task_id="start", to_task_id="A")], shards[0].relations)
+        self.assertEqual([], shards[0].upstream_relations)
+        self.assertEqual(["start", "A_1"], shards[0].exported_task_ids)
+        self.assertEqual([Relation(from_task_id="B", to_task_id="C")], shards[1].relations)
+        self.assertEqual(
+            [Relation(from_task_id="start", to_task_id="B"), Relation(from_task_id="A_1", to_task_id="C")],
+            shards[1].upstream_relations,
+        )
+        self.assertEqual([], shards[1].exported_task_ids)
+
+    def test_shard_workflow_node_larger_than_shard(self):
+        shards = shard_workflow(self.workflow, max_tasks=1)
+
+        self.assertEqual(
+            [["start"], ["A"], ["B"], ["C"]], [[node.mapper.name for node in shard.nodes] for shard in shards]
+        )
+
+    def test_shard_workflow_single_shard(self):
+        shards = shard_workflow(self.workflow, max_tasks=100)
+
+        self.assertEqual(1, len(shards))
+        self.assertEqual(list(self.workflow.relations), shards[0].relations)
+        self.assertEqual([], shards[0].exported_task_ids)
+
+    def test_shard_workflow_empty(self):
+        workflow = Workflow(input_directory_path="", output_directory_path="", dag_name="DAG_NAME")
+
+        self.assertEqual([], shard_workflow(workflow, max_tasks=10))
+
+    def test_shard_workflow_invalid_size(self):
+        with self.assertRaisesRegex(O2AException, "positive"):
+            shard_workflow(self.workflow, max_tasks=0)
+
+    def test_shard_workflow_cycle(self):
+        self.workflow.relations.add(Relation(from_task_id="C", to_task_id="start"))
+
+        with self.assertRaisesRegex(O2AException, "cycle"):
+            shard_workflow(self.workflow, max_tasks=3)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the workflow graph"""
+import unittest
+
+from o2a.converter.exceptions import O2AException
+from o2a.converter.graph import Graph, build_task_graph
+from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.mappers.dummy_mapper import DummyMapper
+
+
+class GraphTestCase(unittest.TestCase):
+    def setUp(self):
+        # A -> B -> D, A -> C -> D, E
+        self.graph = Graph(["A", "B", "C", "D", "E"], [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D")])
+
+    def test_add_edge(self):
+        self.graph.add_edge("A", "B")
+        self.graph.add_edge("D", "F")
+
+        self.assertEqual(6, len(self.graph))
+        self.assertIn("F", self.graph)
+        self.assertEqual(["B", "C"], self.graph.downstream("A"))
+        self.assertEqual(["D"], self.graph.upstream("F"))
+        self.assertEqual(
+            [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D"), ("D", "F")], list(self.graph.edges())
+        )
+
+    def test_degrees(self):
+        self.assertEqual(2, self.graph.out_degree("A"))
+        self.assertEqual(0, self.graph.in_degree("A"))
+        self.assertEqual(2, self.graph.in_degree("D"))
+        self.assertEqual(["A", "E"], self.graph.roots())
+        self.assertEqual(["D", "E"], self.graph.leaves())
+
+    def test_topological_order(self):
+        order = self.graph.topological_order()
+
+        self.assertEqual({"A", "B", "C", "D", "E"}, set(order))
+        for from_name, to_name in self.graph.edges():
+            self.assertLess(order.index(from_name), order.index(to_name))
+
+    def test_topological_order_cycle(self):
+        self.graph.add_edge("D", "A")
+
+        with self.assertRaisesRegex(O2AException, "cycle: A -> B -> D -> A"):
+            self.graph.topological_order()
+
+    def test_layers(self):
+        self.graph.add_edge("A", "D")
+
+        self.assertEqual([["A", "E"], ["B", "C"], ["D"]], self.graph.layers())
+
+    def test_layers_cycle(self):
+        self.graph.add_edge("D", "A")
+
+        with self.assertRaisesRegex(O2AException, "cycle: A -> B -> D -> A"):
+            self.graph.layers()
+
+    def test_find_cycle(self):
+        self.assertIsNone(self.graph.find_cycle())
+        self.assertFalse(self.graph.has_cycle())
+
+        self.graph.add_edge("C", "E")
+        self.graph.add_edge("E", "C")
+
+        self.assertEqual(["C", "E", "C"], self.graph.find_cycle())
+        self.assertTrue(self.graph.has_cycle())
+
+    def test_reachable(self):
+        self.assertEqual({"B", "C", "D"}, self.graph.reachable("A"))
+        self.assertEqual(set(), self.graph.reachable("D"))
+        self.assertTrue(self.graph.has_path("A", "D"))
+        self.assertFalse(self.graph.has_path("D", "A"))
+        self.assertFalse(self.graph.has_path("A", "E"))
+
+    def test_reachable_cycle(self):
+        self.graph.add_edge("D", "A")
+
+        self.assertEqual({"A", "B", "C", "D"}, self.graph.reachable("A"))
+
+
+class BuildTaskGraphTestCase(unittest.TestCase):
+    def test_build_task_graph(self):
+        workflow = Workflow(input_directory_path="", output_directory_path="", dag_name="DAG_NAME_B")
+        workflow.nodes["node_a"] = ParsedNode(
+            DummyMapper(oozie_node=None, name="node_a"),
+            tasks=[Task(task_id="task_a1", template_name=""), Task(task_id="task_a2", template_name="")],
+            relations=[Relation(from_task_id="task_a1", to_task_id="task_a2")],
+        )
+        workflow.nodes["node_b"] = ParsedNode(
+            DummyMapper(oozie_node=None, name="node_b"), tasks=[Task(task_id="task_b", template_name="")]
+        )
+        workflow.relations = {
+            Relation(from_task_id="task_a2", to_task_id="task_b"),
+            Relation(from_task_id="task_b", to_task_id="removed_node"),
+        }
+
+        graph = build_task_graph(workflow)
+
+        self.assertEqual(["task_a1", "task_a2", "task_b"], list(graph))
+        self.assertEqual([("task_a1", "task_a2"), ("task_a2", "task_b")], list(graph.edges()))
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the manifest of the output files"""
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+
+from o2a import sync
+from o2a.converter.exceptions import O2AException
+from o2a.converter.manifest import create_manifest, sync_files, write_manifest
+
+
+def write_file(path: str, content: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        file.write(content)
+
+
+def read_file(path: str) -> str:
+    with open(path) as file:
+        return file.read()
+
+
+class ManifestTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output_path = os.path.join(self.directory.name, "output")
+        # The target directory stands in for the DAG bucket
+        self.target_path = os.path.join(self.directory.name, "dags")
+        self.manifest_file = os.path.join(self.output_path, "dag_manifest.json")
+        write_file(os.path.join(self.output_path, "dag.py"), "dag")
+        write_file(os.path.join(self.output_path, "dag_tasks", "part_0.py"), "part_0")
+        write_file(os.path.join(self.output_path, "dag_tasks", "__pycache__", "part_0.pyc"), "bytecode")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_create_manifest(self):
+        manifest = create_manifest(self.output_path)
+
+        self.assertEqual(
+            {
+                "dag.py": hashlib.sha256(b"dag").hexdigest(),
+                "dag_tasks/part_0.py": hashlib.sha256(b"part_0").hexdigest(),
+            },
+            manifest,
+        )
+
+    def test_write_manifest(self):
+        write_manifest(self.output_path, self.manifest_file)
+        manifest = write_manifest(self.output_path, self.manifest_file)
+
+        self.assertEqual(["dag.py", "dag_tasks/part_0.py"], list(manifest))
+        with open(self.manifest_file) as file:
+            self.assertEqual(manifest, json.load(file))
+
+    def test_sync_files(self):
+        write_manifest(self.output_path, self.manifest_file)
+
+        report = sync_files(self.manifest_file, self.target_path)
+
+        self.assertEqual(["dag.py", "dag_tasks/part_0.py"], report.copied)
+        self.assertEqual("part_0", read_file(os.path.join(self.target_path, "dag_tasks", "part_0.py")))
+        self.assertEqual(
+            read_file(self.manifest_file), read_file(os.path.join(self.target_path, "dag_manifest.json"))
+        )
+        self.assertFalse(os.path.exists(os.path.join(self.target_path, "dag_tasks", "__pycache__")))
+
+    def test_sync_files_changed(self):
+        write_manifest(self.output_path, self.manifest_file)
+        sync_files(self.manifest_file, self.target_path)
+        os.remove(os.path.join(self.output_path, "dag_tasks", "part_0.py"))
+        write_file(os.path.join(self.output_path, "dag_tasks", "part_1.py"), "part_1")
+        write_file(os.path.join(self.output_path, "dag.py"), "changed dag")
+        write_manifest(self.output_path, self.manifest_file)
+
+        report = sync_files(self.manifest_file, self.target_path)
+
+        self.assertEqual(["dag.py", "dag_tasks/part_1.py"], report.copied)
+        self.assertEqual(["dag_tasks/part_0.py"], report.deleted)
+        self.assertEqual("changed dag", read_file(os.path.join(self.target_path, "dag.py")))
+        self.assertEqual(["part_1.py"], os.listdir(os.path.join(self.target_path, "dag_tasks")))
+
+    def test_sync_files_unchanged(self):
+        write_manifest(self.output_path, self.manifest_file)
+        sync_files(self.manifest_file, self.target_path)
+        os.remove(os.path.join(self.target_path, "dag.py"))
+
+        report = sync_files(self.manifest_file, self.target_path)
+
+        self.assertEqual(["dag.py"], report.copied)
+        self.assertEqual(["dag_tasks/part_0.py"], report.unchanged)
+        self.assertEqual([], report.deleted)
+
+    def test_sync_files_keep_removed(self):
+        write_manifest(self.output_path, self.manifest_file)
+        sync_files(self.manifest_file, self.target_path)
+        os.remove(os.path.join(self.output_path, "dag.py"))
+        write_manifest(self.output_path, self.manifest_file)
+
+        report = sync_files(self.manifest_file, self.target_path, delete=False)
+
+        self.assertEqual([], report.deleted)
+        self.assertTrue(os.path.isfile(os.path.join(self.target_path, "dag.py")))
+
+    def test_sync_files_modified_after_manifest(self):
+        write_manifest(self.output_path, self.manifest_file)
+        write_file(os.path.join(self.output_path, "dag.py"), "changed dag")
+
+        with self.assertRaisesRegex(O2AException, "changed after the manifest"):
+            sync_files(self.manifest_file, self.target_path)
+
+    def test_parse_args(self):
+        args = sync.parse_args(["-m", self.manifest_file, "-t", self.target_path, "--keep-removed"])
+
+        self.assertEqual(self.manifest_file, args.manifest_file)
+        self.assertEqual(self.target_path, args.target_directory_path)
+        self.assertTrue(args.keep_removed)
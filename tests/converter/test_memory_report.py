@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the memory report"""
+import sys
+import unittest
+from xml.etree import ElementTree as ET
+
+from o2a.converter.memory_report import MemoryReport, format_size, get_retained_size
+
+
+class MemoryReportTestCase(unittest.TestCase):
+    def test_get_retained_size(self):
+        shared = ["shared"]
+        leaf = "x" * 1000
+        root = [leaf, shared]
+
+        size = get_retained_size([root], stop={id(shared)})
+
+        self.assertEqual(sys.getsizeof(root) + sys.getsizeof(leaf), size)
+
+    def test_get_retained_size_skips_shared_objects(self):
+        root = [MemoryReport, sys]
+
+        self.assertEqual(sys.getsizeof(root), get_retained_size([root], stop=set()))
+
+    def test_snapshot(self):
+        report = MemoryReport(top_sites=3)
+        report.start()
+        try:
+            elements = [ET.Element("action", name=str(i)) for i in range(100)]
+            report.snapshot("parse")
+        finally:
+            report.stop()
+        report.snapshot("not traced")
+
+        self.assertEqual(["parse"], [phase.phase for phase in report.phases])
+        phase = report.phases[0]
+        self.assertLessEqual(phase.current, phase.peak)
+        self.assertTrue(0 < len(phase.top_sites) <= 3)
+        self.assertGreaterEqual(phase.retained["XML elements"].count, len(elements))
+        self.assertIn("After parse:", report.format())
+        self.assertIn("XML elements", report.format())
+
+    def test_format_size(self):
+        self.assertEqual("10 B", format_size(10))
+        self.assertEqual("1.5 KiB", format_size(1536))
+        self.assertEqual("2.0 GiB", format_size(2 * 2 ** 30))
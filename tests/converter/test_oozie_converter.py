@@ -15,16 +15,21 @@
 """Tests Oozie Converter"""
 
 import io
+import os
+import tempfile
 from pathlib import Path
 from unittest import mock, TestCase
 from xml.etree import ElementTree as ET
 
 from o2a import o2a
+from o2a.converter import parser
+from o2a.converter.capacity_planner import CapacityPlan
 from o2a.converter.oozie_converter import OozieConverter
 from o2a.converter.mappers import CONTROL_MAP, ACTION_MAP
 from o2a.converter.parsed_node import ParsedNode
 
 from o2a.converter.task import Task
+from o2a.converter.worker_pool import WorkerPool
 from o2a.converter.workflow import Workflow
 from o2a.converter.relation import Relation
 from o2a.mappers.dummy_mapper import DummyMapper
@@ -55,10 +60,186 @@ class TestOozieConverter(TestCase):
         args = o2a.parse_args(["-i", input_dir, "-o", output_dir, "-u", user])
         self.assertEqual(args.user, user)
 
-    @mock.patch("o2a.converter.oozie_converter.render_template", return_value="AAA")
+    def test_parse_args_direct_shell(self):
+        args = o2a.parse_args(["-i", "/tmp/does.not.exist", "-o", "/tmp/out/", "--direct-shell"])
+        self.assertTrue(args.direct_shell)
+
+    def test_parse_args_skip_formatting(self):
+        args = o2a.parse_args(["-i", "/tmp/does.not.exist", "-o", "/tmp/out/", "--skip-formatting"])
+        self.assertTrue(args.skip_formatting)
+
+    def test_parse_args_shard_size(self):
+        args = o2a.parse_args(["-i", "/tmp/does.not.exist", "-o", "/tmp/out/", "--shard-size", "100"])
+        self.assertEqual(100, args.shard_size)
+
+    def test_parse_args_memory_report(self):
+        args = o2a.parse_args(["-i", "/tmp/does.not.exist", "-o", "/tmp/out/", "--memory-report"])
+        self.assertTrue(args.memory_report)
+
+    def test_parse_args_workers(self):
+        args = o2a.parse_args(["-i", "/tmp/does.not.exist", "-o", "/tmp/out/", "--workers", "4"])
+        self.assertEqual(4, args.workers)
+
+    def test_parse_args_simplify_graph(self):
+        args = o2a.parse_args(["-i", "/tmp/does.not.exist", "-o", "/tmp/out/", "--simplify-graph"])
+        self.assertTrue(args.simplify_graph)
+
+    @mock.patch("o2a.converter.oozie_converter.simplify_workflow")
+    @mock.patch("o2a.converter.oozie_converter.OozieConverter.copy_extra_assets")
+    @mock.patch("o2a.converter.oozie_converter.OozieConverter.create_dag_file")
+    @mock.patch("o2a.converter.oozie_converter.OozieConverter.convert_nodes")
+    @mock.patch("o2a.converter.parser.OozieParser.parse_workflow")
+    def test_convert_simplify_graph(self, _, convert_nodes_mock, create_dag_file_mock, __, simplify_mock):
+        self.converter.simplify_graph = True
+
+        self.converter.convert()
+
+        workflow = self.converter.parser.workflow
+        convert_nodes_mock.assert_called_once_with(workflow.nodes, pool=None)
+        simplify_mock.assert_called_once_with(workflow)
+        create_dag_file_mock.assert_called_once_with(workflow)
+
+    def test_parse_args_prioritize_critical_path(self):
+        args = o2a.parse_args(
+            [
+                "-i",
+                "/tmp/does.not.exist",
+                "-o",
+                "/tmp/out/",
+                "--task-durations-file",
+                "/tmp/durations.json",
+                "--action-pools",
+            ]
+        )
+        self.assertFalse(args.prioritize_critical_path)
+        self.assertEqual("/tmp/durations.json", args.task_durations_file)
+        self.assertTrue(args.action_pools)
+
+    @mock.patch("o2a.converter.oozie_converter.load_task_durations", return_value={"AAA": 10.0})
+    @mock.patch("o2a.converter.oozie_converter.prioritize_tasks")
+    @mock.patch("o2a.converter.oozie_converter.OozieConverter.copy_extra_assets")
+    @mock.patch("o2a.converter.oozie_converter.OozieConverter.create_dag_file")
+    @mock.patch("o2a.converter.oozie_converter.OozieConverter.convert_nodes")
+    @mock.patch("o2a.converter.parser.OozieParser.parse_workflow")
+    def test_convert_prioritize_critical_path(self, _, __, ___, ____, prioritize_mock, load_mock):
+        self.converter.prioritize_critical_path = True
+        self.converter.task_durations_file = "/tmp/durations.json"
+        self.converter.action_pools = True
+
+        self.converter.convert()
+
+        load_mock.assert_called_once_with("/tmp/durations.json")
+        prioritize_mock.assert_called_once_with(
+            self.converter.parser.workflow, durations={"AAA": 10.0}, assign_pools=True
+        )
+
+    @mock.patch("o2a.converter.oozie_converter.write_pools_file")
+    @mock.patch("o2a.converter.oozie_converter.plan_capacity")
+    @mock.patch("o2a.converter.oozie_converter.load_capacity_profile")
+    @mock.patch("o2a.converter.oozie_converter.prioritize_tasks")
+    @mock.patch("o2a.converter.oozie_converter.OozieConverter.copy_extra_assets")
+    @mock.patch("o2a.converter.oozie_converter.OozieConverter.create_dag_file")
+    @mock.patch("o2a.converter.oozie_converter.OozieConverter.convert_nodes")
+    @mock.patch("o2a.converter.parser.OozieParser.parse_workflow")
+    def test_convert_capacity_profile(
+        self, _, __, ___, ____, prioritize_mock, load_mock, plan_mock, write_pools_mock
+    ):
+        converter = OozieConverter(
+            dag_name="test_dag",
+            input_directory_path="/input_directory_path/",
+            output_directory_path="/tmp",
+            action_mapper=ACTION_MAP,
+            control_mapper=CONTROL_MAP,
+            user="USER",
+            capacity_profile_file="/tmp/profile.json",
+        )
+
+        converter.convert()
+
+        workflow = converter.parser.workflow
+        prioritize_mock.assert_called_once_with(workflow, durations=None, assign_pools=True)
+        load_mock.assert_called_once_with("/tmp/profile.json")
+        plan_mock.assert_called_once_with(workflow, load_mock.return_value)
+        self.assertEqual(plan_mock.return_value, converter.capacity_plan)
+        write_pools_mock.assert_called_once_with(
+            plan_mock.return_value, "/tmp/test_dag_pools.json", "test_dag"
+        )
+
+    @mock.patch("o2a.converter.oozie_converter.OozieConverter.copy_extra_assets")
+    @mock.patch("o2a.converter.oozie_converter.OozieConverter.create_dag_file")
+    @mock.patch("o2a.converter.oozie_converter.OozieConverter.convert_nodes")
+    @mock.patch("o2a.converter.parser.OozieParser.parse_workflow")
+    def test_convert_memory_report(self, _, __, ___, ____):
+        self.converter.memory_report = mock.Mock()
+
+        self.converter.convert()
+
+        self.converter.memory_report.snapshot.assert_has_calls(
+            [mock.call("parse"), mock.call("node conversion")]
+        )
+
+    def test_convert_nodes_emits_prepare_tasks_only_with_prepare_work(self):
+        # language=XML
+        shell_action = """
+<action name="{name}">
+    <shell>
+        <resource-manager>${{resourceManager}}</resource-manager>
+        <name-node>${{nameNode}}</name-node>
+        {prepare}
+        <exec>echo</exec>
+    </shell>
+    <ok to="join"/>
+    <error to="fail"/>
+</action>
+"""
+        actions = {
+            "with_prepare": '<prepare><delete path="${nameNode}/output"/></prepare>',
+            "empty_prepare": "<prepare></prepare>",
+            "no_prepare": "",
+        }
+        # language=XML
+        workflow_xml = f"""
+<workflow-app xmlns="uri:oozie:workflow:1.0" name="prepare-wf">
+    <start to="fork"/>
+    <fork name="fork">
+        {"".join(f'<path start="{name}"/>' for name in actions)}
+    </fork>
+    {"".join(shell_action.format(name=name, prepare=prepare) for name, prepare in actions.items())}
+    <join name="join" to="end"/>
+    <kill name="fail">
+        <message>Failed</message>
+    </kill>
+    <end name="end"/>
+</workflow-app>
+"""
+        with tempfile.TemporaryDirectory() as input_directory_path:
+            os.makedirs(os.path.join(input_directory_path, "hdfs"))
+            with open(os.path.join(input_directory_path, "hdfs", "workflow.xml"), "w") as file:
+                file.write(workflow_xml)
+            oozie_parser = parser.OozieParser(
+                input_directory_path=input_directory_path,
+                output_directory_path="/tmp",
+                params={"nameNode": "hdfs://", "dataproc_cluster": "AAA", "gcp_region": "BBB"},
+                action_mapper=ACTION_MAP,
+                control_mapper=CONTROL_MAP,
+            )
+            oozie_parser.parse_workflow()
+
+        workflow = oozie_parser.workflow
+        OozieConverter.convert_nodes(workflow.nodes)
+
+        task_ids = [task.task_id for node in workflow.nodes.values() for task in node.tasks]
+        self.assertEqual(
+            ["fork", "with_prepare_prepare", "with_prepare", "empty_prepare", "no_prepare", "join"], task_ids
+        )
+        self.assertIn(Relation(from_task_id="fork", to_task_id="with_prepare_prepare"), workflow.relations)
+        self.assertIn(Relation(from_task_id="fork", to_task_id="empty_prepare"), workflow.relations)
+        self.assertIn(Relation(from_task_id="fork", to_task_id="no_prepare"), workflow.relations)
+
+    @mock.patch("o2a.converter.oozie_converter.stream_template")
     @mock.patch("builtins.open", return_value=io.StringIO())
     @mock.patch("o2a.converter.oozie_converter.black")
-    def test_create_dag_file(self, black_mock, open_mock, _):
+    def test_create_dag_file(self, black_mock, open_mock, stream_template_mock):
         workflow = Workflow(
             dag_name="A",
             input_directory_path="in_dir",
@@ -70,10 +251,104 @@ class TestOozieConverter(TestCase):
 
         self.converter.create_dag_file(workflow)
         open_mock.assert_called_once_with("/tmp/test_dag.py", "w")
+        stream_template_mock.return_value.dump.assert_called_once_with(open_mock.return_value)
         black_mock.format_file_in_place.assert_called_once_with(
             Path("/tmp/test_dag.py"), fast=mock.ANY, mode=mock.ANY, write_back=mock.ANY
         )
 
+    @mock.patch("o2a.converter.oozie_converter.stream_template")
+    @mock.patch("builtins.open", return_value=io.StringIO())
+    @mock.patch("o2a.converter.oozie_converter.black")
+    def test_create_dag_file_skip_formatting(self, black_mock, _, __):
+        workflow = Workflow(dag_name="A", input_directory_path="in_dir", output_directory_path="out_dir")
+        self.converter.format_output = False
+
+        self.converter.create_dag_file(workflow)
+
+        black_mock.format_file_in_place.assert_not_called()
+
+    def test_create_dag_file_shards(self):
+        workflow = Workflow(
+            dag_name="A",
+            input_directory_path="in_dir",
+            output_directory_path="out_dir",
+            relations={Relation(from_task_id="AAA", to_task_id="BBB")},
+            nodes=dict(
+                AAA=ParsedNode(DummyMapper(ET.Element("dummy"), name="AAA")),
+                BBB=ParsedNode(DummyMapper(ET.Element("dummy"), name="BBB")),
+            ),
+            dependencies={"import AAAA", "from o2a.o2a_libs.el_basic_functions import *"},
+        )
+        workflow.nodes["AAA"].tasks = [Task(task_id="AAA", template_name="dummy.tpl")]
+        workflow.nodes["BBB"].tasks = [Task(task_id="BBB", template_name="dummy.tpl")]
+        self.converter.shard_size = 1
+        self.converter.format_output = False
+
+        with tempfile.TemporaryDirectory() as output_directory_path:
+            self.converter.output_dag_name = os.path.join(output_directory_path, "test_dag.py")
+            self.converter.create_dag_file(workflow)
+
+            package_path = os.path.join(output_directory_path, "test_dag_tasks")
+            self.assertEqual(
+                [".airflowignore", "__init__.py", "part_0.py", "part_1.py"], sorted(os.listdir(package_path))
+            )
+            with open(os.path.join(output_directory_path, "test_dag.py")) as file:
+                dag_content = file.read()
+            with open(os.path.join(package_path, "part_0.py")) as file:
+                part_0_content = file.read()
+            with open(os.path.join(package_path, "part_1.py")) as file:
+                part_1_content = file.read()
+
+        self.assertIn("from test_dag_tasks import part_0, part_1", dag_content)
+        self.assertIn("    part_1.create_tasks(dag, tasks)", dag_content)
+        self.assertNotIn("AAA = ", dag_content)
+        self.assertIn("\nfrom o2a.o2a_libs.el_basic_functions import *", part_0_content)
+        self.assertIn("\n    import AAAA", part_0_content)
+        self.assertIn("        AAA = dummy_operator.DummyOperator(", part_0_content)
+        self.assertIn('        tasks["AAA"] = AAA', part_0_content)
+        self.assertIn("        BBB = dummy_operator.DummyOperator(", part_1_content)
+        self.assertIn('        tasks["AAA"].set_downstream(BBB)', part_1_content)
+
+    def test_write_workflow_render_cache(self):
+        workflow = Workflow(dag_name="A", input_directory_path="in_dir", output_directory_path="out_dir")
+        workflow.nodes["AAA"] = ParsedNode(
+            DummyMapper(ET.Element("dummy"), name="AAA"),
+            tasks=[Task(task_id="AAA", template_name="dummy.tpl")],
+        )
+        self.converter.render_cache = mock.MagicMock(**{"render_task.return_value": "AAA = cached_task()"})
+        file = io.StringIO()
+
+        self.converter.write_workflow(workflow, file)
+
+        self.converter.render_cache.render_task.assert_called_once_with(workflow.nodes["AAA"].tasks[0])
+        self.assertIn("    AAA = cached_task()", file.getvalue())
+
+    def test_write_workflow(self):
+        workflow = Workflow(
+            dag_name="A",
+            input_directory_path="in_dir",
+            output_directory_path="out_dir",
+            relations={Relation(from_task_id="AAA", to_task_id="BBB")},
+            nodes=dict(AAA=ParsedNode(DummyMapper(ET.Element("dummy"), name="AAA"))),
+            dependencies={"import AAAA"},
+        )
+        workflow.nodes["AAA"].tasks = [Task(task_id="AAA", template_name="dummy.tpl")]
+        file = io.StringIO()
+
+        self.converter.write_workflow(workflow, file)
+
+        self.assertEqual(self.converter.render_workflow(workflow), file.getvalue())
+        self.assertIn("    AAA.set_downstream(BBB)", file.getvalue())
+
+    def test_render_workflow_capacity_plan(self):
+        workflow = Workflow(input_directory_path="in_dir", output_directory_path="out_dir", dag_name="A")
+        self.converter.capacity_plan = CapacityPlan(concurrency=6, max_active_runs=2, pools={})
+
+        dag_content = self.converter.render_workflow(workflow)
+
+        self.assertIn("concurrency=6,", dag_content)
+        self.assertIn("max_active_runs=2,", dag_content)
+
     @mock.patch("o2a.converter.oozie_converter.render_template", return_value="TEXT_CONTENT")
     def test_write_dag_file(self, render_template_mock):
         relations = {Relation(from_task_id="TASK_1", to_task_id="TASK_2")}
@@ -125,6 +400,36 @@ class TestOozieConverter(TestCase):
         self.assertIs(node_1.relations, relations_1)
         self.assertIs(node_2.relations, relations_2)
 
+    def test_convert_nodes_pool(self):
+        nodes = {
+            name: ParsedNode(DummyMapper(ET.Element("dummy"), name=name)) for name in ("AAA", "BBB", "CCC")
+        }
+
+        with WorkerPool(workers=2) as pool:
+            self.converter.convert_nodes(nodes=nodes, pool=pool)
+
+        for node in nodes.values():
+            self.assertEqual(node.mapper.to_tasks_and_relations(), (node.tasks, node.relations))
+
+    def test_write_workflow_pool(self):
+        workflow = Workflow(dag_name="A", input_directory_path="in_dir", output_directory_path="out_dir")
+        for name in ("AAA", "BBB"):
+            workflow.nodes[name] = ParsedNode(
+                DummyMapper(ET.Element("dummy"), name=name),
+                tasks=[Task(task_id=name, template_name="dummy.tpl")],
+            )
+        expected_content = self.converter.render_workflow(workflow)
+        file = io.StringIO()
+
+        with WorkerPool(workers=2) as pool:
+            self.converter.render_tasks(workflow, pool)
+        with mock.patch("o2a.converter.task.render_template") as render_template_mock:
+            self.converter.write_workflow(workflow, file)
+
+        render_template_mock.assert_not_called()
+        self.assertEqual({"AAA": [mock.ANY], "BBB": [mock.ANY]}, self.converter.rendered_templates)
+        self.assertEqual(expected_content, file.getvalue())
+
     def test_copy_extra_assets(self):
         mock_1 = mock.MagicMock()
         mock_2 = mock.MagicMock()
@@ -137,3 +442,10 @@ class TestOozieConverter(TestCase):
         mock_2.mapper.copy_extra_assets.assert_called_once_with(
             input_directory_path="/input_directory_path/hdfs", output_directory_path="/tmp"
         )
+
+    @mock.patch("o2a.converter.oozie_converter.write_manifest", return_value={"test_dag.py": "digest"})
+    def test_create_manifest_file(self, write_manifest_mock):
+        manifest = self.converter.create_manifest_file()
+
+        self.assertEqual({"test_dag.py": "digest"}, manifest)
+        write_manifest_mock.assert_called_once_with("/tmp", "/tmp/test_dag_manifest.json")
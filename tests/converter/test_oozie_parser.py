@@ -23,6 +23,7 @@ from parameterized import parameterized
 
 from o2a.converter import parser
 from o2a.converter import parsed_node
+from o2a.converter.exceptions import ParseException
 from o2a.converter.mappers import ACTION_MAP, CONTROL_MAP
 from o2a.converter.relation import Relation
 from o2a.definitions import EXAMPLE_DEMO_PATH, EXAMPLES_PATH
@@ -146,10 +147,8 @@ class TestOozieParser(unittest.TestCase):
         on_parse_node_mock.assert_called_once_with()
 
     @mock.patch("o2a.mappers.start_mapper.StartMapper.on_parse_node", wraps=None)
-    @mock.patch("uuid.uuid4")
-    def test_parse_start_node(self, uuid_mock, on_parse_node_mock):
-        uuid_mock.return_value = "1234"
-        node_name = "start_node_1234"
+    def test_parse_start_node(self, on_parse_node_mock):
+        node_name = "start_node_1383"
         end_name = "end_name"
         # language=XML
         start_node_str = f"<start to='{end_name}'/>"
@@ -223,6 +222,41 @@ class TestOozieParser(unittest.TestCase):
         self.assertEqual(["myNameNode/test_dir/test.txt#test_link.txt"], p_op.mapper.hdfs_files)
         self.assertEqual(["myNameNode/test_dir/test2.zip#test_zip_dir"], p_op.mapper.hdfs_archives)
 
+    def test_parse_global_configuration(self):
+        self.parser.action_map = {"pig": pig_mapper.PigMapper}
+        self.parser.params = {"nameNode": "myNameNode", "queueName": "myQueue"}
+        # language=XML
+        workflow_string = """
+<workflow-app>
+    <global>
+        <configuration>
+            <property><name>mapred.job.queue.name</name><value>default</value></property>
+            <property><name>mapred.map.output.compress</name><value>false</value></property>
+        </configuration>
+    </global>
+    <action name='pig-node'>
+        <pig>
+            <resource-manager>myResManager</resource-manager>
+            <name-node>myNameNode</name-node>
+            <script>id.pig</script>
+            <configuration>
+                <property><name>mapred.job.queue.name</name><value>${queueName}</value></property>
+            </configuration>
+        </pig>
+        <ok to='end1'/>
+        <error to='fail1'/>
+    </action>
+</workflow-app>
+"""
+        root = ET.fromstring(workflow_string)
+        for node in root:
+            self.parser.parse_node(root, node)
+
+        self.assertEqual(
+            {"mapred.job.queue.name": "myQueue", "mapred.map.output.compress": "false"},
+            self.parser.workflow.nodes["pig-node"].mapper.properties,
+        )
+
     def test_parse_mapreduce_node(self):
         self.parser.params = {
             "nameNode": "hdfs://",
@@ -372,6 +406,32 @@ class TestOozieParser(unittest.TestCase):
                 Relation(from_task_id="task4_last", to_task_id="task3"),
             },
         )
+        self.assertEqual(
+            set(self.parser.workflow.ok_transitions.edges()),
+            {
+                ("task1", "task2"),
+                ("task1", "task3"),
+                ("task2", "task3"),
+                ("task2", "task4"),
+                ("task3", "end1"),
+                ("task4", "task1"),
+                ("task4", "task2"),
+                ("task4", "task3"),
+            },
+        )
+        self.assertEqual(
+            set(self.parser.workflow.error_transitions.edges()),
+            {("task1", "fail1"), ("task2", "fail1"), ("task3", "fail1"), ("task4", "fail1")},
+        )
+
+    def test_create_relations_unknown_node(self):
+        oozie_node = ET.Element("dummy")
+        op1 = parsed_node.ParsedNode(dummy_mapper.DummyMapper(oozie_node=oozie_node, name="task1"))
+        op1.downstream_names = ["task2"]
+        self.parser.workflow.nodes["task1"] = op1
+
+        with self.assertRaisesRegex(ParseException, "task1 refers to a node that does not exist: task2"):
+            self.parser.create_relations()
 
     def test_update_trigger_rules(self):
         oozie_node = ET.Element("dummy")
@@ -403,6 +463,25 @@ class TestOozieParser(unittest.TestCase):
         self.assertFalse(fail.is_ok)
         self.assertTrue(fail.is_error)
 
+    @mock.patch("o2a.mappers.base_mapper.BaseMapper.on_parse_finish", wraps=None)
+    def test_parse_workflow_name_prefix(self, _):
+        current_parser = parser.OozieParser(
+            input_directory_path=path.join(EXAMPLES_PATH, "decision"),
+            output_directory_path="/tmp",
+            params={"nameNode": "hdfs://"},
+            action_mapper=ACTION_MAP,
+            control_mapper=CONTROL_MAP,
+            name_prefix="sub__",
+        )
+        current_parser.parse_workflow()
+
+        node_names = set(current_parser.workflow.nodes.keys()) - {"start_node_5f80"}
+        self.assertTrue(node_names)
+        for name in node_names:
+            self.assertTrue(name.startswith("sub__"), name)
+        for relation in current_parser.workflow.relations:
+            self.assertTrue(relation.to_task_id.startswith("sub__"), relation)
+
 
 class WorkflowTestCase(typing.NamedTuple):
     name: str
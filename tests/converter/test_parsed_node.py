@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests parsed node"""
+import sys
 import unittest
 from unittest import mock
 from xml.etree.ElementTree import Element
@@ -39,6 +40,16 @@ class TestParsedNode(unittest.TestCase):
         self.assertIn("task1", self.p_node.get_error_downstream_name())
         self.assertIn("task1", self.p_node.error_xml)
 
+    def test_node_names_are_interned(self):
+        self.p_node.add_downstream_node_name("".join(["task", "2"]))
+        self.p_node.set_error_node_name("".join(["task", "3"]))
+        self.assertIs(sys.intern("task2"), self.p_node.downstream_names[0])
+        self.assertIs(sys.intern("task3"), self.p_node.error_xml)
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            self.p_node.unknown_attribute = True
+
     def test_update_trigger_rule_both(self):
         self.p_node.set_is_ok(True)
         self.p_node.set_is_error(True)
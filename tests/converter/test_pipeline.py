@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the pipelined conversion of many applications"""
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from o2a import batch
+from o2a.converter import pipeline
+from o2a.converter.mappers import ACTION_MAP, CONTROL_MAP
+from o2a.converter.oozie_converter import OozieConverter
+from o2a.converter.pipeline import ConversionPipeline
+from tests.examples.test_examples import USER, copy_examples, read_files
+
+APPS = ["decision", "el", "pig", "shell"]
+
+
+def create_converter(input_directory_path: str, output_directory_path: str, dag_name: str):
+    return OozieConverter(
+        dag_name=dag_name,
+        input_directory_path=input_directory_path,
+        output_directory_path=output_directory_path,
+        action_mapper=ACTION_MAP,
+        control_mapper=CONTROL_MAP,
+        user=USER,
+        format_output=False,
+    )
+
+
+class ConversionPipelineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="o2a-pipeline-test")
+        self.addCleanup(shutil.rmtree, self.work_dir)
+        self.examples_path = os.path.join(self.work_dir, "examples")
+        copy_examples(self.examples_path)
+        self.apps = [os.path.join(self.examples_path, name) for name in APPS]
+        self.output_path = os.path.join(self.work_dir, "output")
+
+    def convert_serially(self, name: str) -> dict:
+        converter = create_converter(
+            os.path.join(self.examples_path, name), os.path.join(self.work_dir, "serial", name), name
+        )
+        converter.recreate_output_directory()
+        converter.convert()
+        converter.create_manifest_file()
+        return read_files(converter.output_directory_path)
+
+    def test_output_same_as_serial_conversion(self):
+        results = ConversionPipeline(create_converter, max_in_flight=2).run(self.apps, self.output_path)
+
+        self.assertEqual(self.apps, [result.input_directory_path for result in results])
+        for name, result in zip(APPS, results):
+            self.assertIsNone(result.error)
+            self.assertEqual(os.path.join(self.output_path, name), result.output_directory_path)
+            self.assertEqual(self.convert_serially(name), read_files(result.output_directory_path))
+
+    def test_unchanged_files_not_written_again(self):
+        ConversionPipeline(create_converter).run(self.apps, self.output_path)
+
+        results = ConversionPipeline(create_converter).run(self.apps, self.output_path)
+
+        for result in results:
+            self.assertEqual([], result.sync_report.copied)
+            self.assertTrue(result.sync_report.unchanged)
+
+    def test_failed_application(self):
+        apps = [os.path.join(self.examples_path, "missing"), *self.apps]
+
+        results = ConversionPipeline(create_converter).run(apps, self.output_path)
+
+        self.assertIsInstance(results[0].error, FileNotFoundError)
+        self.assertEqual([None] * len(self.apps), [result.error for result in results[1:]])
+
+    def test_reads_overlap(self):
+        lock = threading.Lock()
+        active_reads = [0]
+        max_active_reads = [0]
+        copy_file = pipeline.copy_file
+
+        def slow_copy_file(source_path: str, target_path: str):
+            with lock:
+                active_reads[0] += 1
+                max_active_reads[0] = max(max_active_reads[0], active_reads[0])
+            time.sleep(0.01)
+            copy_file(source_path, target_path)
+            with lock:
+                active_reads[0] -= 1
+
+        with mock.patch("o2a.converter.pipeline.copy_file", side_effect=slow_copy_file):
+            ConversionPipeline(create_converter, max_in_flight=1, io_threads=4).run(
+                self.apps, self.output_path
+            )
+
+        self.assertEqual(4, max_active_reads[0])
+
+
+class BatchTestCase(unittest.TestCase):
+    def test_parse_args(self):
+        args = batch.parse_args(["-i", "app_1", "app_2", "-o", "/tmp/out/", "--max-in-flight", "8"])
+
+        self.assertEqual(["app_1", "app_2"], args.input_directory_paths)
+        self.assertEqual(8, args.max_in_flight)
+        self.assertEqual(pipeline.DEFAULT_IO_THREADS, args.io_threads)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the relation store"""
+import unittest
+
+from o2a.converter.relation import Relation
+from o2a.converter.relation_store import RelationStore
+from o2a.converter.workflow import Workflow
+
+A_B = Relation(from_task_id="A", to_task_id="B")
+A_C = Relation(from_task_id="A", to_task_id="C")
+B_C = Relation(from_task_id="B", to_task_id="C")
+
+
+class RelationStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.store = RelationStore([A_B, A_C, B_C])
+
+    def test_set_operations(self):
+        self.store.add(A_B)
+
+        self.assertEqual(3, len(self.store))
+        self.assertIn(A_C, self.store)
+        self.assertEqual({A_B, A_C, B_C}, self.store)
+        self.assertEqual([A_B, A_C, B_C], list(self.store))
+
+        self.store -= {A_C}
+
+        self.assertEqual({A_B, B_C}, self.store)
+        self.assertEqual([A_B], self.store.from_task("A"))
+        self.assertEqual([B_C], self.store.to_task("C"))
+
+    def test_index(self):
+        self.assertEqual([A_B, A_C], self.store.from_task("A"))
+        self.assertEqual([A_C, B_C], self.store.to_task("C"))
+        self.assertEqual([], self.store.from_task("C"))
+        self.assertEqual([], self.store.to_task("unknown"))
+
+    def test_discard(self):
+        self.store.discard(A_B)
+        self.store.discard(A_B)
+
+        self.assertEqual([A_C], self.store.from_task("A"))
+        self.assertEqual([], self.store.to_task("B"))
+
+    def test_remove_from_task(self):
+        self.store.remove_from_task("A", keep={"C"})
+
+        self.assertEqual({A_C, B_C}, self.store)
+
+        self.store.remove_from_task("A")
+
+        self.assertEqual({B_C}, self.store)
+
+    def test_remove_to_task(self):
+        self.store.remove_to_task("C", keep={"B"})
+
+        self.assertEqual({A_B, B_C}, self.store)
+
+        self.store.remove_to_task("C")
+
+        self.assertEqual({A_B}, self.store)
+        self.assertEqual([A_B], self.store.to_task("B"))
+
+
+class WorkflowRelationsTestCase(unittest.TestCase):
+    def test_relations_are_indexed(self):
+        workflow = Workflow(input_directory_path="", output_directory_path="", relations={A_B})
+        workflow.relations.add(A_C)
+
+        self.assertIsInstance(workflow.relations, RelationStore)
+        self.assertEqual([A_B, A_C], workflow.relations.from_task("A"))
+
+        workflow.relations = [B_C]
+
+        self.assertIsInstance(workflow.relations, RelationStore)
+        self.assertEqual([B_C], workflow.relations.to_task("C"))
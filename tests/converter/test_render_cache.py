@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the cache of the rendered tasks"""
+import os
+import tempfile
+import unittest
+from collections import namedtuple
+from unittest import mock
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.render_cache import (
+    TASK_ID_PLACEHOLDER,
+    CachedRenderingNode,
+    RenderCache,
+    get_generic_task,
+    get_task_key,
+)
+from o2a.converter.task import Task
+
+Name = namedtuple("Name", ["name"])
+
+
+def create_task(task_id="task", **template_params) -> Task:
+    return Task(
+        task_id=task_id,
+        template_name="dummy.tpl",
+        trigger_rule=TriggerRule.ONE_SUCCESS,
+        template_params=template_params,
+    )
+
+
+class GetTaskKeyTestCase(unittest.TestCase):
+    def test_same_tasks(self):
+        self.assertEqual(get_task_key(create_task(a=["b"])), get_task_key(create_task(a=["b"])))
+
+    def test_different_tasks(self):
+        self.assertNotEqual(get_task_key(create_task(a=["b"])), get_task_key(create_task(a=["c"])))
+        self.assertNotEqual(
+            get_task_key(create_task()), get_task_key(Task(task_id="task", template_name="dummy.tpl"))
+        )
+
+    def test_unstable_representation(self):
+        self.assertIsNone(get_task_key(create_task(a=object())))
+
+
+class GetGenericTaskTestCase(unittest.TestCase):
+    def test_task_id_replaced(self):
+        task = create_task(task_id="pig_node", a=["pig_node_prepare", ("pig_node",)], b={"pig_node": 1})
+
+        generic_task = get_generic_task(task)
+
+        self.assertEqual(
+            create_task(
+                task_id=TASK_ID_PLACEHOLDER,
+                a=[f"{TASK_ID_PLACEHOLDER}_prepare", (TASK_ID_PLACEHOLDER,)],
+                b={TASK_ID_PLACEHOLDER: 1},
+            ),
+            generic_task,
+        )
+        self.assertEqual(
+            get_task_key(generic_task),
+            get_task_key(
+                get_generic_task(
+                    create_task(
+                        task_id="shell_node", a=["shell_node_prepare", ("shell_node",)], b={"shell_node": 1}
+                    )
+                )
+            ),
+        )
+
+    def test_task_id_not_replaceable(self):
+        for task in [
+            create_task(task_id="tâche"),
+            create_task(a=TASK_ID_PLACEHOLDER),
+            create_task(a=Name("task")),
+        ]:
+            with self.subTest(task=task):
+                self.assertIs(task, get_generic_task(task))
+
+
+class RenderCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache", "o2a-cache.sqlite")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_render_task(self):
+        task = create_task()
+        with RenderCache(self.path) as cache:
+            rendered_template = cache.render_task(task)
+        self.assertEqual((0, 1), (cache.hits, cache.misses))
+
+        with RenderCache(self.path) as cache, mock.patch(
+            "o2a.converter.task.render_template"
+        ) as render_template_mock:
+            cached_rendered_template = cache.render_task(create_task())
+
+        render_template_mock.assert_not_called()
+        self.assertEqual((1, 0), (cache.hits, cache.misses))
+        self.assertEqual(task.rendered_template, rendered_template)
+        self.assertEqual(rendered_template, cached_rendered_template)
+
+    def test_render_task_other_task_id(self):
+        with RenderCache(self.path) as cache:
+            cache.render_task(create_task(task_id="first", a=["first_prepare"]))
+
+        with RenderCache(self.path) as cache, mock.patch(
+            "o2a.converter.task.render_template"
+        ) as render_template_mock:
+            rendered_template = cache.render_task(create_task(task_id="second", a=["second_prepare"]))
+
+        render_template_mock.assert_not_called()
+        self.assertEqual((1, 0), (cache.hits, cache.misses))
+        self.assertEqual(
+            create_task(task_id="second", a=["second_prepare"]).rendered_template, rendered_template
+        )
+
+    def test_render_task_not_cached(self):
+        with RenderCache(self.path) as cache, mock.patch(
+            "o2a.converter.task.render_template", return_value="TEXT"
+        ) as render_template_mock:
+            self.assertEqual("TEXT", cache.render_task(create_task(a=object())))
+            self.assertEqual("TEXT", cache.render_task(create_task(a=object())))
+
+        self.assertEqual(2, render_template_mock.call_count)
+        self.assertEqual((0, 0), (cache.hits, cache.misses))
+
+    def test_render_tasks(self):
+        with RenderCache(self.path) as cache:
+            cache.render_task(create_task(a=["cached"]))
+        tasks = [create_task(a=["new"]), create_task(a=["cached"]), create_task(a=object())]
+        render = mock.Mock(side_effect=lambda missing: [f"TEXT {i}" for i in range(len(missing))])
+
+        with RenderCache(self.path) as cache:
+            rendered_templates = cache.render_tasks(tasks, render)
+
+        render.assert_called_once_with([get_generic_task(tasks[0]), get_generic_task(tasks[2])])
+        self.assertEqual(["TEXT 0", tasks[1].rendered_template, "TEXT 1"], rendered_templates)
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+        with RenderCache(self.path) as cache:
+            self.assertEqual("TEXT 0", cache.render_task(create_task(a=["new"])))
+
+    def test_cached_rendering_node(self):
+        task = create_task()
+        node = ParsedNode(mock.MagicMock(), tasks=[task])
+        with RenderCache(self.path) as cache:
+            rendering_node = CachedRenderingNode(node, cache)
+            rendered_templates = [rendering_task.rendered_template for rendering_task in rendering_node.tasks]
+
+        self.assertEqual([task.rendered_template], rendered_templates)
+        self.assertIs(node.relations, rendering_node.relations)
+
+    def test_least_recently_used_entries_removed(self):
+        with RenderCache(self.path, max_size=250) as cache:
+            cache.put("a", b"a" * 99)
+            cache.put("b", b"b" * 99)
+        with RenderCache(self.path, max_size=250) as cache:
+            self.assertIsNotNone(cache.get("a"))
+            cache.put("c", b"c" * 99)
+
+        with RenderCache(self.path) as cache:
+            self.assertIsNotNone(cache.get("a"))
+            self.assertIsNone(cache.get("b"))
+            self.assertIsNotNone(cache.get("c"))
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Asymptotic scaling tests of the parser and the converter.
+
+Generated workflows of increasing size are converted and the growth of the conversion time
+is compared with n log n, so that the tests do not depend on the speed of the machine.
+The number of the actions of the largest workflow is set with O2A_SCALING_MAX_ACTIONS,
+by default it is kept low, so that the tests run quickly before each commit.
+"""
+import gc
+import logging
+import math
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from typing import Callable, List
+from xml.etree import ElementTree as ET
+
+from parameterized import parameterized
+
+from o2a.converter.mappers import ACTION_MAP, CONTROL_MAP
+from o2a.converter.oozie_converter import OozieConverter
+
+MIN_ACTIONS = 1000
+MAX_ACTIONS = int(os.environ.get("O2A_SCALING_MAX_ACTIONS", "8000"))
+
+# The allowed excess of the fitted exponent of the time divided by n log n. A quadratic pass gives
+# an excess of 0.5 or more over the tested sizes, while the noise of the time stays far below the limit.
+MAX_EXCESS_EXPONENT = 0.3
+
+
+def add_shell_action(app: ET.Element, name: str, ok_to: str, error_to: str = "fail"):
+    action = ET.SubElement(app, "action", name=name)
+    shell = ET.SubElement(action, "shell", xmlns="uri:oozie:shell-action:1.0")
+    ET.SubElement(shell, "resource-manager").text = "${resourceManager}"
+    ET.SubElement(shell, "name-node").text = "${nameNode}"
+    ET.SubElement(shell, "exec").text = "echo"
+    ET.SubElement(shell, "argument").text = name
+    ET.SubElement(action, "ok", to=ok_to)
+    ET.SubElement(action, "error", to=error_to)
+
+
+def add_kill_node(app: ET.Element, name: str):
+    ET.SubElement(ET.SubElement(app, "kill", name=name), "message").text = "Action failed"
+
+
+def create_long_chain(actions: int) -> ET.Element:
+    app = ET.Element("workflow-app", xmlns="uri:oozie:workflow:1.0", name="chain-wf")
+    ET.SubElement(app, "start", to="action-0")
+    for i in range(actions):
+        add_shell_action(app, f"action-{i}", f"action-{i + 1}" if i + 1 < actions else "end")
+    add_kill_node(app, "fail")
+    ET.SubElement(app, "end", name="end")
+    return app
+
+
+def create_wide_fork(actions: int) -> ET.Element:
+    app = ET.Element("workflow-app", xmlns="uri:oozie:workflow:1.0", name="fork-wf")
+    ET.SubElement(app, "start", to="fork")
+    fork = ET.SubElement(app, "fork", name="fork")
+    for i in range(actions):
+        ET.SubElement(fork, "path", start=f"action-{i}")
+    for i in range(actions):
+        add_shell_action(app, f"action-{i}", "join")
+    ET.SubElement(app, "join", name="join", to="end")
+    add_kill_node(app, "fail")
+    ET.SubElement(app, "end", name="end")
+    return app
+
+
+def create_many_kill_nodes(actions: int) -> ET.Element:
+    app = ET.Element("workflow-app", xmlns="uri:oozie:workflow:1.0", name="kill-wf")
+    ET.SubElement(app, "start", to="action-0")
+    for i in range(actions):
+        add_shell_action(app, f"action-{i}", f"action-{i + 1}" if i + 1 < actions else "end", f"kill-{i}")
+    for i in range(actions):
+        add_kill_node(app, f"kill-{i}")
+    ET.SubElement(app, "end", name="end")
+    return app
+
+
+def fit_exponent(sizes: List[int], values: List[float]) -> float:
+    """Returns the slope of the line fitted to the values against the sizes on a log-log scale"""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(value) for value in values]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum((x - mean_x) ** 2 for x in xs)
+
+
+class ScalingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="o2a-scaling-test")
+        self.addCleanup(shutil.rmtree, self.work_dir)
+        # Logging each node would be measured too
+        logging.disable(logging.INFO)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def measure_conversion(self, create_workflow: Callable[[int], ET.Element], actions: int) -> float:
+        app_path = os.path.join(self.work_dir, f"app_{actions}")
+        os.makedirs(os.path.join(app_path, "hdfs"))
+        ET.ElementTree(create_workflow(actions)).write(os.path.join(app_path, "hdfs", "workflow.xml"))
+        with open(os.path.join(app_path, "job.properties"), "w") as file:
+            file.write("nameNode=hdfs://\nresourceManager=localhost:8032\n")
+        converter = OozieConverter(
+            dag_name="scaling",
+            input_directory_path=app_path,
+            output_directory_path=os.path.join(self.work_dir, f"output_{actions}"),
+            action_mapper=ACTION_MAP,
+            control_mapper=CONTROL_MAP,
+            user="o2a",
+            simplify_graph=True,
+            prioritize_critical_path=True,
+            format_output=False,
+        )
+        converter.recreate_output_directory()
+        gc.collect()
+        start = time.perf_counter()
+        converter.convert()
+        return time.perf_counter() - start
+
+    @parameterized.expand(
+        [
+            ("long_chain", create_long_chain),
+            ("wide_fork", create_wide_fork),
+            ("many_kill_nodes", create_many_kill_nodes),
+        ]
+    )
+    def test_conversion_time_grows_at_most_n_log_n(self, _, create_workflow):
+        # The first conversion loads the templates and the modules used by the mappers
+        self.measure_conversion(create_workflow, 10)
+        sizes = []
+        size = MIN_ACTIONS
+        while size <= MAX_ACTIONS:
+            sizes.append(size)
+            size *= 2
+        durations = [self.measure_conversion(create_workflow, size) for size in sizes]
+
+        excess = fit_exponent(
+            sizes, [duration / (size * math.log(size)) for size, duration in zip(sizes, durations)]
+        )
+
+        self.assertLessEqual(
+            excess,
+            MAX_EXCESS_EXPONENT,
+            "The conversion time grows faster than n log n: "
+            + ", ".join(f"{size}: {duration:.3f}s" for size, duration in zip(sizes, durations)),
+        )
+
+    def test_fit_exponent(self):
+        sizes = [1000, 2000, 4000, 8000]
+
+        self.assertAlmostEqual(1.0, fit_exponent(sizes, [size * 3.0 for size in sizes]))
+        self.assertAlmostEqual(2.0, fit_exponent(sizes, [size ** 2 for size in sizes]))
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the Task and Relation classes"""
+import sys
+import unittest
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+
+
+class TaskTestCase(unittest.TestCase):
+    def test_task_id_is_interned(self):
+        task = Task(task_id="".join(["task", "_id"]), template_name="dummy.tpl")
+
+        self.assertIs(sys.intern("task_id"), task.task_id)
+
+    def test_equality(self):
+        task = Task(task_id="task_id", template_name="dummy.tpl", template_params={"a": 1})
+
+        self.assertEqual(Task(task_id="task_id", template_name="dummy.tpl", template_params={"a": 1}), task)
+        self.assertNotEqual(
+            Task(
+                task_id="task_id",
+                template_name="dummy.tpl",
+                trigger_rule=TriggerRule.ONE_SUCCESS,
+                template_params={"a": 1},
+            ),
+            task,
+        )
+        self.assertNotEqual(Task(task_id="task_id", template_name="dummy.tpl"), task)
+
+    def test_slots(self):
+        task = Task(task_id="task_id", template_name="dummy.tpl")
+
+        with self.assertRaises(AttributeError):
+            task.unknown_attribute = True  # pylint: disable=assigning-non-slot
+
+
+class RelationTestCase(unittest.TestCase):
+    def test_task_ids_are_interned(self):
+        relation = Relation(from_task_id="".join(["task", "_a"]), to_task_id="".join(["task", "_b"]))
+
+        self.assertIs(sys.intern("task_a"), relation.from_task_id)
+        self.assertIs(sys.intern("task_b"), relation.to_task_id)
+
+    def test_is_tuple(self):
+        relation = Relation(from_task_id="task_a", to_task_id="task_b")
+
+        self.assertEqual(("task_a", "task_b"), relation)
+        self.assertEqual("Relation(from_task_id='task_a', to_task_id='task_b')", repr(relation))
+        self.assertEqual(hash(("task_a", "task_b")), hash(relation))
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests task prioritizer"""
+import json
+import tempfile
+import unittest
+from xml.etree import ElementTree as ET
+
+from o2a.converter.exceptions import O2AException
+from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.task_prioritizer import get_pool_name, load_task_durations, prioritize_tasks
+from o2a.converter.workflow import Workflow
+from o2a.mappers.dummy_mapper import DummyMapper
+
+
+def _node(name, template_name):
+    return ParsedNode(
+        DummyMapper(ET.Element("dummy"), name=name), tasks=[Task(task_id=name, template_name=template_name)]
+    )
+
+
+def _workflow(nodes, relations):
+    return Workflow(
+        input_directory_path="in_dir",
+        output_directory_path="out_dir",
+        dag_name="test_dag",
+        nodes={node.tasks[0].task_id: node for node in nodes},
+        relations={Relation(from_task_id=a, to_task_id=b) for a, b in relations},
+    )
+
+
+class TestTaskPrioritizer(unittest.TestCase):
+    def setUp(self):
+        self.workflow = _workflow(
+            nodes=[
+                _node("fork", "dummy.tpl"),
+                _node("shell", "shell.tpl"),
+                _node("spark", "spark.tpl"),
+                _node("join", "dummy.tpl"),
+                _node("pig", "pig.tpl"),
+            ],
+            relations=[
+                ("fork", "shell"),
+                ("fork", "spark"),
+                ("shell", "join"),
+                ("spark", "join"),
+                ("join", "pig"),
+            ],
+        )
+
+    def _priority_weights(self):
+        return {
+            task.task_id: task.template_params["priority_weight"]
+            for node in self.workflow.nodes.values()
+            for task in node.tasks
+        }
+
+    def test_priority_weights_from_estimates(self):
+        critical_path = prioritize_tasks(self.workflow)
+
+        self.assertEqual(["fork", "spark", "join", "pig"], critical_path)
+        self.assertEqual(
+            {"fork": 900, "shell": 360, "spark": 900, "join": 300, "pig": 300}, self._priority_weights()
+        )
+        self.assertEqual("absolute", self.workflow.nodes["pig"].tasks[0].template_params["weight_rule"])
+        self.assertNotIn("pool", self.workflow.nodes["pig"].tasks[0].template_params)
+
+    def test_priority_weights_from_durations(self):
+        critical_path = prioritize_tasks(self.workflow, durations={"shell": 1000, "pig": 0.5})
+
+        self.assertEqual(["fork", "shell", "join", "pig"], critical_path)
+        self.assertEqual(
+            {"fork": 1001, "shell": 1001, "spark": 601, "join": 1, "pig": 1}, self._priority_weights()
+        )
+
+    def test_pools(self):
+        prioritize_tasks(self.workflow, assign_pools=True)
+
+        self.assertEqual("o2a_spark", self.workflow.nodes["spark"].tasks[0].template_params["pool"])
+        self.assertIsNone(self.workflow.nodes["fork"].tasks[0].template_params["pool"])
+        self.assertIsNone(get_pool_name("decision"))
+
+    def test_cycle(self):
+        self.workflow.relations.add(Relation(from_task_id="pig", to_task_id="fork"))
+
+        with self.assertRaises(O2AException):
+            prioritize_tasks(self.workflow)
+
+    def test_load_task_durations(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as file:
+            json.dump({"pig": 10, "shell": 2.5}, file)
+            file.flush()
+
+            self.assertEqual({"pig": 10.0, "shell": 2.5}, load_task_durations(file.name))
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the pool of the worker processes"""
+import unittest
+from unittest import mock
+from xml.etree import ElementTree as ET
+
+from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.task import Task
+from o2a.converter.worker_pool import PrerenderedNode, WorkerPool
+from o2a.mappers.dummy_mapper import DummyMapper
+
+
+class WorkerPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        self.pool = WorkerPool(workers=2)
+        self.addCleanup(self.pool.close)
+
+    def test_map_keeps_order(self):
+        self.assertEqual([str(i) for i in range(100)], self.pool.map(str, range(100)))
+
+    def test_convert_mappers(self):
+        mappers = [DummyMapper(ET.Element("dummy"), name=f"task_{i}") for i in range(10)]
+
+        results = self.pool.convert_mappers(mappers)
+
+        self.assertEqual([mapper.to_tasks_and_relations() for mapper in mappers], results)
+
+    def test_render_tasks(self):
+        tasks = [Task(task_id=f"task_{i}", template_name="dummy.tpl") for i in range(10)]
+
+        self.assertEqual([task.rendered_template for task in tasks], self.pool.render_tasks(tasks))
+
+
+class PrerenderedNodeTestCase(unittest.TestCase):
+    def test_prerendered_node(self):
+        node = ParsedNode(mock.MagicMock(), tasks=[mock.Mock(), mock.Mock()])
+
+        rendering_node = PrerenderedNode(node, ["A = task()", "B = task()"])
+
+        self.assertEqual(
+            ["A = task()", "B = task()"], [task.rendered_template for task in rendering_node.tasks]
+        )
+        self.assertIs(node.relations, rendering_node.relations)
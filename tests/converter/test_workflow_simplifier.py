@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests workflow simplifier"""
+import unittest
+from xml.etree import ElementTree as ET
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.parsed_node import ParsedNode
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
+from o2a.converter.workflow import Workflow
+from o2a.converter.workflow_simplifier import simplify_workflow, SimplificationReport
+from o2a.mappers.decision_mapper import DecisionMapper
+from o2a.mappers.dummy_mapper import DummyMapper
+
+
+def _dummy_node(name, trigger_rule=TriggerRule.ALL_SUCCESS):
+    return ParsedNode(
+        DummyMapper(ET.Element("dummy"), name=name),
+        tasks=[Task(task_id=name, template_name="dummy.tpl", trigger_rule=trigger_rule)],
+    )
+
+
+def _action_node(name, trigger_rule=TriggerRule.ALL_SUCCESS):
+    return ParsedNode(
+        DummyMapper(ET.Element("dummy"), name=name),
+        tasks=[
+            Task(task_id=f"{name}_prepare", template_name="prepare.tpl", trigger_rule=trigger_rule),
+            Task(task_id=name, template_name="pig.tpl", trigger_rule=trigger_rule),
+        ],
+        relations=[Relation(from_task_id=f"{name}_prepare", to_task_id=name)],
+    )
+
+
+def _decision_node(name, cases):
+    # language=XML
+    decision_str = f"""
+<decision name="{name}">
+    <switch>
+        {"".join(f'<case to="{case}">True</case>' for case in cases[:-1])}
+        <default to="{cases[-1]}" />
+    </switch>
+</decision>
+"""
+    mapper = DecisionMapper(ET.fromstring(decision_str), name=name)
+    return ParsedNode(mapper, tasks=[Task(task_id=name, template_name="decision.tpl")])
+
+
+def _workflow(nodes, relations):
+    return Workflow(
+        input_directory_path="in_dir",
+        output_directory_path="out_dir",
+        dag_name="test_dag",
+        nodes={node.tasks[-1].task_id: node for node in nodes},
+        relations={Relation(from_task_id=a, to_task_id=b) for a, b in relations},
+    )
+
+
+class TestWorkflowSimplifier(unittest.TestCase):
+    def test_fork_and_join_removed(self):
+        workflow = _workflow(
+            nodes=[
+                _dummy_node("fork"),
+                _action_node("a"),
+                _action_node("b"),
+                _dummy_node("join"),
+                _action_node("c"),
+            ],
+            relations=[
+                ("fork", "a_prepare"),
+                ("fork", "b_prepare"),
+                ("a", "join"),
+                ("b", "join"),
+                ("join", "c_prepare"),
+            ],
+        )
+
+        report = simplify_workflow(workflow)
+
+        self.assertEqual({"a", "b", "c"}, set(workflow.nodes.keys()))
+        self.assertEqual(
+            {
+                Relation(from_task_id="a", to_task_id="c_prepare"),
+                Relation(from_task_id="b", to_task_id="c_prepare"),
+            },
+            workflow.relations,
+        )
+        self.assertEqual(
+            SimplificationReport(tasks_before=8, tasks_after=6, relations_before=8, relations_after=5), report
+        )
+
+    def test_replacing_relations_sorted(self):
+        names = ["e", "d", "c", "b", "a"]
+        workflow = _workflow(
+            nodes=[*(_action_node(name) for name in names), _dummy_node("join"), _action_node("f")],
+            relations=[*((name, "join") for name in names), ("join", "f_prepare")],
+        )
+
+        simplify_workflow(workflow)
+
+        self.assertEqual(
+            [Relation(from_task_id=name, to_task_id="f_prepare") for name in sorted(names)],
+            list(workflow.relations),
+        )
+
+    def test_downstream_inherits_trigger_rule(self):
+        workflow = _workflow(
+            nodes=[
+                _action_node("a"),
+                _action_node("b"),
+                _dummy_node("join", trigger_rule=TriggerRule.ONE_FAILED),
+                _action_node("c"),
+            ],
+            relations=[("a", "join"), ("b", "join"), ("join", "c_prepare")],
+        )
+
+        simplify_workflow(workflow)
+
+        self.assertNotIn("join", workflow.nodes)
+        self.assertEqual(TriggerRule.ONE_FAILED, workflow.nodes["c"].tasks[0].trigger_rule)
+        self.assertEqual(TriggerRule.ALL_SUCCESS, workflow.nodes["c"].tasks[1].trigger_rule)
+
+    def test_error_handler_kept(self):
+        workflow = _workflow(
+            nodes=[
+                _action_node("a"),
+                _action_node("b"),
+                _dummy_node("handler", trigger_rule=TriggerRule.ONE_FAILED),
+                _action_node("c"),
+                _action_node("d"),
+            ],
+            relations=[
+                ("a", "handler"),
+                ("b", "handler"),
+                ("handler", "c_prepare"),
+                ("handler", "d_prepare"),
+            ],
+        )
+
+        simplify_workflow(workflow)
+
+        self.assertIn("handler", workflow.nodes)
+        self.assertEqual(4, len(workflow.relations))
+
+    def test_root_task_kept_when_downstream_depends_on_it(self):
+        workflow = _workflow(
+            nodes=[
+                _dummy_node("fork"),
+                _action_node("a"),
+                _action_node("b", trigger_rule=TriggerRule.ONE_SUCCESS),
+            ],
+            relations=[("fork", "a_prepare"), ("fork", "b_prepare"), ("a", "b_prepare")],
+        )
+
+        simplify_workflow(workflow)
+
+        self.assertIn("fork", workflow.nodes)
+
+    def test_decision_targets_kept(self):
+        workflow = _workflow(
+            nodes=[_decision_node("decision", cases=["end", "a"]), _dummy_node("end"), _action_node("a")],
+            relations=[("decision", "end"), ("decision", "a_prepare")],
+        )
+
+        simplify_workflow(workflow)
+
+        self.assertEqual({"decision", "end", "a"}, set(workflow.nodes.keys()))
+        self.assertEqual(2, len(workflow.relations))
+
+    def test_transitive_relations_removed(self):
+        workflow = _workflow(
+            nodes=[_action_node("a"), _action_node("b"), _action_node("c")],
+            relations=[("a", "b_prepare"), ("b", "c_prepare"), ("a", "c_prepare")],
+        )
+
+        report = simplify_workflow(workflow)
+
+        self.assertEqual(
+            {
+                Relation(from_task_id="a", to_task_id="b_prepare"),
+                Relation(from_task_id="b", to_task_id="c_prepare"),
+            },
+            workflow.relations,
+        )
+        self.assertEqual(report.relations_before - 1, report.relations_after)
+
+    def test_transitive_relations_kept_for_other_trigger_rules(self):
+        workflow = _workflow(
+            nodes=[
+                _action_node("a"),
+                _action_node("b", trigger_rule=TriggerRule.ONE_FAILED),
+                _action_node("c"),
+            ],
+            relations=[("a", "b_prepare"), ("b", "c_prepare"), ("a", "c_prepare")],
+        )
+
+        simplify_workflow(workflow)
+
+        self.assertEqual(3, len(workflow.relations))
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Stress test of the conversions running concurrently in the threads of a single process.
+
+Each example is converted several times in a pool of threads and the output has to be the same
+as the output of the serial conversion. The threads are switched much more often than by default,
+so that the conversions interleave at many points. The number of the threads and of the conversions
+of each example are set with O2A_STRESS_THREADS and O2A_STRESS_ROUNDS.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+
+from o2a.converter.mappers import ACTION_MAP, CONTROL_MAP
+from o2a.converter.oozie_converter import OozieConverter
+from o2a.mappers.inline_subworkflow_mapper import InlineSubworkflowMapper
+from tests.examples.test_examples import EXAMPLES, USER, copy_examples, read_files
+
+THREADS = int(os.environ.get("O2A_STRESS_THREADS", "8"))
+ROUNDS = int(os.environ.get("O2A_STRESS_ROUNDS", "2"))
+SWITCH_INTERVAL = 1e-5
+
+
+class ConcurrentConversionTestCase(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="o2a-concurrent-test")
+        self.addCleanup(shutil.rmtree, self.work_dir)
+        self.examples_path = os.path.join(self.work_dir, "examples")
+        copy_examples(self.examples_path)
+
+    def convert(self, name: str, output_name: str, inline_subworkflows: bool) -> Dict[str, str]:
+        output_path = os.path.join(self.work_dir, output_name)
+        action_mapper = ACTION_MAP
+        if inline_subworkflows:
+            action_mapper = {**ACTION_MAP, "sub-workflow": InlineSubworkflowMapper}
+        converter = OozieConverter(
+            dag_name=name,
+            input_directory_path=os.path.join(self.examples_path, name),
+            output_directory_path=output_path,
+            action_mapper=action_mapper,
+            control_mapper=CONTROL_MAP,
+            user=USER,
+            simplify_graph=inline_subworkflows,
+            prioritize_critical_path=inline_subworkflows,
+        )
+        converter.recreate_output_directory()
+        converter.convert()
+        return read_files(output_path)
+
+    def test_concurrent_conversions_match_serial_ones(self):
+        jobs = [
+            (name, inline_subworkflows)
+            for name in EXAMPLES
+            for inline_subworkflows in (False, True)
+            for _ in range(ROUNDS)
+        ]
+        expected = {
+            (name, inline_subworkflows): self.convert(
+                name, f"serial/{name}_{inline_subworkflows}", inline_subworkflows
+            )
+            for name, inline_subworkflows in set(jobs)
+        }
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(SWITCH_INTERVAL)
+        try:
+            with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                results = list(
+                    executor.map(
+                        self.convert,
+                        [name for name, _ in jobs],
+                        [f"concurrent/{index}" for index in range(len(jobs))],
+                        [inline_subworkflows for _, inline_subworkflows in jobs],
+                    )
+                )
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        for job, result in zip(jobs, results):
+            self.assertEqual(expected[job], result, job)
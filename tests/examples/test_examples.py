@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Converts all the example applications and compares the output with the golden files, and the time
+and the peak memory of the conversion with the stored baselines.
+
+The output is not formatted, so that it does not depend on the version of black. The time and
+the memory depend on the version of Python and on the machine, so they are compared only when
+O2A_PERFORMANCE_TESTS=1 is set.
+
+Set O2A_UPDATE_GOLDEN=1 to write the golden files and O2A_UPDATE_BASELINES=1 to write the baselines
+instead. The allowed regressions are set with O2A_TIME_THRESHOLD and O2A_MEMORY_THRESHOLD as fractions
+of the baselines.
+"""
+import json
+import os
+import shutil
+import tempfile
+import time
+import timeit
+import tracemalloc
+import unittest
+from typing import Dict
+
+from parameterized import parameterized
+
+from o2a.converter.constants import HDFS_FOLDER
+from o2a.converter.mappers import ACTION_MAP, CONTROL_MAP
+from o2a.converter.oozie_converter import OozieConverter
+from o2a.definitions import EXAMPLES_PATH
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+BASELINES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "performance_baselines.json")
+# Suffix of the golden files, so that the tools checking the code of the project ignore them
+GOLDEN_SUFFIX = ".golden"
+
+EXAMPLES = sorted(
+    name
+    for name in os.listdir(EXAMPLES_PATH)
+    if os.path.isdir(os.path.join(EXAMPLES_PATH, name, HDFS_FOLDER))
+)
+
+CONFIGURATION = {"DATAPROC_CLUSTER_NAME": "o2a-cluster", "GCP_REGION": "europe-west1"}
+USER = "o2a"
+UPDATE_GOLDEN = os.environ.get("O2A_UPDATE_GOLDEN") == "1"
+UPDATE_BASELINES = os.environ.get("O2A_UPDATE_BASELINES") == "1"
+PERFORMANCE_TESTS = os.environ.get("O2A_PERFORMANCE_TESTS") == "1" or UPDATE_BASELINES
+TIME_THRESHOLD = float(os.environ.get("O2A_TIME_THRESHOLD", "1.0"))
+MEMORY_THRESHOLD = float(os.environ.get("O2A_MEMORY_THRESHOLD", "0.25"))
+TIME_RUNS = 5
+
+
+def copy_examples(target_path: str):
+    """
+    Copies the examples with the configuration generated from the templates with fixed values,
+    so that the output does not depend on the local configuration.
+    """
+    shutil.copytree(EXAMPLES_PATH, target_path, ignore=shutil.ignore_patterns("configuration.properties"))
+    for name in os.listdir(target_path):
+        template_file = os.path.join(target_path, name, "configuration.template.properties")
+        if not os.path.isfile(template_file):
+            continue
+        with open(template_file) as file:
+            content = file.read()
+        for key, value in CONFIGURATION.items():
+            content = content.replace("{{" + key + "}}", value)
+        with open(os.path.join(target_path, name, "configuration.properties"), "w") as file:
+            file.write(content)
+
+
+def read_files(path: str, suffix: str = "") -> Dict[str, str]:
+    files = {}
+    for root, _, names in os.walk(path):
+        for name in names:
+            if name.endswith("_manifest.json"):
+                continue
+            relative_path = os.path.relpath(os.path.join(root, name), path)
+            with open(os.path.join(root, name)) as file:
+                files[relative_path[: len(relative_path) - len(suffix)]] = file.read()
+    return files
+
+
+def write_golden_files(files: Dict[str, str], path: str):
+    shutil.rmtree(path, ignore_errors=True)
+    for relative_path, content in files.items():
+        golden_file = os.path.join(path, relative_path + GOLDEN_SUFFIX)
+        os.makedirs(os.path.dirname(golden_file), exist_ok=True)
+        with open(golden_file, "w") as file:
+            file.write(content)
+
+
+def measure_calibration() -> float:
+    """
+    Returns the time of a fixed workload. The conversion times are stored relative to it,
+    so that the baselines can be compared between machines.
+    """
+    return min(timeit.repeat(lambda: sorted(str(i) for i in range(20000)), number=5, repeat=5))
+
+
+class ExamplesTestCase(unittest.TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.work_dir = tempfile.mkdtemp(prefix="o2a-examples-test")
+        cls.examples_path = os.path.join(cls.work_dir, "examples")
+        copy_examples(cls.examples_path)
+        if PERFORMANCE_TESTS:
+            with open(BASELINES_FILE) as file:
+                cls.baselines = json.load(file)
+            cls.calibration = measure_calibration()
+
+    @classmethod
+    def tearDownClass(cls):
+        if UPDATE_BASELINES:
+            with open(BASELINES_FILE, "w") as file:
+                json.dump(cls.baselines, file, indent=4, sort_keys=True)
+                file.write("\n")
+        shutil.rmtree(cls.work_dir)
+
+    def convert(self, name: str) -> str:
+        output_path = os.path.join(self.work_dir, "output", name)
+        converter = OozieConverter(
+            dag_name=name,
+            input_directory_path=os.path.join(self.examples_path, name),
+            output_directory_path=output_path,
+            action_mapper=ACTION_MAP,
+            control_mapper=CONTROL_MAP,
+            user=USER,
+            format_output=False,
+        )
+        converter.recreate_output_directory()
+        converter.convert()
+        converter.create_manifest_file()
+        return output_path
+
+    @parameterized.expand(EXAMPLES)
+    def test_golden_output(self, name):
+        files = read_files(self.convert(name))
+        golden_path = os.path.join(GOLDEN_PATH, name)
+        if UPDATE_GOLDEN:
+            write_golden_files(files, golden_path)
+        golden_files = read_files(golden_path, suffix=GOLDEN_SUFFIX)
+
+        self.assertEqual(sorted(golden_files), sorted(files))
+        for relative_path, content in files.items():
+            self.assertEqual(golden_files[relative_path], content, relative_path)
+
+    @parameterized.expand(EXAMPLES)
+    @unittest.skipUnless(PERFORMANCE_TESTS, "Set O2A_PERFORMANCE_TESTS=1 to compare with the baselines")
+    def test_performance(self, name):
+        # The first conversion loads the templates and the modules used by the mappers
+        self.convert(name)
+        durations = []
+        for _ in range(TIME_RUNS):
+            start = time.perf_counter()
+            self.convert(name)
+            durations.append(time.perf_counter() - start)
+        tracemalloc.start()
+        try:
+            self.convert(name)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result = {"relative_time": round(min(durations) / self.calibration, 3), "peak_memory": peak_memory}
+        if UPDATE_BASELINES or name not in self.baselines:
+            self.baselines[name] = result
+        baseline = self.baselines[name]
+
+        self.assertLessEqual(
+            result["relative_time"],
+            baseline["relative_time"] * (1 + TIME_THRESHOLD),
+            f"The conversion of {name} is slower than the baseline: {result} > {baseline}",
+        )
+        self.assertLessEqual(
+            result["peak_memory"],
+            baseline["peak_memory"] * (1 + MEMORY_THRESHOLD),
+            f"The conversion of {name} uses more memory than the baseline: {result} > {baseline}",
+        )
@@ -20,6 +20,7 @@ from collections import OrderedDict
 from xml.etree import ElementTree as ET
 from airflow.utils.trigger_rule import TriggerRule
 
+from o2a.converter.exceptions import ParseException
 from o2a.converter.task import Task
 from o2a.mappers import decision_mapper
 
@@ -71,6 +72,21 @@ class TestDecisionMapper(unittest.TestCase):
         )
         self.assertEqual(relations, [])
 
+    def test_wf_functions_in_conditions_not_supported(self):
+        # language=XML
+        decision_node_str = """
+<decision name="decision">
+    <switch>
+        <case to="task1">${wf:conf("flag")}</case>
+        <default to="task2" />
+    </switch>
+</decision>
+"""
+        self.decision_node = ET.fromstring(decision_node_str)
+
+        with self.assertRaisesRegex(ParseException, "wf:conf"):
+            self._get_decision_mapper()
+
     def test_required_imports(self):
         mapper = self._get_decision_mapper()
         imps = mapper.required_imports()
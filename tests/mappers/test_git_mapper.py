@@ -128,7 +128,7 @@ class TestGitMapper(unittest.TestCase):
                 Task(
                     task_id="test_id",
                     template_name="git.tpl",
-                    trigger_rule="dummy",
+                    trigger_rule="all_success",
                     template_params={
                         "bash_command": "$DAGS_FOLDER/../data/git.sh --cluster {dataproc_cluster} "
                         "--region {gcp_region} --git-uri https://github.com/apache/oozie "
@@ -140,6 +140,7 @@ class TestGitMapper(unittest.TestCase):
         )
 
         self.assertEqual(relations, [Relation(from_task_id="test_id_prepare", to_task_id="test_id")])
+        self.assertEqual("test_id_prepare", mapper.first_task_id)
 
     def test_convert_to_text_without_prepare_node(self):
         spark_node = ET.fromstring(EXAMPLE_XML)
@@ -167,6 +168,7 @@ class TestGitMapper(unittest.TestCase):
             ],
         )
         self.assertEqual(relations, [])
+        self.assertEqual("test_id", mapper.first_task_id)
 
     def test_required_imports(self):
         spark_node = ET.fromstring(EXAMPLE_XML)
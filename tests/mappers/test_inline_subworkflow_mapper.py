@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for inline subworkflow mapper"""
+import ast
+import os
+import shutil
+import tempfile
+from unittest import mock, TestCase
+from xml.etree import ElementTree as ET
+
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.mappers import CONTROL_MAP, ACTION_MAP
+from o2a.converter.relation import Relation
+from o2a.definitions import EXAMPLE_SUBWORKFLOW_PATH, EXAMPLE_PIG_PATH
+from o2a.mappers.inline_subworkflow_mapper import InlineSubworkflowMapper
+
+
+class TestInlineSubworkflowMapper(TestCase):
+
+    subworkflow_params = {
+        "dataproc_cluster": "test_cluster",
+        "gcp_conn_id": "google_cloud_default",
+        "gcp_region": "europe-west3",
+        "gcp_uri_prefix": "gs://test_bucket/dags",
+        "nameNode": "hdfs://",
+        "oozie.wf.application.path": "hdfs:///user/pig/examples/pi",
+    }
+
+    def setUp(self):
+        # language=XML
+        subworkflow_node_str = """
+<sub-workflow>
+    <app-path>${nameNode}/user/${wf:user()}/${examplesRoot}/pig</app-path>
+    <propagate-configuration />
+    <configuration>
+        <property>
+            <name>resourceManager</name>
+            <value>${resourceManager}</value>
+        </property>
+    </configuration>
+</sub-workflow>"""
+        self.subworkflow_node = ET.fromstring(subworkflow_node_str)
+        self.main_params = {
+            "examplesRoot": "examples",
+            "nameNode": "hdfs://",
+            "resourceManager": "localhost:8032",
+            "dataproc_cluster": "cluster-o2a",
+        }
+
+    @mock.patch("o2a.utils.el_utils.parse_els")
+    def test_create_mapper(self, parse_els_mock):
+        parse_els_mock.return_value = dict(self.subworkflow_params)
+
+        with self.assertLogs(level="WARNING") as logs:
+            mapper = self._get_subwf_mapper()
+
+        self.assertIn("for the parameters: dataproc_cluster", logs.output[0])
+        self.assertEqual(EXAMPLE_PIG_PATH, mapper.app_path)
+        self.assertEqual({"test_id__pig_node"}, set(mapper.child_parser.workflow.nodes.keys()))
+        self.assertEqual("localhost:8032", mapper.child_parser.params["resourceManager"])
+        # Values missing in the parent are added, the existing ones are kept
+        self.assertEqual("cluster-o2a", mapper.params["dataproc_cluster"])
+        self.assertEqual("europe-west3", mapper.params["gcp_region"])
+
+    @mock.patch("o2a.utils.el_utils.parse_els")
+    def test_to_tasks_and_relations(self, parse_els_mock):
+        parse_els_mock.return_value = dict(self.subworkflow_params)
+        mapper = self._get_subwf_mapper()
+
+        tasks, relations = mapper.to_tasks_and_relations()
+
+        self.assertEqual(
+            ["test_id", "test_id__pig_node_prepare", "test_id__pig_node", "test_id_end"],
+            [task.task_id for task in tasks],
+        )
+        self.assertEqual(TriggerRule.DUMMY, tasks[0].trigger_rule)
+        self.assertEqual(
+            [
+                Relation(from_task_id="test_id", to_task_id="test_id__pig_node_prepare"),
+                Relation(from_task_id="test_id__pig_node_prepare", to_task_id="test_id__pig_node"),
+                Relation(from_task_id="test_id__pig_node", to_task_id="test_id_end"),
+            ],
+            relations,
+        )
+        self.assertEqual("test_id", mapper.first_task_id)
+        self.assertEqual("test_id_end", mapper.last_task_id)
+
+    def test_to_tasks_and_relations_error_handler(self):
+        # language=XML
+        child_workflow = """
+<workflow-app xmlns="uri:oozie:workflow:0.1" name="child">
+    <start to="main"/>
+    <action name="main">
+        <fs><mkdir path="hdfs:///main"/></fs>
+        <ok to="end"/>
+        <error to="error-handler"/>
+    </action>
+    <action name="error-handler">
+        <fs><mkdir path="hdfs:///error"/></fs>
+        <ok to="fail"/>
+        <error to="fail"/>
+    </action>
+    <kill name="fail">
+        <message>Failed</message>
+    </kill>
+    <end name="end"/>
+</workflow-app>"""
+        mapper = self._get_child_subwf_mapper(child_workflow)
+
+        tasks, relations = mapper.to_tasks_and_relations()
+
+        self.assertEqual(
+            {"test_id", "test_id__main", "test_id__error_handler", "test_id_end"},
+            {task.task_id for task in tasks},
+        )
+        self.assertEqual(TriggerRule.ALL_SUCCESS, tasks[-1].trigger_rule)
+        # The error handler is skipped when the child workflow succeeds, so it does not lead to the exit
+        self.assertEqual(
+            {
+                Relation(from_task_id="test_id", to_task_id="test_id__main"),
+                Relation(from_task_id="test_id__main", to_task_id="test_id__error_handler"),
+                Relation(from_task_id="test_id__main", to_task_id="test_id_end"),
+            },
+            set(relations),
+        )
+
+    def test_to_tasks_and_relations_decision(self):
+        # language=XML
+        child_workflow = """
+<workflow-app xmlns="uri:oozie:workflow:0.1" name="child">
+    <start to="decision"/>
+    <decision name="decision">
+        <switch>
+            <case to="first">${firstNotNull("", "")}</case>
+            <case to="fail">${firstNotNull("test", "")}</case>
+            <default to="end"/>
+        </switch>
+    </decision>
+    <action name="first">
+        <fs><mkdir path="hdfs:///first"/></fs>
+        <ok to="end"/>
+        <error to="fail"/>
+    </action>
+    <kill name="fail">
+        <message>Failed</message>
+    </kill>
+    <end name="end"/>
+</workflow-app>"""
+        mapper = self._get_child_subwf_mapper(child_workflow)
+
+        tasks, relations = mapper.to_tasks_and_relations()
+
+        # Only one branch of the decision runs, so the exit must not wait for all of them
+        self.assertEqual("test_id_end", tasks[-1].task_id)
+        self.assertEqual(TriggerRule.ONE_SUCCESS, tasks[-1].trigger_rule)
+        # The kill task fails the child workflow, so it does not lead to the exit
+        self.assertEqual(
+            {"test_id__end", "test_id__first"},
+            {relation.from_task_id for relation in relations if relation.to_task_id == "test_id_end"},
+        )
+
+    @mock.patch("o2a.utils.el_utils.parse_els")
+    def test_required_imports(self, parse_els_mock):
+        parse_els_mock.return_value = dict(self.subworkflow_params)
+        mapper = self._get_subwf_mapper()
+
+        imps = mapper.required_imports()
+
+        self.assertIn("from airflow.contrib.operators import dataproc_operator", imps)
+        self.assertNotIn("from airflow.operators.subdag_operator import SubDagOperator", imps)
+        ast.parse("\n".join(imps))
+
+    @mock.patch("o2a.mappers.pig_mapper.PigMapper.copy_extra_assets")
+    @mock.patch("o2a.utils.el_utils.parse_els")
+    def test_copy_extra_assets(self, parse_els_mock, copy_extra_assets_mock):
+        parse_els_mock.return_value = dict(self.subworkflow_params)
+        mapper = self._get_subwf_mapper()
+
+        mapper.copy_extra_assets(input_directory_path="/parent/hdfs", output_directory_path="/tmp/output")
+
+        copy_extra_assets_mock.assert_called_once_with(
+            input_directory_path=f"{EXAMPLE_PIG_PATH}/hdfs", output_directory_path="/tmp/output"
+        )
+
+    def _get_child_subwf_mapper(self, child_workflow: str):
+        apps_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, apps_path)
+        os.makedirs(os.path.join(apps_path, "pig", "hdfs"))
+        with open(os.path.join(apps_path, "pig", "hdfs", "workflow.xml"), "w") as file:
+            file.write(child_workflow)
+
+        return self._get_subwf_mapper(input_directory_path=os.path.join(apps_path, "subwf"))
+
+    def _get_subwf_mapper(self, input_directory_path=EXAMPLE_SUBWORKFLOW_PATH):
+        return InlineSubworkflowMapper(
+            input_directory_path=input_directory_path,
+            output_directory_path="/tmp",
+            oozie_node=self.subworkflow_node,
+            name="test_id",
+            dag_name="test",
+            action_mapper=ACTION_MAP,
+            trigger_rule=TriggerRule.DUMMY,
+            control_mapper=CONTROL_MAP,
+            params=self.main_params,
+        )
@@ -55,8 +55,8 @@ class TestKillMapper(unittest.TestCase):
         workflow.nodes["task"] = ParsedNode(mock.Mock(autospec=BaseMapper))
         workflow.nodes["fail_task"] = ParsedNode(mapper)
         workflow.nodes["success_task"] = ParsedNode(mock.Mock(autospec=BaseMapper))
-        workflow.nodes["success_task"].set_is_ok(True)
-        workflow.nodes["fail_task"].set_is_error(True)
+        workflow.ok_transitions.add_edge("task", "success_task")
+        workflow.error_transitions.add_edge("task", "fail_task")
 
         workflow.relations = {
             Relation(from_task_id="task", to_task_id="fail_task"),
@@ -68,6 +68,22 @@ class TestKillMapper(unittest.TestCase):
         self.assertEqual(set(workflow.nodes.keys()), {"task", "success_task"})
         self.assertEqual(workflow.relations, {Relation(from_task_id="task", to_task_id="success_task")})
 
+    def test_on_parse_finish_not_error_downstream(self):
+        workflow = Workflow(input_directory_path=None, output_directory_path=None, dag_name=None)
+
+        mapper = self._get_kill_mapper(name="fail_task")
+
+        workflow.nodes["task"] = ParsedNode(mock.Mock(autospec=BaseMapper))
+        workflow.nodes["fail_task"] = ParsedNode(mapper)
+        workflow.ok_transitions.add_edge("task", "fail_task")
+
+        workflow.relations = {Relation(from_task_id="task", to_task_id="fail_task")}
+
+        mapper.on_parse_finish(workflow)
+
+        self.assertEqual(set(workflow.nodes.keys()), {"task", "fail_task"})
+        self.assertEqual(workflow.relations, {Relation(from_task_id="task", to_task_id="fail_task")})
+
     def test_required_imports(self):
         mapper = self._get_kill_mapper()
         imps = mapper.required_imports()
@@ -14,6 +14,8 @@
 # limitations under the License.
 """Tests for the MapReduce mapper"""
 import ast
+import os
+import tempfile
 import unittest
 from xml.etree import ElementTree as ET
 
@@ -163,6 +165,51 @@ class TestMapReduceMapper(unittest.TestCase):
             mapper.properties["mapreduce.output.fileoutputformat.outputdir"],
         )
 
+    def test_on_parse_node_job_xml(self):
+        with tempfile.TemporaryDirectory() as app_path:
+            os.makedirs(os.path.join(app_path, "hdfs", "conf"))
+            with open(os.path.join(app_path, "hdfs", "conf", "job.xml"), "w") as file:
+                file.write(
+                    "<configuration><property><name>mapred.job.queue.name</name><value>jobXmlQueue</value>"
+                    "</property><property><name>mapred.map.tasks</name><value>4</value>"
+                    "</property></configuration>"
+                )
+            ET.SubElement(self.mapreduce_node, "job-xml").text = "conf/job.xml"
+            mapper = mapreduce_mapper.MapReduceMapper(
+                oozie_node=self.mapreduce_node,
+                name="test_id",
+                params={"queueName": "myQueue", "examplesRoot": "examples"},
+                input_directory_path=app_path,
+            )
+
+            mapper.on_parse_node()
+
+        # The properties of the configuration override the properties of the job-xml files
+        self.assertEqual("myQueue", mapper.properties["mapred.job.queue.name"])
+        self.assertEqual("4", mapper.properties["mapred.map.tasks"])
+
+    def test_on_parse_node_job_xml_absolute_path(self):
+        with tempfile.TemporaryDirectory() as app_path:
+            os.makedirs(os.path.join(app_path, "hdfs", "conf"))
+            with open(os.path.join(app_path, "hdfs", "conf", "job.xml"), "w") as file:
+                file.write(
+                    "<configuration><property><name>mapred.map.tasks</name><value>4</value>"
+                    "</property></configuration>"
+                )
+            # The path in HDFS is mapped to the hdfs folder of the application
+            hdfs_path = "/user/${userName}/apps/mapreduce/conf/job.xml"
+            ET.SubElement(self.mapreduce_node, "job-xml").text = hdfs_path
+            mapper = mapreduce_mapper.MapReduceMapper(
+                oozie_node=self.mapreduce_node,
+                name="test_id",
+                params={"queueName": "myQueue", "examplesRoot": "examples", "userName": "test"},
+                input_directory_path=app_path,
+            )
+
+            mapper.on_parse_node()
+
+        self.assertEqual("4", mapper.properties["mapred.map.tasks"])
+
     def test_to_tasks_and_relations(self):
         mapper = mapreduce_mapper.MapReduceMapper(
             oozie_node=self.mapreduce_node,
@@ -194,6 +241,7 @@ class TestMapReduceMapper(unittest.TestCase):
                 Task(
                     task_id="test_id",
                     template_name="mapreduce.tpl",
+                    trigger_rule=TriggerRule.ALL_SUCCESS,
                     template_params={
                         "properties": {
                             "mapred.mapper.new-api": "true",
@@ -216,6 +264,7 @@ class TestMapReduceMapper(unittest.TestCase):
             ],
         )
         self.assertEqual(relations, [Relation(from_task_id="test_id_prepare", to_task_id="test_id")])
+        self.assertEqual("test_id_prepare", mapper.first_task_id)
 
     def test_required_imports(self):
         mapper = self._get_mapreduce_mapper()
@@ -284,6 +333,7 @@ class TestMapReduceMapperNoPrepare(unittest.TestCase):
             ],
         )
         self.assertEqual(relations, [])
+        self.assertEqual("test_id", mapper.first_task_id)
 
     def test_required_imports(self):
         mapper = self._get_mapreduce_mapper()
@@ -14,6 +14,8 @@
 # limitations under the License.
 """Tests pig mapper"""
 import ast
+import os
+import tempfile
 import unittest
 from xml.etree import ElementTree as ET
 
@@ -102,6 +104,52 @@ class TestPigMapper(unittest.TestCase):
             "/user/${wf:user()}/examples/output-data/demo/pig-node", mapper.params_dict["OUTPUT"]
         )
 
+    def test_create_mapper_job_xml(self):
+        with tempfile.TemporaryDirectory() as app_path:
+            os.makedirs(os.path.join(app_path, "hdfs"))
+            with open(os.path.join(app_path, "hdfs", "job.xml"), "w") as file:
+                file.write(
+                    "<configuration><property><name>mapred.map.output.compress</name><value>true</value>"
+                    "</property><property><name>pig.tmpfilecompression</name><value>true</value>"
+                    "</property></configuration>"
+                )
+            ET.SubElement(self.pig_node, "job-xml").text = "job.xml"
+
+            mapper = pig_mapper.PigMapper(
+                oozie_node=self.pig_node,
+                name="test_id",
+                params={"nameNode": "hdfs://", "queueName": "myQueue"},
+                input_directory_path=app_path,
+            )
+
+        self.assertEqual(
+            {
+                "mapred.job.queue.name": "myQueue",
+                "mapred.map.output.compress": "false",
+                "pig.tmpfilecompression": "true",
+            },
+            mapper.properties,
+        )
+
+    def test_create_mapper_job_xml_hdfs_uri(self):
+        with tempfile.TemporaryDirectory() as app_path:
+            os.makedirs(os.path.join(app_path, "hdfs"))
+            with open(os.path.join(app_path, "hdfs", "job.xml"), "w") as file:
+                file.write(
+                    "<configuration><property><name>pig.tmpfilecompression</name><value>true</value>"
+                    "</property></configuration>"
+                )
+            ET.SubElement(self.pig_node, "job-xml").text = "${nameNode}/user/pig/examples/pig/job.xml"
+
+            mapper = pig_mapper.PigMapper(
+                oozie_node=self.pig_node,
+                name="test_id",
+                params={"nameNode": "hdfs://localhost:8020", "queueName": "myQueue"},
+                input_directory_path=app_path,
+            )
+
+        self.assertEqual("true", mapper.properties["pig.tmpfilecompression"])
+
     def test_to_tasks_and_relations(self):
         params = {"dataproc_cluster": "my-cluster", "gcp_region": "europe-west3", "nameNode": "hdfs://"}
         mapper = self._get_pig_mapper(params=params)
@@ -124,6 +172,7 @@ class TestPigMapper(unittest.TestCase):
                 Task(
                     task_id="test_id",
                     template_name="pig.tpl",
+                    trigger_rule=TriggerRule.ALL_SUCCESS,
                     template_params={
                         "properties": {
                             "mapred.job.queue.name": "${queueName}",
@@ -140,11 +189,27 @@ class TestPigMapper(unittest.TestCase):
         )
         self.assertEqual(relations, [Relation(from_task_id="test_id_prepare", to_task_id="test_id")])
 
+    def test_to_tasks_and_relations_without_prepare_node(self):
+        self.pig_node.remove(self.pig_node.find("prepare"))
+        params = {"dataproc_cluster": "my-cluster", "gcp_region": "europe-west3", "nameNode": "hdfs://"}
+        mapper = self._get_pig_mapper(params=params)
+
+        tasks, relations = mapper.to_tasks_and_relations()
+
+        self.assertEqual(["test_id"], [task.task_id for task in tasks])
+        self.assertEqual([], relations)
+
     def test_first_task_id(self):
         params = {"nameNode": "hdfs://"}
         mapper = self._get_pig_mapper(params=params)
         self.assertEqual(mapper.first_task_id, "test_id_prepare")
 
+    def test_first_task_id_without_prepare_node(self):
+        self.pig_node.remove(self.pig_node.find("prepare"))
+        params = {"nameNode": "hdfs://"}
+        mapper = self._get_pig_mapper(params=params)
+        self.assertEqual(mapper.first_task_id, "test_id")
+
     def test_required_imports(self):
         params = {"nameNode": "hdfs://"}
         mapper = self._get_pig_mapper(params=params)
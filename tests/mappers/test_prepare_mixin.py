@@ -16,6 +16,10 @@
 import unittest
 from xml.etree import ElementTree as ET
 
+from airflow.utils.trigger_rule import TriggerRule
+
+from o2a.converter.relation import Relation
+from o2a.converter.task import Task
 from o2a.mappers import prepare_mixin
 
 
@@ -60,3 +64,59 @@ class TestPrepareMixin(unittest.TestCase):
         pig_node = ET.fromstring(pig_node_str)
         prepare = prepare_mixin.PrepareMixin().get_prepare_command(oozie_node=pig_node, params=params)
         self.assertEqual("", prepare)
+
+    def test_prepend_prepare_task(self):
+        params = {"nameNode": "hdfs://localhost:8020", "dataproc_cluster": "my-cluster", "gcp_region": "eu"}
+        # language=XML
+        pig_node_str = """
+<pig>
+    <prepare>
+        <delete path="${nameNode}/examples/output-data/demo/pig-node" />
+    </prepare>
+</pig>
+"""
+        action_task = Task(task_id="pig_node", template_name="pig.tpl", trigger_rule=TriggerRule.ONE_SUCCESS)
+        mixin = prepare_mixin.PrepareMixin()
+
+        tasks, relations = mixin.prepend_prepare_task(action_task, ET.fromstring(pig_node_str), params)
+
+        self.assertEqual(["pig_node_prepare", "pig_node"], [task.task_id for task in tasks])
+        self.assertEqual(TriggerRule.ONE_SUCCESS, tasks[0].trigger_rule)
+        self.assertEqual(TriggerRule.ALL_SUCCESS, tasks[1].trigger_rule)
+        self.assertEqual([Relation(from_task_id="pig_node_prepare", to_task_id="pig_node")], relations)
+        self.assertEqual(
+            "pig_node_prepare", mixin.get_first_task_id("pig_node", ET.fromstring(pig_node_str), params)
+        )
+
+    def test_prepend_prepare_task_error_path(self):
+        params = {"nameNode": "hdfs://localhost:8020", "dataproc_cluster": "my-cluster", "gcp_region": "eu"}
+        # language=XML
+        pig_node_str = """
+<pig>
+    <prepare>
+        <mkdir path="${nameNode}/examples/input-data/demo/pig-node" />
+    </prepare>
+</pig>
+"""
+        action_task = Task(task_id="pig_node", template_name="pig.tpl", trigger_rule=TriggerRule.ONE_FAILED)
+        mixin = prepare_mixin.PrepareMixin()
+
+        tasks, _ = mixin.prepend_prepare_task(action_task, ET.fromstring(pig_node_str), params)
+
+        # The action must not be run if its prepare task, which is run on the error path, fails
+        self.assertEqual(
+            [("pig_node_prepare", TriggerRule.ONE_FAILED), ("pig_node", TriggerRule.ALL_SUCCESS)],
+            [(task.task_id, task.trigger_rule) for task in tasks],
+        )
+
+    def test_prepend_prepare_task_empty_prepare(self):
+        params = {"nameNode": "hdfs://localhost:8020", "dataproc_cluster": "my-cluster", "gcp_region": "eu"}
+        pig_node = ET.fromstring("<pig><prepare></prepare></pig>")
+        action_task = Task(task_id="pig_node", template_name="pig.tpl")
+        mixin = prepare_mixin.PrepareMixin()
+
+        tasks, relations = mixin.prepend_prepare_task(action_task, pig_node, params)
+
+        self.assertEqual([action_task], tasks)
+        self.assertEqual([], relations)
+        self.assertEqual("pig_node", mixin.get_first_task_id("pig_node", pig_node, params))
@@ -64,6 +64,15 @@ class TestShellMapper(unittest.TestCase):
         self.assertEqual("${queueName}", mapper.properties["mapred.job.queue.name"])
         self.assertEqual("echo arg1 arg2", mapper.bash_command)
 
+    def test_create_mapper_without_configuration(self):
+        self._get_shell_mapper(params=None)
+        self.shell_node.remove(self.shell_node.find("configuration"))
+
+        mapper = self._get_shell_mapper(params=None)
+
+        # The properties of other mappers do not leak into the mapper
+        self.assertEqual({}, mapper.properties)
+
     def test_create_mapper_jinja(self):
         # test jinja templating
         self.shell_node.find("resource-manager").text = "${resourceManager}"
@@ -111,11 +120,56 @@ class TestShellMapper(unittest.TestCase):
                 Task(
                     task_id="test_id",
                     template_name="shell.tpl",
+                    trigger_rule=TriggerRule.ALL_SUCCESS,
                     template_params={"pig_command": "sh 'echo arg1 arg2'"},
                 ),
             ],
         )
         self.assertEqual(relations, [Relation(from_task_id="test_id_prepare", to_task_id="test_id")])
+        self.assertEqual("test_id_prepare", mapper.first_task_id)
+
+    def test_to_tasks_and_relations_without_prepare_node(self):
+        self.shell_node.remove(self.shell_node.find("prepare"))
+        params = {"dataproc_cluster": "my-cluster", "gcp_region": "europe-west3", "nameNode": "hdfs://"}
+        mapper = self._get_shell_mapper(params=params)
+
+        tasks, relations = mapper.to_tasks_and_relations()
+
+        self.assertEqual(
+            tasks,
+            [
+                Task(
+                    task_id="test_id",
+                    template_name="shell.tpl",
+                    template_params={"pig_command": "sh 'echo arg1 arg2'"},
+                )
+            ],
+        )
+        self.assertEqual(relations, [])
+        self.assertEqual("test_id", mapper.first_task_id)
+
+    def test_to_tasks_and_relations_direct_shell(self):
+        self.shell_node.remove(self.shell_node.find("prepare"))
+        mapper = shell_mapper.DirectShellMapper(
+            oozie_node=self.shell_node,
+            name="test_id",
+            trigger_rule=TriggerRule.DUMMY,
+            params={"nameNode": "hdfs://localhost:9020/"},
+        )
+
+        tasks, relations = mapper.to_tasks_and_relations()
+
+        self.assertEqual(
+            tasks,
+            [
+                Task(
+                    task_id="test_id",
+                    template_name="shell.tpl",
+                    template_params={"shell_command": "'echo arg1 arg2'"},
+                )
+            ],
+        )
+        self.assertEqual(relations, [])
 
     def test_required_imports(self):
         params = {"nameNode": "hdfs://localhost:9020/"}
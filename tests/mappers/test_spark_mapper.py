@@ -14,6 +14,8 @@
 # limitations under the License.
 """Tests Spark Mapper"""
 import ast
+import os
+import tempfile
 import unittest
 from xml.etree import ElementTree as ET
 
@@ -117,6 +119,7 @@ class TestSparkMapperWithPrepare(unittest.TestCase):
                 Task(
                     task_id="test_id",
                     template_name="spark.tpl",
+                    trigger_rule=TriggerRule.ALL_SUCCESS,
                     template_params={
                         "main_jar": None,
                         "main_class": "org.apache.spark.examples.mllib.JavaALS",
@@ -210,6 +213,56 @@ class TestSparkMapperWithPrepare(unittest.TestCase):
 
         self.assertEqual(tasks[0].template_params["dataproc_spark_properties"], properties)
 
+    def test_to_tasks_and_relations_job_xml(self):
+        spark_node = ET.fromstring(EXAMPLE_XML_WITHOUT_PREPARE)
+        ET.SubElement(spark_node, "job-xml").text = "${examplesRoot}/job.xml"
+        with tempfile.TemporaryDirectory() as app_path:
+            os.makedirs(os.path.join(app_path, "hdfs", "examples"))
+            with open(os.path.join(app_path, "hdfs", "examples", "job.xml"), "w") as file:
+                file.write(
+                    "<configuration><property><name>mapred.compress.map.output</name><value>false</value>"
+                    "</property><property><name>spark.yarn.queue</name><value>default</value>"
+                    "</property></configuration>"
+                )
+            mapper = spark_mapper.SparkMapper(
+                oozie_node=spark_node, name="test_id", params=EXAMPLE_PARAMS, input_directory_path=app_path
+            )
+            mapper.on_parse_node()
+
+        tasks, _ = mapper.to_tasks_and_relations()
+
+        self.assertEqual(
+            {
+                "mapred.compress.map.output": "true",
+                "spark.yarn.queue": "default",
+                "spark.executor.extraJavaOptions": "-XX:+HeapDumpOnOutOfMemoryError -XX:HeapDumpPath=/tmp",
+            },
+            tasks[0].template_params["dataproc_spark_properties"],
+        )
+
+    def test_to_tasks_and_relations_job_xml_missing(self):
+        spark_node = ET.fromstring(EXAMPLE_XML_WITHOUT_PREPARE)
+        ET.SubElement(spark_node, "job-xml").text = "/user/test/missing.xml"
+        with tempfile.TemporaryDirectory() as app_path:
+            mapper = spark_mapper.SparkMapper(
+                oozie_node=spark_node, name="test_id", params=EXAMPLE_PARAMS, input_directory_path=app_path
+            )
+            with self.assertLogs(level="WARNING") as logs:
+                mapper.on_parse_node()
+
+        tasks, _ = mapper.to_tasks_and_relations()
+
+        self.assertIn(
+            "The job-xml file /user/test/missing.xml of the action test_id is not found", logs.output[0]
+        )
+        self.assertEqual(
+            {
+                "mapred.compress.map.output": "true",
+                "spark.executor.extraJavaOptions": "-XX:+HeapDumpOnOutOfMemoryError -XX:HeapDumpPath=/tmp",
+            },
+            tasks[0].template_params["dataproc_spark_properties"],
+        )
+
     def test_required_imports(self):
         spark_node = ET.fromstring(EXAMPLE_XML_WITHOUT_PREPARE)
         mapper = self._get_spark_mapper(spark_node)
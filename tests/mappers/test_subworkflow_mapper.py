@@ -105,6 +105,15 @@ class TestSubworkflowMapper(TestCase):
         self.assertEqual({}, mapper.get_config_properties())
         self.assertTrue(os.path.isfile(self.SUBDAG_TEST_FILEPATH))
 
+    @mock.patch("o2a.mappers.subworkflow_mapper.OozieConverter")
+    @mock.patch("o2a.utils.el_utils.parse_els")
+    def test_create_mapper_app_next_to_parent_app(self, parse_els_mock, converter_mock):
+        parse_els_mock.return_value = self.subworkflow_params
+
+        self._get_subwf_mapper(input_directory_path="/apps/subwf")
+
+        self.assertEqual("/apps/pig", converter_mock.call_args[1]["input_directory_path"])
+
     @mock.patch("o2a.utils.el_utils.parse_els")
     def test_to_tasks_and_relations(self, parse_els_mock):
         # Given
@@ -125,9 +134,9 @@ class TestSubworkflowMapper(TestCase):
         imp_str = "\n".join(imps)
         ast.parse(imp_str)
 
-    def _get_subwf_mapper(self):
+    def _get_subwf_mapper(self, input_directory_path=EXAMPLE_SUBWORKFLOW_PATH):
         return subworkflow_mapper.SubworkflowMapper(
-            input_directory_path=EXAMPLE_SUBWORKFLOW_PATH,
+            input_directory_path=input_directory_path,
             output_directory_path="/tmp",
             oozie_node=self.subworkflow_node,
             name="test_id",
@@ -17,7 +17,19 @@ import unittest
 
 from parameterized import parameterized
 
-from o2a.o2a_libs.el_basic_functions import first_not_null, concat, replace_all, append_all, trim, url_encode
+from o2a.o2a_libs import el_basic_functions
+from o2a.o2a_libs.el_basic_functions import (
+    first_not_null,
+    concat,
+    replace_all,
+    append_all,
+    trim,
+    url_encode,
+    timestamp,
+    to_json_str,
+    translate_java_regex,
+    translate_java_replacement,
+)
 
 
 class TestElBasicFunctions(unittest.TestCase):
@@ -55,11 +67,61 @@ class TestElBasicFunctions(unittest.TestCase):
             ("foobar", "bar", "", "foo"),
             ("foobar", "bar", None, "foo"),
             ("foobar", "[o]", "a", "faabar"),
+            ("foobar", "(?<x>o+)b", "[${x}]", "f[oo]ar"),
+            ("foobar", "(o)(b)", "$2$1", "foboar"),
+            ("a.b.c", r"\Q.\E", r"\$", "a$b$c"),
+            ("C:\\tmp", r"\\", "/", "C:/tmp"),
+            ("abc", "(a)(b)(c)", "$11$3", "a1c"),
         ]
     )
     def test_replace_all(self, src_str, regex, replacement, expected):
         self.assertEqual(expected, replace_all(src_str, regex, replacement))
 
+    def test_replace_all_cache(self):
+        el_basic_functions._compile_java_regex.cache_clear()
+
+        replace_all("foobar", "o+", "0")
+        replace_all("boo", "o+", "0")
+
+        self.assertEqual(1, el_basic_functions._compile_java_regex.cache_info().hits)
+
+    @parameterized.expand(
+        [
+            ("a(b)c", "a(b)c"),
+            (r"(?<name>a)\k<name>", r"(?P<name>a)(?P=name)"),
+            (r"(?<=a)(?<!b)", r"(?<=a)(?<!b)"),
+            (r"\Qa.b\E.", r"a\.b."),
+            (r"\Qa.b", r"a\.b"),
+            (r"\p{Alpha}\P{Digit}\p{IsLower}", r"[a-zA-Z][^0-9][a-z]"),
+            (r"[\p{Digit}_]", r"[0-9_]"),
+            (r"\p{L}", r"\p{L}"),
+            (r"a\z", r"a\Z"),
+            (r"a\Z", r"a(?=\n?\Z)"),
+            (r"\e[\e]", r"\x1B[\x1B]"),
+            (r"[]\]]\\", r"[]\]]\\"),
+            (r"[^]\\(]", r"[^]\\(]"),
+        ]
+    )
+    def test_translate_java_regex(self, regex, expected):
+        self.assertEqual(expected, translate_java_regex(regex))
+
+    @parameterized.expand(
+        [
+            ("a$1b", 1, r"a\g<1>b"),
+            ("$12", 12, r"\g<12>"),
+            ("$12", 1, r"\g<1>2"),
+            ("${name}", 1, r"\g<name>"),
+            (r"\$1\\", 1, r"$1\\"),
+        ]
+    )
+    def test_translate_java_replacement(self, replacement, groups, expected):
+        self.assertEqual(expected, translate_java_replacement(replacement, groups))
+
+    @parameterized.expand([("a\\",), ("$a",), ("${name",)])
+    def test_translate_java_replacement_invalid(self, replacement):
+        with self.assertRaises(ValueError):
+            translate_java_replacement(replacement, 1)
+
     @parameterized.expand(
         [
             ("/a/b/,/c/b/,/c/d/", "ADD", ",", "/a/b/ADD,/c/b/ADD,/c/d/ADD"),
@@ -79,3 +141,9 @@ class TestElBasicFunctions(unittest.TestCase):
     @parameterized.expand([(" ", "%20"), ("?", "%3F"), ("", ""), (None, "")])
     def test_urlencode(self, src_str, expected):
         self.assertEqual(expected, url_encode(src_str))
+
+    def test_timestamp(self):
+        self.assertRegex(timestamp(), r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+\+00:00$")
+
+    def test_to_json_str(self):
+        self.assertEqual('{"a": [1, "b"]}', to_json_str({"a": [1, "b"]}))
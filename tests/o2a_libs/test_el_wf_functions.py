@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the WF EL functions"""
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+from airflow.utils.state import State
+from jinja2 import Template
+from parameterized import parameterized
+
+from o2a.o2a_libs import el_wf_functions
+from o2a.o2a_libs.el_wf_functions import WF_MACROS, WorkflowState, get_workflow_state, parse_properties
+
+WORKFLOW_STATE = WorkflowState(
+    states={"a": State.FAILED, "b": State.FAILED, "c": State.SUCCESS, "d": State.SKIPPED, "e": None},
+    end_dates={"a": datetime(2019, 1, 1, 12), "b": datetime(2019, 1, 1, 11), "c": None, "d": None, "e": None},
+    xcoms={
+        "a": {"error_code": "JA018", "error_message": "Failed", "return_value": "key=value"},
+        "c": {"error_message": "Not an error", "return_value": {"key": "value"}},
+    },
+)
+
+
+class TaskInstanceStub(SimpleNamespace):
+    """Task instance, which can be weakly referenced"""
+
+    __hash__ = object.__hash__
+
+
+class TestElWfFunctions(unittest.TestCase):
+    def setUp(self):
+        dag = mock.Mock()
+        dag.get_task.side_effect = lambda task_id: SimpleNamespace(
+            downstream_task_ids={"a": {"e", "c"}, "c": {"d"}}.get(task_id, set())
+        )
+        self.ti = TaskInstanceStub(task=SimpleNamespace(dag=dag), try_number=2)
+        self.dag_run = SimpleNamespace(conf={"key": "value"})
+        patcher = mock.patch("o2a.o2a_libs.el_wf_functions.fetch_workflow_state", return_value=WORKFLOW_STATE)
+        self.fetch_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def render(self, template: str) -> str:
+        return Template(template).render(ti=self.ti, dag_run=self.dag_run, **WF_MACROS)
+
+    @parameterized.expand(
+        [
+            (el_wf_functions.wf_conf("key"), "value"),
+            (el_wf_functions.wf_conf("missing"), ""),
+            (el_wf_functions.wf_run(), "1"),
+            (el_wf_functions.wf_last_error_node(), "a"),
+            (el_wf_functions.wf_error_code("a"), "JA018"),
+            (el_wf_functions.wf_error_code("b"), ""),
+            (el_wf_functions.wf_error_message("a"), "Failed"),
+            (el_wf_functions.wf_error_message("c"), ""),
+            (el_wf_functions.wf_transition("a"), "c"),
+            (el_wf_functions.wf_transition("c"), ""),
+            (el_wf_functions.wf_transition("e"), ""),
+            (el_wf_functions.wf_action_data("a"), "{'key': 'value'}"),
+            (el_wf_functions.wf_action_data("c"), "{'key': 'value'}"),
+            (el_wf_functions.wf_action_data("b"), "{}"),
+        ]
+    )
+    def test_render(self, template, expected):
+        self.assertEqual(expected, self.render(template))
+
+    def test_node_names(self):
+        self.assertEqual('{{ wf.error_code(ti, "my_node") }}', el_wf_functions.wf_error_code("my-node"))
+
+    def test_conf_no_dag_run(self):
+        self.dag_run = None
+
+        self.assertEqual("", self.render(el_wf_functions.wf_conf("key")))
+
+    def test_last_error_node_no_errors(self):
+        self.fetch_mock.return_value = WorkflowState({"a": State.SUCCESS}, {"a": None}, {})
+
+        self.assertEqual("", self.render(el_wf_functions.wf_last_error_node()))
+
+    def test_single_fetch_per_task_instance(self):
+        self.render(
+            " ".join(
+                [
+                    el_wf_functions.wf_last_error_node(),
+                    el_wf_functions.wf_error_message("a"),
+                    el_wf_functions.wf_transition("a"),
+                ]
+            )
+        )
+        self.render(el_wf_functions.wf_error_code("a"))
+        self.assertEqual(1, self.fetch_mock.call_count)
+
+        other_ti = TaskInstanceStub()
+        get_workflow_state(other_ti)
+        self.assertEqual(2, self.fetch_mock.call_count)
+
+    def test_star_import_exports_only_el_functions(self):
+        namespace = {"datetime": mock.sentinel.datetime}
+        exec("from o2a.o2a_libs.el_wf_functions import *", namespace)  # pylint: disable=exec-used
+
+        self.assertIs(mock.sentinel.datetime, namespace["datetime"])
+        self.assertIs(WF_MACROS, namespace["WF_MACROS"])
+        self.assertIs(el_wf_functions.wf_conf, namespace["wf_conf"])
+        self.assertNotIn("TaskInstance", namespace)
+
+    def test_parse_properties(self):
+        self.assertEqual(
+            {"a": "1", "b": "2=3", "c": "4", "d": ""},
+            parse_properties("# comment\n! comment\na=1\n b = 2=3\nc:4\n\nd"),
+        )
+
+
+class TestFetchWorkflowState(unittest.TestCase):
+    def test_fetch_workflow_state(self):
+        ti_a = SimpleNamespace(task_id="a", state=State.FAILED, end_date=datetime(2019, 1, 1))
+        ti_b = SimpleNamespace(task_id="b", state=State.RUNNING, end_date=None)
+        session = mock.Mock()
+        query = session.query.return_value.outerjoin.return_value.filter.return_value
+        query.all.return_value = [
+            (ti_a, SimpleNamespace(key="error_code", value="JA018")),
+            (ti_a, SimpleNamespace(key="error_message", value="Failed")),
+            (ti_b, None),
+        ]
+
+        state = el_wf_functions.fetch_workflow_state(
+            SimpleNamespace(dag_id="dag", run_id="run", execution_date=datetime(2019, 1, 1)), session=session
+        )
+
+        session.query.assert_called_once()
+        self.assertEqual({"a": State.FAILED, "b": State.RUNNING}, state.states)
+        self.assertEqual({"a": datetime(2019, 1, 1), "b": None}, state.end_dates)
+        self.assertEqual({"a": {"error_code": "JA018", "error_message": "Failed"}}, state.xcoms)
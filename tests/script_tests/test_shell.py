@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for shell action script
+
+Replaces the "gcloud" external app with a "mock" script, see test_git.py for details.
+"""
+
+import shutil
+import tempfile
+from os import environ, path
+
+from parameterized import parameterized
+
+from test_git import ShellScriptTestCase, mock_app
+
+SHELL_SH_FILE = path.abspath(
+    path.join(path.dirname(__file__), path.pardir, path.pardir, "scripts", "shell.sh")
+)
+
+
+class ShellTestCase(ShellScriptTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = tempfile.mkdtemp(prefix="o2a-cache")
+        environ["O2A_CACHE_DIR"] = self.cache_dir
+
+    def tearDown(self):
+        super().tearDown()
+        shutil.rmtree(self.cache_dir)
+        del environ["O2A_CACHE_DIR"]
+
+    def test_success_execution(self):
+        with mock_app("gcloud"):
+            return_code = self.run_bash_command(
+                f"{SHELL_SH_FILE} --command 'echo \"A B\"' --region REGION --cluster CLUSTER"
+            )
+
+        self.assertEqual(return_code, 0)
+
+        list_of_command = self.get_command_calls()
+
+        self.assertEqual(len(list_of_command), 2)
+        self.assertTrue(
+            list_of_command[0].startswith("gcloud dataproc clusters describe CLUSTER --region=REGION")
+        )
+        self.assertTrue(list_of_command[1].startswith("gcloud compute ssh CLUSTER-m --ssh-flag="))
+        self.assertIn("ControlMaster=auto", list_of_command[1])
+        self.assertIn(f"ControlPath={self.cache_dir}/ssh-%C", list_of_command[1])
+        self.assertIn('--command=echo\\ \\"A\\ B\\"', list_of_command[1])
+
+    def test_success_execution_with_cached_master_node(self):
+        with open(path.join(self.cache_dir, "dataproc-REGION-CLUSTER"), "w") as file:
+            file.write("master-node\tzone-a\n")
+
+        with mock_app("gcloud"):
+            return_code = self.run_bash_command(
+                f"{SHELL_SH_FILE} --command ls --region REGION --cluster CLUSTER --internal-ip"
+            )
+
+        self.assertEqual(return_code, 0)
+
+        list_of_command = self.get_command_calls()
+
+        self.assertEqual(len(list_of_command), 1)
+        self.assertTrue(
+            list_of_command[0].startswith(
+                "gcloud compute ssh master-node --zone=zone-a --internal-ip --ssh-flag="
+            )
+        )
+
+    @parameterized.expand(
+        [
+            f"bash {SHELL_SH_FILE} --region REGION --cluster CLUSTER",
+            f"bash {SHELL_SH_FILE} --command ls --cluster CLUSTER",
+            f"bash {SHELL_SH_FILE} --command ls --region REGION",
+        ]
+    )
+    def test_required_parameters(self, command):
+        with mock_app("gcloud"):
+            return_code = self.run_bash_command(command)
+
+        self.assertEqual(return_code, 1)
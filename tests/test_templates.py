@@ -184,6 +184,26 @@ class DummyTemplateTestCase(TestCase, TemplateTestMixin):
         res = render_template(self.TEMPLATE_NAME, **self.DEFAULT_TEMPLATE_PARAMS)
         self.assertValidPython(res)
 
+    def test_priority_weight_and_pool(self):
+        template_params = {
+            **self.DEFAULT_TEMPLATE_PARAMS,
+            **dict(priority_weight=120, weight_rule="absolute", pool="o2a_pig"),
+        }
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+        self.assertIn("priority_weight=120", res)
+        self.assertIn('weight_rule="absolute"', res)
+        self.assertIn('pool="o2a_pig"', res)
+
+    def test_no_pool(self):
+        template_params = {
+            **self.DEFAULT_TEMPLATE_PARAMS,
+            **dict(priority_weight=1, weight_rule="absolute", pool=None),
+        }
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+        self.assertNotIn("pool=", res)
+
 
 class FsOpTempalteTestCase(TestCase, TemplateTestMixin):
     TEMPLATE_NAME = "fs_op.tpl"
@@ -314,6 +334,24 @@ class ShellTemplateTestCase(TestCase, TemplateTestMixin):
         self.assertValidPython(res)
 
 
+class DirectShellTemplateTestCase(TestCase, TemplateTestMixin):
+    TEMPLATE_NAME = "shell.tpl"
+
+    DEFAULT_TEMPLATE_PARAMS = {"task_id": "AAA", "shell_command": "'echo AAA'", "trigger_rule": "dummy"}
+
+    def test_green_path(self):
+        res = render_template(self.TEMPLATE_NAME, **self.DEFAULT_TEMPLATE_PARAMS)
+        self.assertValidPython(res)
+        self.assertIn("$DAGS_FOLDER/../data/shell.sh", res)
+        self.assertNotIn("pig", res)
+
+    @parameterized.expand([({"shell_command": 'A"'},), ({"shell_command": "'{{ AAA }}'"},)])
+    def test_escape_character(self, mutation):
+        template_params = mutate(self.DEFAULT_TEMPLATE_PARAMS, mutation)
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+
+
 class SparkTemplateTestCase(TestCase, TemplateTestMixin):
     TEMPLATE_NAME = "spark.tpl"
 
@@ -440,6 +478,13 @@ class WorkflowTemplateTestCase(TestCase, TemplateTestMixin):
         res = render_template(self.TEMPLATE_NAME, **self.DEFAULT_TEMPLATE_PARAMS)
         self.assertValidPython(res)
 
+    def test_concurrency(self):
+        template_params = {**self.DEFAULT_TEMPLATE_PARAMS, **dict(concurrency=8, max_active_runs=2)}
+        res = render_template(self.TEMPLATE_NAME, **template_params)
+        self.assertValidPython(res)
+        self.assertIn("concurrency=8,", res)
+        self.assertIn("max_active_runs=2,", res)
+
 
 class SubWorkflowTemplateTestCase(TestCase, TemplateTestMixin):
     TEMPLATE_NAME = "subworkflow.tpl"
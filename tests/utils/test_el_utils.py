@@ -121,6 +121,64 @@ class TestELUtils(unittest.TestCase):
         expected = 'concat("ab", "de")'
         self.assertEqual(expected, el_utils.convert_el_to_jinja(el_function, quote=True))
 
+    def test_convert_el_to_jinja_wf_func(self):
+        el_function = "${wf:errorCode('my-node')}"
+        expected = "wf_error_code('my-node')"
+        self.assertEqual(expected, el_utils.convert_el_to_jinja(el_function, quote=True))
+
+    def test_convert_el_to_jinja_wf_func_not_supported(self):
+        el_function = "${wf:group()}"
+        expected = "'${wf:group()}'"
+        with self.assertLogs(level="WARNING") as logs:
+            self.assertEqual(expected, el_utils.convert_el_to_jinja(el_function, quote=True))
+        self.assertIn("wf:group EL function not supported", logs.output[0])
+
+    def test_convert_el_to_jinja_wf_func_with_text_around(self):
+        el_function = "echo ${wf:id()} done"
+        expected = "echo {{ run_id }} done"
+        self.assertEqual(expected, el_utils.convert_el_to_jinja(el_function, quote=False))
+
+    def test_convert_el_to_jinja_wf_funcs_and_vars_in_text(self):
+        el_function = '${wf:conf("x")} and ${y} from ${wf:errorCode("my-node")}'
+        expected = (
+            '\'{{ wf.conf(dag_run, "x") }} and {{ params.y }} from {{ wf.error_code(ti, "my_node") }}\''
+        )
+        self.assertEqual(expected, el_utils.convert_el_to_jinja(el_function, quote=True))
+
+    def test_convert_el_to_jinja_basic_func_in_text(self):
+        el_function = "'${concat(\"ls \", \"-l\")}' ${trim(' x ')}"
+        expected = "'ls -l' x"
+        self.assertEqual(expected, el_utils.convert_el_to_jinja(el_function, quote=False))
+
+    def test_convert_el_to_jinja_funcs_and_vars_with_text_around(self):
+        el_function = "${user}: ${wf:group()} ${concat('a', 'b')}"
+        expected = "'{{ params.user }}: ${wf:group()} ab'"
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(expected, el_utils.convert_el_to_jinja(el_function, quote=True))
+
+    @parameterized.expand(
+        [
+            ("Message: ${wf:errorMessage(wf:lastErrorNode())}", "are not constants"),
+            ("Time: ${timestamp()}", "not supported in a text"),
+            ("Text: ${concat('a')}", "Cannot evaluate"),
+        ]
+    )
+    def test_convert_el_to_jinja_func_in_text_not_evaluated(self, el_function, message):
+        with self.assertLogs(level="WARNING") as logs:
+            self.assertEqual(el_function, el_utils.convert_el_to_jinja(el_function, quote=False))
+        self.assertIn(message, logs.output[0])
+
+    def test_convert_el_to_jinja_nested_func(self):
+        el_function = "${wf:errorMessage(wf:lastErrorNode())}"
+        expected = "wf_error_message(wf_last_error_node())"
+        self.assertEqual(expected, el_utils.convert_el_to_jinja(el_function, quote=True))
+
+    def test_convert_el_to_jinja_nested_func_not_supported(self):
+        el_function = "Path: ${concat(wf:appPath(), '/lib')}"
+        expected = "Path: ${concat(wf:appPath(), '/lib')}"
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(expected, el_utils.convert_el_to_jinja(el_function, quote=False))
+
     def test_convert_el_to_jinja_no_change_no_quote(self):
         el_function = "no_el_here"
         expected = "no_el_here"
@@ -47,6 +47,20 @@ class TestELUtils(unittest.TestCase):
         with self.assertRaises(xml_utils.MultipleNodeFoundException):
             xml_utils.find_node_by_name(element_tree.getroot(), "test_attrib")
 
+    def test_find_node_by_name_index(self):
+        doc = ET.Element("outer")
+        node = ET.SubElement(doc, "inner_tag", attrib={"name": "test_attrib"})
+        ET.SubElement(doc, "other_inner_tag", attrib={"name": "other_attrib"})
+        ET.SubElement(doc, "other_inner_tag", attrib={"name": "other_attrib"})
+        ET.SubElement(node, "in_inner_tag", attrib={"name": "out_of_scope"})
+        index = xml_utils.index_nodes_by_attribute(doc, "name")
+
+        self.assertEqual(node, xml_utils.find_node_by_name(doc, "test_attrib", index=index))
+        with self.assertRaises(xml_utils.NoNodeFoundException):
+            xml_utils.find_node_by_name(doc, "out_of_scope", index=index)
+        with self.assertRaises(xml_utils.MultipleNodeFoundException):
+            xml_utils.find_node_by_name(doc, "other_attrib", index=index)
+
     def test_find_nodes_by_tag(self):
         doc = ET.Element("outer")
         node = ET.SubElement(doc, "tag1")